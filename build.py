@@ -17,6 +17,11 @@ def build():
     if dist_dir.exists(): shutil.rmtree(dist_dir)
     if build_dir.exists(): shutil.rmtree(build_dir)
     
+    # Precompile the disc catalog so the bundle starts without parsing JSON
+    from src.repositories.compiled_catalog import compile_catalog
+    count = compile_catalog(base_dir / "data" / "discs.json", base_dir / "data" / "discs.bin")
+    print(f"📦 Compiled {count} discs into data/discs.bin")
+    
     # PyInstaller command
     # Using venv python -m PyInstaller ensures we use the correct env
     python_exe = base_dir / "venv" / "Scripts" / "python.exe"
@@ -1,21 +1,58 @@
-from typing import Dict
-from pathlib import Path
+import logging
+import time
+import tkinter as tk
+from dataclasses import astuple
+from tkinter import messagebox
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
 import customtkinter as ctk
 
-from src.services.collection_service import CollectionService
+from src.services.async_collection_service import AsyncCollectionService
+from src.services.icon_fetcher import FetchResult
 from src.services.image_loader import ImageLoader
-from src.gui.components.disc_card import DiscCard
+from src.services.memory_diagnostics import MemoryDiagnostics, deep_sizeof
+from src.gui.components.disc_grid import DiscGrid
+from src.gui.components.canvas_disc_grid import CanvasDiscGrid
 from src.gui.components.add_disc_dialog import AddDiscDialog
-from src.services.collection_service import DiscWithStatus
+from src.gui.components.history_chart import HistoryChart
+from src.gui.components.completion_panel import CompletionPanel
+from src.gui.layout import DEFAULT_ZOOM, ZOOM_LEVELS
+from src.gui.search_cache import SearchCache
+from src.gui.tk_dispatcher import TkDispatcher
+from src.models.disc import Disc
+from src.services.collection_service import DiscWithStatus, ExternalChanges
+from src.gui.theme import (
+    APP_ICON_PATH,
+    GEIST_BG,
+    GEIST_CARD,
+    GEIST_BORDER,
+    GEIST_TEXT,
+    GEIST_TEXT_SECONDARY,
+    GEIST_ACCENT,
+    resources,
+)
 
 
-# Geist-like Design System Colors
-GEIST_BG = "#000000"
-GEIST_CARD = "#111111"
-GEIST_BORDER = "#333333"
-GEIST_TEXT = "#EDEDED"
-GEIST_TEXT_SECONDARY = "#888888"
-GEIST_ACCENT = "#FFFFFF"
+logger = logging.getLogger(__name__)
+
+# Grid renderers selectable at startup
+GRID_RENDERERS = {
+    "widgets": DiscGrid,
+    "canvas": CanvasDiscGrid,
+}
+
+# Progressive startup: build cards in slices of at most this long per frame
+CARD_BUILD_BUDGET_MS = 12
+CARD_BUILD_INTERVAL_MS = 1
+# Icons decoded in the background while the first cards are built
+PREDECODE_ICONS = 200
+
+# Searches over more candidates than this are filtered in chunks across
+# event loop ticks, so typing stays responsive and can cancel them
+SEARCH_CHUNK_SIZE = 2000
+SEARCH_CHUNK_INTERVAL_MS = 1
+
+# How often to check the data folder for edits made by other processes
+EXTERNAL_SYNC_MS = 2000
 
 
 class App(ctk.CTk):
@@ -23,20 +60,50 @@ class App(ctk.CTk):
     
     def __init__(
         self,
-        collection_service: CollectionService,
-        image_loader: ImageLoader
+        collection_service: AsyncCollectionService,
+        image_loader: ImageLoader,
+        renderer: str = "widgets",
+        progressive: bool = True,
+        memory_diagnostics: Optional[MemoryDiagnostics] = None,
+        zoom: str = DEFAULT_ZOOM
     ):
         super().__init__()
         
         self._service = collection_service
         self._image_loader = image_loader
-        self._disc_cards: Dict[str, DiscCard] = {}
+        self._grid_class = GRID_RENDERERS[renderer]
+        self._progressive = progressive
+        self._memory_diagnostics = memory_diagnostics
+        # Measured on the worker just before each memory report
+        self._collection_footprint: Tuple[int, int] = (0, 0)
+        self._zoom = zoom
         self._all_discs: list = []
+        self._discs_by_id: Dict[str, DiscWithStatus] = {}
+        self._visible_ids: List[str] = []
+        self._selected_ids: Set[str] = set()
+        self._selection_anchor: Optional[str] = None
         self._search_after_id = None
+        self._search_cache = SearchCache()
+        self._filter_after_id = None
+        # Cards not built yet during progressive startup, in catalog order
+        self._unbuilt: Dict[str, DiscWithStatus] = {}
+        self._build_cursor = 0
+        self._build_after_id = None
+        self._sync_after_id = None
+        self._error_showing = False
+        # Service calls run on a worker; results come back through here
+        self._dispatcher = TkDispatcher(self)
+        resources.use_image_loader(image_loader, self._dispatcher)
+        self._dispatcher.then(collection_service.ready, lambda _: None, on_error=self._on_startup_error)
         
         self._setup_window()
         self._setup_ui()
         self._load_images()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        
+        if memory_diagnostics:
+            self._register_memory_probes(memory_diagnostics)
+            self.bind("<F12>", self._print_memory_report)
     
     def _setup_window(self) -> None:
         """Configure the main window."""
@@ -44,9 +111,8 @@ class App(ctk.CTk):
         self.geometry("900x650")
         self.minsize(700, 500)
         
-        icon_path = Path(__file__).parent.parent.parent / "data" / "app-icon" / "icon.ico"
-        if icon_path.exists():
-            self.iconbitmap(str(icon_path))
+        if APP_ICON_PATH.exists():
+            self.iconbitmap(str(APP_ICON_PATH))
         
         ctk.set_appearance_mode("dark")
         self.configure(fg_color=GEIST_BG)
@@ -77,7 +143,7 @@ class App(ctk.CTk):
         title = ctk.CTkLabel(
             header_frame,
             text="Music Disc Tracker",
-            font=ctk.CTkFont(family="Segoe UI", size=18, weight="bold"),
+            font=resources.font("title"),
             text_color=GEIST_TEXT
         )
         title.grid(row=0, column=0, padx=24, pady=20, sticky="w")
@@ -93,10 +159,42 @@ class App(ctk.CTk):
             border_width=1,
             border_color=GEIST_BORDER,
             text_color=GEIST_TEXT,
-            font=ctk.CTkFont(size=13),
+            font=resources.font("body"),
             command=self._show_add_disc_dialog
         )
-        add_btn.grid(row=0, column=1, padx=24, pady=20, sticky="e")
+        add_btn.grid(row=0, column=3, padx=(8, 24), pady=20, sticky="e")
+        
+        history_btn = ctk.CTkButton(
+            header_frame,
+            text="History",
+            width=100,
+            height=32,
+            corner_radius=6,
+            fg_color="transparent",
+            hover_color=GEIST_CARD,
+            border_width=1,
+            border_color=GEIST_BORDER,
+            text_color=GEIST_TEXT,
+            font=resources.font("body"),
+            command=self._toggle_history_chart
+        )
+        history_btn.grid(row=0, column=2, padx=0, pady=20, sticky="e")
+        
+        stats_btn = ctk.CTkButton(
+            header_frame,
+            text="Stats",
+            width=100,
+            height=32,
+            corner_radius=6,
+            fg_color="transparent",
+            hover_color=GEIST_CARD,
+            border_width=1,
+            border_color=GEIST_BORDER,
+            text_color=GEIST_TEXT,
+            font=resources.font("body"),
+            command=self._toggle_completion_panel
+        )
+        stats_btn.grid(row=0, column=1, padx=(0, 8), pady=20, sticky="e")
     
     def _create_search_bar(self) -> None:
         """Create the search bar."""
@@ -112,10 +210,60 @@ class App(ctk.CTk):
             border_color=GEIST_BORDER,
             text_color=GEIST_TEXT,
             placeholder_text_color=GEIST_TEXT_SECONDARY,
-            font=ctk.CTkFont(size=13)
+            font=resources.font("body")
         )
         self.search_entry.grid(row=0, column=0, sticky="ew")
         self.search_entry.bind("<KeyRelease>", self._on_search_keyrelease)
+        self.bind("<Escape>", lambda event: self._clear_selection())
+        
+        self._create_selection_bar(search_frame)
+    
+    def _create_selection_bar(self, parent) -> None:
+        """Create the multi-select actions next to the search bar."""
+        self.selection_label = ctk.CTkLabel(
+            parent,
+            text="",
+            font=resources.font("label"),
+            text_color=GEIST_TEXT_SECONDARY
+        )
+        self.selection_label.grid(row=0, column=1, padx=(12, 4))
+        
+        actions = [
+            ("Select Visible", self._select_all_visible),
+            ("Mark Owned", lambda: self._set_selection_owned(True)),
+            ("Mark Missing", lambda: self._set_selection_owned(False)),
+            ("Clear", self._clear_selection),
+        ]
+        for col, (text, command) in enumerate(actions, start=2):
+            ctk.CTkButton(
+                parent,
+                text=text,
+                width=90,
+                height=36,
+                corner_radius=6,
+                fg_color="transparent",
+                hover_color=GEIST_CARD,
+                border_width=1,
+                border_color=GEIST_BORDER,
+                text_color=GEIST_TEXT,
+                font=resources.font("label"),
+                command=command
+            ).grid(row=0, column=col, padx=(4, 0))
+        
+        # Card size; labels are the capitalized zoom level names
+        zoom_control = ctk.CTkSegmentedButton(
+            parent,
+            values=[name.capitalize() for name in ZOOM_LEVELS],
+            height=36,
+            fg_color=GEIST_CARD,
+            selected_color=GEIST_BORDER,
+            unselected_color=GEIST_CARD,
+            text_color=GEIST_TEXT,
+            font=resources.font("label"),
+            command=lambda label: self._set_zoom(label.lower())
+        )
+        zoom_control.set(self._zoom.capitalize())
+        zoom_control.grid(row=0, column=col + 1, padx=(12, 0))
     
     def _create_progress_section(self) -> None:
         """Create the progress bar section."""
@@ -126,7 +274,7 @@ class App(ctk.CTk):
         self.progress_label = ctk.CTkLabel(
             progress_frame,
             text="0/0",
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=resources.font("body_bold"),
             text_color=GEIST_TEXT
         )
         self.progress_label.grid(row=0, column=0, padx=(0, 16))
@@ -144,72 +292,206 @@ class App(ctk.CTk):
         self.percentage_label = ctk.CTkLabel(
             progress_frame,
             text="0%",
-            font=ctk.CTkFont(size=13),
+            font=resources.font("body"),
             text_color=GEIST_TEXT_SECONDARY
         )
         self.percentage_label.grid(row=0, column=2, padx=(16, 0))
+        
+        # Weekly history chart and completion breakdown, hidden until toggled from the header
+        self.history_chart = HistoryChart(progress_frame)
+        self.completion_panel = CompletionPanel(progress_frame)
+    
+    def _toggle_history_chart(self) -> None:
+        """Show or hide the weekly progress chart."""
+        if self.history_chart.winfo_ismapped():
+            self.history_chart.grid_forget()
+            return
+        
+        self.history_chart.grid(row=1, column=0, columnspan=3, pady=(12, 0), sticky="ew")
+        self._dispatcher.then(
+            self._service.get_weekly_progress(),
+            self.history_chart.set_series,
+            on_error=self._task_error("load the weekly progress")
+        )
+    
+    def _toggle_completion_panel(self) -> None:
+        """Show or hide completion per artist and obtain source."""
+        if self.completion_panel.winfo_ismapped():
+            self.completion_panel.grid_forget()
+            return
+        
+        self.completion_panel.grid(row=2, column=0, columnspan=3, pady=(12, 0), sticky="ew")
+        self._dispatcher.then(
+            self._service.get_completion_breakdown(),
+            self.completion_panel.set_breakdown,
+            on_error=self._task_error("load the completion breakdown")
+        )
     
     def _create_disc_grid(self) -> None:
         """Create the scrollable disc grid."""
-        self.scroll_frame = ctk.CTkScrollableFrame(
+        self.disc_grid = self._grid_class(
             self,
-            fg_color="transparent",
-            corner_radius=0,
-            scrollbar_button_color=GEIST_BORDER,
-            scrollbar_button_hover_color=GEIST_TEXT_SECONDARY
+            self._image_loader,
+            on_toggle=self._on_disc_toggle,
+            on_select=self._on_disc_select,
+            on_delete=self._on_disc_delete
         )
-        self.scroll_frame.grid(row=3, column=0, padx=24, pady=(0, 24), sticky="nsew")
-        
-        for i in range(5):
-            self.scroll_frame.grid_columnconfigure(i, weight=1, uniform="disc")
+        self.disc_grid.grid(row=3, column=0, padx=24, pady=(0, 24), sticky="nsew")
+        self.disc_grid.set_zoom(ZOOM_LEVELS[self._zoom])
         
-        self._all_discs = self._service.get_all_discs_with_status()
+        if self._progressive:
+            # Load off the Tk thread, then build cards in time slices
+            self._dispatcher.then(
+                self._service.get_all_discs_with_status(),
+                self._on_discs_loaded,
+                on_error=self._task_error("load the disc list")
+            )
+            return
         
         # Create all cards once
+        try:
+            self._all_discs = self._service.get_all_discs_with_status().result()
+        except Exception as error:
+            # Report it from the event loop like a failed progressive load; a
+            # service that failed to start is already reported by the ready handler
+            if self._service.ready.exception() is None:
+                self.after_idle(self._on_startup_error, error)
+            return
+        self._reindex_discs()
         for disc_status in self._all_discs:
-            image_path = self._image_loader.get_image_path(
-                disc_status.disc.id,
-                disc_status.disc.image_url
-            )
-            
-            card = DiscCard(
-                self.scroll_frame,
-                disc_status,
-                image_path,
-                on_toggle=self._on_disc_toggle,
-                on_delete=self._on_disc_delete
-            )
-            self._disc_cards[disc_status.disc.id] = card
+            self._add_card(disc_status)
         
         # Initial layout
         self._layout_visible_cards()
+        self._schedule_external_sync()
+    
+    def _add_card(self, disc_status: DiscWithStatus) -> None:
+        """Create a disc's card and fetch its icon in the background if needed."""
+        self.disc_grid.add_card(disc_status)
+        disc = disc_status.disc
+        future = self._image_loader.fetch_icon(disc.id, disc.image_url)
+        if future is not None:
+            self._dispatcher.then(
+                future,
+                lambda result: self._on_icon_fetched(disc.id, result),
+                on_error=lambda error: logger.warning("Error fetching icon for %s: %s", disc.id, error)
+            )
+    
+    def _on_icon_fetched(self, disc_id: str, result: FetchResult) -> None:
+        """Show an icon that was downloaded or changed since the last run."""
+        if result.changed and disc_id in self.disc_grid:
+            self._image_loader.invalidate_downloads()
+            self.disc_grid.refresh_image(disc_id)
+    
+    def _on_discs_loaded(self, discs: List[DiscWithStatus]) -> None:
+        """Start progressive card construction once the disc list has loaded."""
+        self._all_discs = discs
+        self._reindex_discs()
+        self._unbuilt = {disc_status.disc.id: disc_status for disc_status in discs}
+        self._image_loader.predecode(
+            (disc_status.disc for disc_status in discs[:PREDECODE_ICONS]),
+            self._image_sizes()
+        )
+        self._do_search()
+        self._build_after_id = self.after(CARD_BUILD_INTERVAL_MS, self._build_cards_step)
+    
+    def _build_cards_step(self) -> None:
+        """Build cards for one frame's time budget, current search results first."""
+        # Paint the window and the previous slice before building more
+        self.update_idletasks()
+        
+        deadline = time.perf_counter() + CARD_BUILD_BUDGET_MS / 1000
+        shown = []
+        while self._unbuilt and time.perf_counter() < deadline:
+            disc_id = self._next_unbuilt_id()
+            # Results are built in order, so theirs go after the cards already shown
+            if self._build_cursor < len(self._visible_ids):
+                shown.append(disc_id)
+            self._add_card(self._unbuilt.pop(disc_id))
+        
+        if self._unbuilt:
+            # Only this slice's cards; earlier ones are laid out and styled already
+            self.disc_grid.append_cards(shown)
+            if self._selected_ids:
+                self.disc_grid.set_selected(self._selected_ids, shown)
+            self._build_after_id = self.after(CARD_BUILD_INTERVAL_MS, self._build_cards_step)
+            return
+        
+        # Once at the end, which also restores result order after a search during the build
+        self._build_after_id = None
+        self.disc_grid.show_cards(self._visible_ids)
+        if self._selected_ids:
+            self.disc_grid.set_selected(self._selected_ids)
+        self._schedule_external_sync()
+    
+    def _next_unbuilt_id(self) -> str:
+        """Pick the next card to build: visible results in order, then the rest."""
+        while self._build_cursor < len(self._visible_ids):
+            disc_id = self._visible_ids[self._build_cursor]
+            if disc_id in self._unbuilt:
+                return disc_id
+            self._build_cursor += 1
+        return next(iter(self._unbuilt))
+    
+    def _built_visible_ids(self) -> List[str]:
+        """Visible IDs whose cards exist; all of them once startup is done."""
+        if not self._unbuilt:
+            return self._visible_ids
+        return [disc_id for disc_id in self._visible_ids if disc_id not in self._unbuilt]
+    
+    def _reindex_discs(self) -> None:
+        """Point the ID index and search cache at the current disc list."""
+        self._discs_by_id = {d.disc.id: d for d in self._all_discs}
+        self._search_cache.reset((d.disc.id, d.disc.name) for d in self._all_discs)
     
     def _layout_visible_cards(self, filter_query: str = "") -> None:
         """Layout only visible cards based on filter."""
         query = filter_query.lower().strip()
+        self._cancel_filter()
         
-        # Determine which discs match
-        visible_discs = []
-        for disc_status in self._all_discs:
-            matches = not query or query in disc_status.disc.name.lower()
-            card = self._disc_cards[disc_status.disc.id]
-            
-            if matches:
-                visible_discs.append(disc_status.disc.id)
-            else:
-                card.grid_forget()
+        results = self._search_cache.get(query)
+        if results is not None:
+            self._show_results(results)
+            return
         
-        # Layout visible cards
-        for i, disc_id in enumerate(visible_discs):
-            row = i // 5
-            col = i % 5
-            self._disc_cards[disc_id].grid(row=row, column=col, padx=4, pady=4, sticky="nsew")
+        # Refining a query only needs to filter an earlier result set
+        candidates = self._search_cache.candidates(query)
+        self._filter_step(query, candidates, 0, [])
+    
+    def _filter_step(self, query: str, candidates: List[str], start: int, matches: List[str]) -> None:
+        """Filter one chunk of candidates, continuing on a later tick if more remain."""
+        end = start + SEARCH_CHUNK_SIZE
+        matches.extend(self._search_cache.matches(query, candidates[start:end]))
+        if end < len(candidates):
+            self._filter_after_id = self.after(
+                SEARCH_CHUNK_INTERVAL_MS, self._filter_step, query, candidates, end, matches
+            )
+            return
+        
+        self._filter_after_id = None
+        self._search_cache.store(query, matches)
+        self._show_results(matches)
+    
+    def _cancel_filter(self) -> None:
+        """Drop a chunked search still in progress."""
+        if self._filter_after_id:
+            self.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
+    
+    def _show_results(self, disc_ids: List[str]) -> None:
+        """Layout the cards of a search result."""
+        self._visible_ids = disc_ids
+        
+        # Layout visible cards, building new results first
+        self._build_cursor = 0
+        self.disc_grid.show_cards(self._built_visible_ids())
     
     def _on_search_keyrelease(self, event=None) -> None:
         """Handle search with debouncing."""
-        # Cancel previous search
+        # Cancel previous search, including one still filtering
         if self._search_after_id:
             self.after_cancel(self._search_after_id)
+        self._cancel_filter()
         
         # Debounce: wait 150ms after typing stops
         self._search_after_id = self.after(150, self._do_search)
@@ -221,38 +503,204 @@ class App(ctk.CTk):
     
     def _on_disc_toggle(self, disc_id: str) -> None:
         """Handle disc toggle event."""
-        new_status = self._service.toggle_disc(disc_id)
-        
-        for disc_status in self._all_discs:
-            if disc_status.disc.id == disc_id:
-                disc_status.owned = new_status
-                break
+        self._dispatcher.then(
+            self._service.toggle_disc(disc_id),
+            lambda new_status: self._apply_owned({disc_id: new_status}),
+            on_error=self._task_error("update the disc")
+        )
+    
+    def _apply_owned(self, changes: Dict[str, bool]) -> None:
+        """Show new ownership states on the affected cards and the progress bar."""
+        if not changes:
+            return
         
-        if disc_id in self._disc_cards:
-            self._disc_cards[disc_id].update_status(new_status)
+        for disc_id, owned in changes.items():
+            disc_status = self._discs_by_id.get(disc_id)
+            if disc_status is not None and disc_status.owned != owned:
+                disc_status.owned = owned
+                self.disc_grid.update_status(disc_id, owned)
         
         self._refresh_ui()
     
+    def _on_disc_select(self, disc_id: str, extend: bool) -> None:
+        """Handle ctrl-click (toggle one) and shift-click (select range)."""
+        anchor = self._selection_anchor
+        if extend and anchor in self._visible_ids and disc_id in self._visible_ids:
+            start = self._visible_ids.index(anchor)
+            end = self._visible_ids.index(disc_id)
+            if start > end:
+                start, end = end, start
+            self._selected_ids.update(self._visible_ids[start:end + 1])
+        else:
+            self._selected_ids.symmetric_difference_update((disc_id,))
+            self._selection_anchor = disc_id
+        
+        self._refresh_selection()
+    
+    def _select_all_visible(self) -> None:
+        """Select every card matching the current search."""
+        self._selected_ids.update(self._visible_ids)
+        self._refresh_selection()
+    
+    def _clear_selection(self) -> None:
+        """Deselect all cards."""
+        self._selected_ids.clear()
+        self._selection_anchor = None
+        self._refresh_selection()
+    
+    def _set_selection_owned(self, owned: bool) -> None:
+        """Apply an ownership state to all selected discs in one batch."""
+        if not self._selected_ids:
+            return
+        
+        self._dispatcher.then(
+            self._service.set_owned_many(self._selected_ids, owned),
+            lambda changed: self._apply_owned({disc_id: owned for disc_id in changed}),
+            on_error=self._task_error("update the selected discs")
+        )
+    
+    def _refresh_selection(self) -> None:
+        """Sync card highlights and the selection counter."""
+        self.disc_grid.set_selected(self._selected_ids)
+        
+        count = len(self._selected_ids)
+        self.selection_label.configure(text=f"{count} selected" if count else "")
+    
     def _on_disc_delete(self, disc_id: str) -> None:
         """Handle disc delete event."""
-        # Delete from service
-        if self._service.delete_disc(disc_id):
+        self._dispatcher.then(
+            self._service.delete_disc(disc_id),
+            lambda deleted: self._on_disc_deleted(disc_id, deleted),
+            on_error=self._task_error("delete the disc")
+        )
+    
+    def _on_disc_deleted(self, disc_id: str, deleted: bool) -> None:
+        """Remove a deleted disc's card."""
+        if deleted:
             # Remove from local list
             self._all_discs = [d for d in self._all_discs if d.disc.id != disc_id]
+            self._reindex_discs()
+            self._unbuilt.pop(disc_id, None)
+            self._selected_ids.discard(disc_id)
+            if self._selection_anchor == disc_id:
+                self._selection_anchor = None
             
             # Destroy and remove card
-            if disc_id in self._disc_cards:
-                self._disc_cards[disc_id].destroy()
-                del self._disc_cards[disc_id]
+            self.disc_grid.remove_card(disc_id)
             
             # Re-layout
             self._do_search()
             self._refresh_ui()
     
+    def _schedule_external_sync(self) -> None:
+        """Check for outside edits again after a while (once every card exists)."""
+        self._sync_after_id = self.after(EXTERNAL_SYNC_MS, self._poll_external_changes)
+    
+    def _poll_external_changes(self) -> None:
+        """Ask the worker for edits other processes made to the data files."""
+        self._sync_after_id = None
+        self._dispatcher.then(
+            self._service.sync_external_changes(),
+            self._on_external_changes,
+            on_error=self._on_external_sync_error
+        )
+    
+    def _on_external_changes(self, result: Tuple[ExternalChanges, Optional[List[DiscWithStatus]]]) -> None:
+        """Merge outside edits into the grid."""
+        changes, discs = result
+        if discs is not None:
+            # Packs may have been enabled or disabled, changing icon sources
+            self._image_loader.invalidate()
+            self._merge_catalog(discs)
+        else:
+            # Icons dropped into (or removed from) the icon folder
+            for disc_id in self._image_loader.rescan_if_changed():
+                if disc_id in self.disc_grid:
+                    self.disc_grid.refresh_image(disc_id)
+        
+        if changes.owned:
+            self._apply_owned(changes.owned)
+        elif changes:
+            self._refresh_ui()
+        self._schedule_external_sync()
+    
+    def _on_external_sync_error(self, error: BaseException) -> None:
+        """Keep polling after a failed sync."""
+        logger.warning("Error syncing external changes", exc_info=error)
+        self._schedule_external_sync()
+    
+    def _merge_catalog(self, discs: List[DiscWithStatus]) -> None:
+        """Add, remove or rebuild only the cards whose discs changed."""
+        previous = dict(self._discs_by_id)
+        merged = []
+        
+        for disc_status in discs:
+            old = previous.pop(disc_status.disc.id, None)
+            # Disc equality is by ID only; compare every field to spot edits
+            if old is not None and astuple(old.disc) == astuple(disc_status.disc):
+                merged.append(old)
+                continue
+            if old is not None:
+                self.disc_grid.remove_card(disc_status.disc.id)
+            self._add_card(disc_status)
+            merged.append(disc_status)
+        
+        # Whatever is left was removed from the catalog
+        for disc_id in previous:
+            self.disc_grid.remove_card(disc_id)
+            self._selected_ids.discard(disc_id)
+            if self._selection_anchor == disc_id:
+                self._selection_anchor = None
+        
+        self._all_discs = merged
+        self._reindex_discs()
+        self._do_search()
+        self._refresh_selection()
+    
+    def _set_zoom(self, zoom: str) -> None:
+        """Resize the cards and free images only the previous size used."""
+        if zoom == self._zoom:
+            return
+        self._zoom = zoom
+        self.disc_grid.set_zoom(ZOOM_LEVELS[zoom])
+        
+        sizes = self._image_sizes()
+        resources.release_images(sizes)
+        self._image_loader.retain_sizes(sizes)
+    
+    def _image_sizes(self) -> Tuple[int, int]:
+        """Card image sizes at the current zoom.
+        
+        CTk images are keyed by display size, canvas images by pixel size.
+        """
+        image_size = ZOOM_LEVELS[self._zoom].image_size
+        return image_size, round(image_size * ctk.ScalingTracker.get_widget_scaling(self))
+    
     def _refresh_ui(self) -> None:
         """Refresh progress."""
-        owned, total = self._service.get_progress()
+        self._dispatcher.then(
+            self._service.get_progress(),
+            self._show_progress,
+            on_error=self._task_error("load the collection progress")
+        )
         
+        if self.history_chart.winfo_ismapped():
+            self._dispatcher.then(
+                self._service.get_weekly_progress(),
+                self.history_chart.set_series,
+                on_error=self._task_error("load the weekly progress")
+            )
+        
+        if self.completion_panel.winfo_ismapped():
+            self._dispatcher.then(
+                self._service.get_completion_breakdown(),
+                self.completion_panel.set_breakdown,
+                on_error=self._task_error("load the completion breakdown")
+            )
+    
+    def _show_progress(self, progress: Tuple[int, int]) -> None:
+        """Show (owned, total) in the progress section."""
+        owned, total = progress
         progress = owned / total if total > 0 else 0
         self.progress_bar.set(progress)
         self.progress_label.configure(text=f"{owned}/{total}")
@@ -262,28 +710,130 @@ class App(ctk.CTk):
         """Preload images in background."""
         pass
     
+    def _register_memory_probes(self, diagnostics: MemoryDiagnostics) -> None:
+        """Report live objects for each GUI and data subsystem."""
+        def cards() -> Tuple[int, int, str]:
+            widgets = list(_widget_tree(self.disc_grid))
+            size = sum(deep_sizeof(widget) for widget in widgets)
+            return len(self.disc_grid), size, f"{len(widgets)} Tk widgets, {len(self._unbuilt)} not built yet"
+        
+        def windows() -> Tuple[int, int, str]:
+            toplevels = [w for w in self.winfo_children() if isinstance(w, tk.Toplevel)]
+            size = sum(deep_sizeof(w) for top in toplevels for w in _widget_tree(top))
+            mapped = sum(1 for top in toplevels if top.winfo_ismapped())
+            return len(toplevels), size, f"{mapped} mapped (tooltips, dialogs)"
+        
+        def images() -> Tuple[int, int, str]:
+            count, size = resources.image_usage()
+            return count, size, "pixel buffers incl. scaled Tk copies"
+        
+        def fonts() -> Tuple[int, int, str]:
+            count, size = resources.font_usage()
+            return count, size, ""
+        
+        def thumbnails() -> Tuple[int, int, str]:
+            count, size = self._image_loader.level_usage()
+            return count, size, "prebuilt levels kept for the current zoom"
+        
+        def image_paths() -> Tuple[int, int, str]:
+            info = self._image_loader.get_image_path.cache_info()
+            return info.currsize, 0, f"lru_cache hits {info.hits}, misses {info.misses}, max {info.maxsize}"
+        
+        def discs() -> Tuple[int, int, str]:
+            return len(self._all_discs), deep_sizeof(self._all_discs), "App disc list"
+        
+        def collection() -> Tuple[int, int, str]:
+            count, size = self._collection_footprint
+            return count, size, ""
+        
+        diagnostics.register("cards", cards)
+        diagnostics.register("windows", windows)
+        diagnostics.register("images", images)
+        diagnostics.register("fonts", fonts)
+        diagnostics.register("thumbnails", thumbnails)
+        diagnostics.register("image path cache", image_paths)
+        diagnostics.register("discs", discs)
+        diagnostics.register("collection entries", collection)
+    
+    def _print_memory_report(self, event=None) -> None:
+        """Print memory usage and the allocation diff since the last report (F12)."""
+        def measured(footprint: Tuple[int, int]) -> None:
+            self._collection_footprint = footprint
+            print(self._memory_diagnostics.report(), flush=True)
+        
+        self._dispatcher.then(
+            self._service.get_collection_footprint(),
+            measured,
+            on_error=lambda error: logger.warning("Error measuring the collection", exc_info=error)
+        )
+    
     def _show_add_disc_dialog(self) -> None:
         """Show the add disc dialog."""
-        AddDiscDialog(self, on_save=self._on_add_disc)
+        dialog = AddDiscDialog(self, on_save=lambda disc_data: self._on_add_disc(dialog, disc_data))
     
-    def _on_add_disc(self, disc_data: dict) -> None:
-        """Handle adding a new disc."""
-        new_disc = self._service.add_disc(disc_data)
+    def _on_add_disc(self, dialog: AddDiscDialog, disc_data: dict) -> None:
+        """Add a disc, closing the dialog on success and reporting errors in it."""
+        def added(new_disc: Disc) -> None:
+            if dialog.winfo_exists():
+                dialog.destroy()
+            self._on_disc_added(new_disc)
         
+        def failed(error: BaseException) -> None:
+            # Taken IDs raise ValueError with a message meant for the user
+            if dialog.winfo_exists():
+                dialog.save_failed(str(error))
+            else:
+                self._task_error("add the disc")(error)
+        
+        self._dispatcher.then(self._service.add_disc(disc_data), added, on_error=failed)
+    
+    def _on_disc_added(self, new_disc: Disc) -> None:
+        """Create the card for a newly added disc."""
         disc_with_status = DiscWithStatus(disc=new_disc, owned=False)
         self._all_discs.append(disc_with_status)
+        self._reindex_discs()
         
         # Create card for new disc
-        image_path = self._image_loader.get_image_path(new_disc.id, new_disc.image_url)
-        card = DiscCard(
-            self.scroll_frame,
-            disc_with_status,
-            image_path,
-            on_toggle=self._on_disc_toggle,
-            on_delete=self._on_disc_delete
-        )
-        self._disc_cards[new_disc.id] = card
+        self._add_card(disc_with_status)
         
         # Re-layout
         self._do_search()
         self._refresh_ui()
+    
+    def _on_startup_error(self, error: BaseException) -> None:
+        """Close the window if the collection could not be loaded."""
+        logger.error("Error loading collection", exc_info=error)
+        self._show_error(f"Could not load the collection.\n\n{error}")
+        self._on_close()
+    
+    def _task_error(self, action: str) -> Callable[[BaseException], None]:
+        """Error handler for a service call: log it and tell the user what failed."""
+        def on_error(error: BaseException) -> None:
+            logger.error("Could not %s", action, exc_info=error)
+            self._show_error(f"Could not {action}.\n\n{error}")
+        return on_error
+    
+    def _show_error(self, message: str) -> None:
+        """Show an error dialog, unless one is already open."""
+        # The dialog runs a nested event loop, so more failures can arrive meanwhile
+        if self._error_showing:
+            return
+        self._error_showing = True
+        try:
+            messagebox.showerror("Music Disc Tracker", message, parent=self)
+        finally:
+            self._error_showing = False
+    
+    def _on_close(self) -> None:
+        """Write everything still queued or debounced, then close."""
+        self._dispatcher.stop()
+        self._image_loader.close()
+        self._service.shutdown()
+        self.destroy()
+
+
+def _widget_tree(widget) -> Iterator[tk.Misc]:
+    """Yield a widget and all of its descendants."""
+    yield widget
+    for child in widget.winfo_children():
+        yield from _widget_tree(child)
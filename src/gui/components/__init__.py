@@ -1,4 +1,19 @@
 from .disc_card import DiscCard
+from .disc_grid import DiscGrid
+from .canvas_disc_grid import CanvasDiscGrid
+from .delete_disc_dialog import DeleteDiscDialog
+from .disc_tooltip import DiscTooltip
 from .add_disc_dialog import AddDiscDialog
+from .history_chart import HistoryChart
+from .completion_panel import CompletionPanel
 
-__all__ = ["DiscCard", "AddDiscDialog"]
+__all__ = [
+    "DiscCard",
+    "DiscGrid",
+    "CanvasDiscGrid",
+    "DiscTooltip",
+    "AddDiscDialog",
+    "DeleteDiscDialog",
+    "HistoryChart",
+    "CompletionPanel"
+]
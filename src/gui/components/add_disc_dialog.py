@@ -1,19 +1,26 @@
 from typing import Callable
-from pathlib import Path
 import customtkinter as ctk
 
-
-# Geist-like Design System
-GEIST_BG = "#000000"
-GEIST_CARD = "#111111"
-GEIST_BORDER = "#333333"
-GEIST_TEXT = "#EDEDED"
-GEIST_TEXT_SECONDARY = "#888888"
-GEIST_ERROR = "#FF0000"
+from src.gui.theme import (
+    APP_ICON_PATH,
+    GEIST_BG,
+    GEIST_CARD,
+    GEIST_BORDER,
+    GEIST_TEXT,
+    GEIST_TEXT_SECONDARY,
+    GEIST_ERROR,
+    GEIST_PRIMARY_HOVER,
+    resources,
+)
 
 
 class AddDiscDialog(ctk.CTkToplevel):
-    """Dialog for adding a new music disc."""
+    """Dialog for adding a new music disc.
+    
+    on_save receives the form data. The dialog stays open until the caller
+    closes it once the disc was added, or calls save_failed() to show why
+    it wasn't (e.g. the ID is taken) so the user can correct it.
+    """
     
     def __init__(self, parent, on_save: Callable[[dict], None]):
         super().__init__(parent)
@@ -26,9 +33,8 @@ class AddDiscDialog(ctk.CTkToplevel):
         self.configure(fg_color=GEIST_BG)
         
         # Set custom icon
-        icon_path = Path(__file__).parent.parent.parent.parent / "data" / "app-icon" / "icon.ico"
-        if icon_path.exists():
-            self.after(200, lambda: self.iconbitmap(str(icon_path)))
+        if APP_ICON_PATH.exists():
+            self.after(200, lambda: self.iconbitmap(str(APP_ICON_PATH)))
         
         self.transient(parent)
         self.grab_set()
@@ -51,7 +57,7 @@ class AddDiscDialog(ctk.CTkToplevel):
         
         # ID
         ctk.CTkLabel(form_frame, text="ID", text_color=GEIST_TEXT_SECONDARY, 
-                     font=ctk.CTkFont(size=12)).grid(row=0, column=0, padx=(0, 16), pady=6, sticky="e")
+                     font=resources.font("label")).grid(row=0, column=0, padx=(0, 16), pady=6, sticky="e")
         self.id_entry = ctk.CTkEntry(
             form_frame, 
             placeholder_text="disc_id",
@@ -63,7 +69,7 @@ class AddDiscDialog(ctk.CTkToplevel):
         
         # Name
         ctk.CTkLabel(form_frame, text="Name", text_color=GEIST_TEXT_SECONDARY,
-                     font=ctk.CTkFont(size=12)).grid(row=1, column=0, padx=(0, 16), pady=6, sticky="e")
+                     font=resources.font("label")).grid(row=1, column=0, padx=(0, 16), pady=6, sticky="e")
         self.name_entry = ctk.CTkEntry(
             form_frame, 
             placeholder_text="Disc Name",
@@ -75,7 +81,7 @@ class AddDiscDialog(ctk.CTkToplevel):
         
         # Artist
         ctk.CTkLabel(form_frame, text="Artist", text_color=GEIST_TEXT_SECONDARY,
-                     font=ctk.CTkFont(size=12)).grid(row=2, column=0, padx=(0, 16), pady=6, sticky="e")
+                     font=resources.font("label")).grid(row=2, column=0, padx=(0, 16), pady=6, sticky="e")
         self.artist_entry = ctk.CTkEntry(
             form_frame, 
             placeholder_text="Artist name",
@@ -87,7 +93,7 @@ class AddDiscDialog(ctk.CTkToplevel):
         
         # Description
         ctk.CTkLabel(form_frame, text="Description", text_color=GEIST_TEXT_SECONDARY,
-                     font=ctk.CTkFont(size=12)).grid(row=3, column=0, padx=(0, 16), pady=6, sticky="ne")
+                     font=resources.font("label")).grid(row=3, column=0, padx=(0, 16), pady=6, sticky="ne")
         self.desc_entry = ctk.CTkTextbox(
             form_frame,
             height=60,
@@ -100,7 +106,7 @@ class AddDiscDialog(ctk.CTkToplevel):
         
         # How to obtain
         ctk.CTkLabel(form_frame, text="Obtain Method", text_color=GEIST_TEXT_SECONDARY,
-                     font=ctk.CTkFont(size=12)).grid(row=4, column=0, padx=(0, 16), pady=6, sticky="e")
+                     font=resources.font("label")).grid(row=4, column=0, padx=(0, 16), pady=6, sticky="e")
         self.obtain_entry = ctk.CTkEntry(
             form_frame, 
             placeholder_text="e.g. Dungeon Chests",
@@ -129,18 +135,18 @@ class AddDiscDialog(ctk.CTkToplevel):
         )
         cancel_btn.pack(side="left", padx=8)
         
-        save_btn = ctk.CTkButton(
+        self.save_btn = ctk.CTkButton(
             button_frame,
             text="Save",
             width=80,
             height=32,
             corner_radius=6,
             fg_color=GEIST_TEXT,
-            hover_color="#CCCCCC",
+            hover_color=GEIST_PRIMARY_HOVER,
             text_color=GEIST_BG,
             command=self._save
         )
-        save_btn.pack(side="left", padx=8)
+        self.save_btn.pack(side="left", padx=8)
     
     def _save(self) -> None:
         """Save the new disc."""
@@ -162,8 +168,14 @@ class AddDiscDialog(ctk.CTkToplevel):
             "how_to_obtain": how_to_obtain
         }
         
+        # Until the caller reports back, so the same disc isn't submitted twice
+        self.save_btn.configure(state="disabled")
         self._on_save(disc_data)
-        self.destroy()
+    
+    def save_failed(self, message: str) -> None:
+        """Keep the dialog open and show why the disc could not be added."""
+        self.save_btn.configure(state="normal")
+        self._show_error(message)
     
     def _show_error(self, message: str) -> None:
         """Show an error message."""
@@ -171,7 +183,7 @@ class AddDiscDialog(ctk.CTkToplevel):
             self,
             text=message,
             text_color=GEIST_ERROR,
-            font=ctk.CTkFont(size=11)
+            font=resources.font("caption")
         )
         error_label.grid(row=2, column=0, pady=8)
         self.after(3000, error_label.destroy)
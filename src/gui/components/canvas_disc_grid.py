@@ -0,0 +1,423 @@
+import itertools
+import tkinter as tk
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Set
+import customtkinter as ctk
+
+from src.models.disc import Disc
+from src.services.collection_service import DiscWithStatus
+from src.services.image_loader import ImageLoader, ImageSource
+from src.gui.components.delete_disc_dialog import DeleteDiscDialog
+from src.gui.components.disc_grid import CONTROL_MASK, SHIFT_MASK, TOOLTIP_DELAY_MS
+from src.gui.components.disc_tooltip import DiscTooltip
+from src.gui.layout import DEFAULT_ZOOM, RELAYOUT_DELAY_MS, ZOOM_LEVELS, CardZoom, GridLayout, compute_layout
+from src.gui.theme import (
+    GEIST_BG,
+    GEIST_CARD,
+    GEIST_CARD_HOVER,
+    GEIST_CARD_SELECTED,
+    GEIST_BORDER,
+    GEIST_BORDER_ACTIVE,
+    GEIST_TEXT,
+    GEIST_TEXT_SECONDARY,
+    GEIST_SUCCESS,
+    GEIST_DANGER,
+    resources,
+)
+
+
+# Card decoration in unscaled pixels, matching the widget-based DiscCard
+CARD_RADIUS = 8
+CORNER_INSET = 14
+
+
+@dataclass
+class _CanvasCard:
+    """Render state of one card. Items are only drawn once it scrolls into view."""
+    disc: Disc
+    owned: bool
+    image_path: Optional[ImageSource]
+    tag: str
+    selected: bool = False
+    hovering: bool = False
+    slot: Optional[int] = None
+    bg_item: Optional[int] = None
+    check_item: Optional[int] = None
+
+
+class CanvasDiscGrid(ctk.CTkFrame):
+    """Scrollable grid that draws every card as items on a single tk.Canvas.
+    
+    This is a drop-in alternative to DiscGrid with the same public methods.
+    It holds one Tk window for the whole grid instead of several per disc.
+    Items are created lazily when their slot scrolls into view. Toggle, hover
+    and filter changes only reconfigure or move the affected items.
+    Width changes are coalesced into one relayout per frame, which redraws
+    only the cards in view.
+    """
+    
+    def __init__(
+        self,
+        parent,
+        image_loader: ImageLoader,
+        on_toggle: Callable[[str], None],
+        on_select: Callable[[str, bool], None],
+        on_delete: Callable[[str], None],
+        **kwargs
+    ):
+        super().__init__(parent, fg_color="transparent", corner_radius=0, **kwargs)
+        
+        self._image_loader = image_loader
+        self._on_toggle = on_toggle
+        self._on_select = on_select
+        self._on_delete = on_delete
+        self._cards: Dict[str, _CanvasCard] = {}
+        self._shown_ids: List[str] = []
+        self._tags = itertools.count()
+        self._hover_id: Optional[str] = None
+        self._tooltip = DiscTooltip(self)
+        self._tooltip_after_id = None
+        self._relayout_after_id = None
+        self._canvas_width = 0
+        
+        scaling = self._scaling = ctk.ScalingTracker.get_widget_scaling(self)
+        self._zoom = ZOOM_LEVELS[DEFAULT_ZOOM]
+        self._layout: GridLayout = self._compute_layout(0)
+        self._radius = round(CARD_RADIUS * scaling)
+        self._image_size = round(self._zoom.image_size * scaling)
+        self._corner_inset = round(CORNER_INSET * scaling)
+        self._name_font = resources.canvas_font("caption", scaling)
+        self._mark_font = resources.canvas_font("heading_bold", scaling)
+        
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+        
+        self.canvas = tk.Canvas(self, bg=GEIST_BG, highlightthickness=0, borderwidth=0)
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        
+        self.scrollbar = ctk.CTkScrollbar(
+            self,
+            command=self.canvas.yview,
+            button_color=GEIST_BORDER,
+            button_hover_color=GEIST_TEXT_SECONDARY
+        )
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        self.canvas.configure(yscrollcommand=self._on_yview)
+        
+        self.canvas.bind("<Configure>", self._on_resize)
+        self.canvas.bind("<Motion>", self._on_pointer_motion)
+        self.canvas.bind("<Leave>", lambda event: self._set_hover(None))
+        self.canvas.bind("<Button-1>", self._on_pointer_click)
+        self.canvas.bind("<MouseWheel>", self._on_mousewheel)
+        self.canvas.bind("<Button-4>", lambda event: self._scroll(-1))
+        self.canvas.bind("<Button-5>", lambda event: self._scroll(1))
+    
+    def __contains__(self, disc_id: str) -> bool:
+        return disc_id in self._cards
+    
+    def __len__(self) -> int:
+        return len(self._cards)
+    
+    def add_card(self, disc_status: DiscWithStatus) -> None:
+        """Register a card for a disc. It stays hidden until shown."""
+        disc = disc_status.disc
+        self._cards[disc.id] = _CanvasCard(
+            disc=disc,
+            owned=disc_status.owned,
+            image_path=self._image_loader.get_image_path(disc.id, disc.image_url),
+            tag=f"card{next(self._tags)}"
+        )
+    
+    def remove_card(self, disc_id: str) -> None:
+        """Delete a card and its canvas items."""
+        card = self._cards.pop(disc_id, None)
+        if card is None:
+            return
+        if self._hover_id == disc_id:
+            self._set_hover(None)
+        self.canvas.delete(card.tag)
+    
+    def show_cards(self, disc_ids: List[str]) -> None:
+        """Lay out the given cards in order and hide all others."""
+        shown = set(disc_ids)
+        for disc_id in self._shown_ids:
+            card = self._cards.get(disc_id)
+            if card and disc_id not in shown:
+                card.slot = None
+                self.canvas.itemconfigure(card.tag, state="hidden")
+        
+        self._shown_ids = list(disc_ids)
+        self._slot_cards(0)
+    
+    def append_cards(self, disc_ids: List[str]) -> None:
+        """Lay out more cards after the shown ones, leaving those in place."""
+        start = len(self._shown_ids)
+        self._shown_ids.extend(disc_ids)
+        self._slot_cards(start)
+    
+    def _slot_cards(self, start: int) -> None:
+        """Move shown cards from `start` on to their slots, then draw those in view."""
+        for slot in range(start, len(self._shown_ids)):
+            card = self._cards[self._shown_ids[slot]]
+            if card.slot == slot:
+                continue
+            if card.bg_item is not None:
+                if card.slot is None:
+                    self.canvas.itemconfigure(card.tag, state="normal")
+                    x0, y0 = self.canvas.coords(card.bg_item)[:2]
+                    old_x, old_y = x0 - self._radius, y0
+                else:
+                    old_x, old_y = self._layout.slot_origin(card.slot)
+                new_x, new_y = self._layout.slot_origin(slot)
+                self.canvas.move(card.tag, new_x - old_x, new_y - old_y)
+            card.slot = slot
+        
+        self._update_scrollregion()
+        self._draw_visible()
+    
+    def update_status(self, disc_id: str, owned: bool) -> None:
+        """Update a card's ownership display."""
+        card = self._cards.get(disc_id)
+        if card and card.owned != owned:
+            card.owned = owned
+            self._restyle(card)
+    
+    def refresh_image(self, disc_id: str) -> None:
+        """Look up a card's icon again and redraw the card if it is drawn."""
+        card = self._cards.get(disc_id)
+        if card is None:
+            return
+        card.image_path = self._image_loader.get_image_path(card.disc.id, card.disc.image_url)
+        if card.bg_item is None:
+            return
+        self.canvas.delete(card.tag)
+        card.bg_item = card.check_item = None
+        # A card hidden by a filter has no slot; it is drawn again once shown
+        if card.slot is not None:
+            self._draw_card(card)
+    
+    def set_selected(self, selected_ids: Set[str], disc_ids: Optional[Iterable[str]] = None) -> None:
+        """Highlight exactly the selected cards, checking only `disc_ids` if given."""
+        for disc_id in self._cards if disc_ids is None else disc_ids:
+            card = self._cards[disc_id]
+            selected = disc_id in selected_ids
+            if card.selected != selected:
+                card.selected = selected
+                self._restyle(card)
+    
+    def set_zoom(self, zoom: CardZoom) -> None:
+        """Switch card and image size, redrawing the cards in view."""
+        if zoom == self._zoom:
+            return
+        self._zoom = zoom
+        self._image_size = round(zoom.image_size * self._scaling)
+        self._apply_layout(self._compute_layout(self._canvas_width))
+        self._draw_visible()
+    
+    def _compute_layout(self, width: float) -> GridLayout:
+        """Layout for a canvas width at the current zoom level."""
+        return compute_layout(
+            width, self._scaling,
+            min_card_width=self._zoom.min_card_width,
+            card_height=self._zoom.card_height
+        )
+    
+    def _apply_layout(self, layout: GridLayout) -> None:
+        """Switch to a new layout, dropping all drawn items and re-slotting shown cards."""
+        self._layout = layout
+        self.canvas.delete("all")
+        for card in self._cards.values():
+            card.bg_item = card.check_item = None
+        self._update_scrollregion()
+    
+    def _update_scrollregion(self) -> None:
+        """Size the scrollable area to the shown cards."""
+        height = self._layout.content_height(len(self._shown_ids))
+        self.canvas.configure(scrollregion=(0, 0, self._canvas_width, height))
+    
+    def _draw_visible(self) -> None:
+        """Draw items for shown cards in (or just below) the viewport."""
+        # Wait for a pending relayout instead of drawing at a stale width
+        if not self._shown_ids or self._canvas_width <= 1 or self._relayout_after_id:
+            return
+        
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+        for slot in self._layout.visible_slots(top, bottom, len(self._shown_ids)):
+            card = self._cards[self._shown_ids[slot]]
+            if card.bg_item is None:
+                self._draw_card(card)
+    
+    def _draw_card(self, card: _CanvasCard) -> None:
+        """Create the canvas items for one card at its slot."""
+        canvas = self.canvas
+        x0, y0 = self._layout.slot_origin(card.slot)
+        x1, y1 = x0 + self._layout.card_width, y0 + self._layout.card_height
+        cx = (x0 + x1) / 2
+        tags = (card.tag,)
+        
+        card.bg_item = canvas.create_polygon(
+            self._rounded_rect(x0, y0, x1, y1),
+            smooth=True, width=1, tags=tags
+        )
+        card.check_item = canvas.create_text(
+            x1 - self._corner_inset, y0 + self._corner_inset,
+            font=self._mark_font, tags=tags
+        )
+        
+        if not card.disc.protected:
+            canvas.create_text(
+                x0 + self._corner_inset, y0 + self._corner_inset,
+                text="×", fill=GEIST_DANGER, font=self._mark_font, tags=tags
+            )
+        
+        image_y = y0 + self._layout.card_height / 2
+        image = None
+        if card.image_path:
+            image = resources.photo_image(
+                card.image_path, self._image_size,
+                on_ready=lambda disc_id=card.disc.id: self.refresh_image(disc_id)
+            )
+        if image is not None:
+            canvas.create_image(cx, image_y, image=image, tags=tags)
+        else:
+            r = self._image_size * 0.3
+            canvas.create_oval(cx - r, image_y - r, cx + r, image_y + r,
+                               fill=GEIST_TEXT_SECONDARY, width=0, tags=tags)
+        
+        canvas.create_text(
+            cx, y1 - self._corner_inset,
+            text=card.disc.name, fill=GEIST_TEXT, font=self._name_font, tags=tags
+        )
+        self._restyle(card)
+    
+    def _restyle(self, card: _CanvasCard) -> None:
+        """Reconfigure the items that depend on owned/selected/hover state."""
+        if card.bg_item is None:
+            return
+        
+        if card.selected:
+            fill = GEIST_CARD_SELECTED
+        else:
+            fill = GEIST_CARD_HOVER if card.hovering else GEIST_CARD
+        outline = GEIST_BORDER_ACTIVE if card.owned else GEIST_BORDER
+        self.canvas.itemconfigure(card.bg_item, fill=fill, outline=outline)
+        self.canvas.itemconfigure(
+            card.check_item,
+            text="✓" if card.owned else "",
+            fill=GEIST_SUCCESS if card.owned else GEIST_TEXT_SECONDARY
+        )
+    
+    def _rounded_rect(self, x0: float, y0: float, x1: float, y1: float) -> List[float]:
+        """Control points for a smoothed polygon with rounded corners."""
+        r = self._radius
+        return [
+            x0 + r, y0, x1 - r, y0, x1, y0, x1, y0 + r,
+            x1, y1 - r, x1, y1, x1 - r, y1, x0 + r, y1,
+            x0, y1, x0, y1 - r, x0, y0 + r, x0, y0,
+        ]
+    
+    def _on_resize(self, event) -> None:
+        """Coalesce a burst of canvas resizes into one relayout."""
+        self._canvas_width = event.width
+        if self._relayout_after_id is None:
+            self._relayout_after_id = self.after(RELAYOUT_DELAY_MS, self._relayout)
+    
+    def _relayout(self) -> None:
+        """Apply the layout for the current width, redrawing cards in view."""
+        self._relayout_after_id = None
+        layout = self._compute_layout(self._canvas_width)
+        if layout != self._layout:
+            self._apply_layout(layout)
+        self._draw_visible()
+    
+    def _on_yview(self, first: str, last: str) -> None:
+        """Keep the scrollbar in sync and draw cards scrolled into view."""
+        self.scrollbar.set(first, last)
+        self._draw_visible()
+    
+    def _on_mousewheel(self, event) -> None:
+        """Scroll with the mouse wheel (Windows/macOS)."""
+        self._scroll(-1 if event.delta > 0 else 1)
+    
+    def _scroll(self, direction: int) -> None:
+        """Scroll by a few units and refresh hover under the pointer."""
+        self.canvas.yview_scroll(direction * 2, "units")
+        x = self.canvas.winfo_pointerx() - self.canvas.winfo_rootx()
+        y = self.canvas.winfo_pointery() - self.canvas.winfo_rooty()
+        self._set_hover(self._card_at(x, y))
+    
+    def _card_at(self, x: int, y: int) -> Optional[str]:
+        """Resolve the card under a point in window coordinates."""
+        slot = self._layout.slot_at(self.canvas.canvasx(x), self.canvas.canvasy(y))
+        if slot is None or slot >= len(self._shown_ids):
+            return None
+        return self._shown_ids[slot]
+    
+    def _is_delete_hit(self, card: _CanvasCard, x: int, y: int) -> bool:
+        """Check whether a point hits a custom card's delete mark."""
+        if card.disc.protected:
+            return False
+        x0, y0 = self._layout.slot_origin(card.slot)
+        dx = self.canvas.canvasx(x) - (x0 + self._corner_inset)
+        dy = self.canvas.canvasy(y) - (y0 + self._corner_inset)
+        return abs(dx) <= self._corner_inset and abs(dy) <= self._corner_inset
+    
+    def _on_pointer_motion(self, event) -> None:
+        """Track which card is under the pointer."""
+        self._set_hover(self._card_at(event.x, event.y))
+    
+    def _on_pointer_click(self, event) -> None:
+        """Dispatch a click to delete, toggle or selection."""
+        disc_id = self._card_at(event.x, event.y)
+        if disc_id is None:
+            return
+        
+        card = self._cards[disc_id]
+        if self._is_delete_hit(card, event.x, event.y):
+            DeleteDiscDialog(self, card.disc, on_confirm=self._on_delete)
+            return
+        
+        # Shift extends the selection as a range, Ctrl toggles a single card
+        if event.state & (SHIFT_MASK | CONTROL_MASK):
+            self._on_select(disc_id, bool(event.state & SHIFT_MASK))
+            return
+        self._on_toggle(disc_id)
+    
+    def _set_hover(self, disc_id: Optional[str]) -> None:
+        """Move the hover highlight and tooltip to another card."""
+        if disc_id == self._hover_id:
+            return
+        
+        previous = self._cards.get(self._hover_id)
+        if previous:
+            previous.hovering = False
+            self._restyle(previous)
+        self._cancel_tooltip()
+        self._tooltip.hide()
+        
+        self._hover_id = disc_id
+        card = self._cards.get(disc_id)
+        self.canvas.configure(cursor="hand2" if card else "")
+        if card:
+            card.hovering = True
+            self._restyle(card)
+            self._tooltip_after_id = self.after(TOOLTIP_DELAY_MS, self._show_tooltip)
+    
+    def _cancel_tooltip(self) -> None:
+        """Cancel a scheduled tooltip."""
+        if self._tooltip_after_id:
+            self.after_cancel(self._tooltip_after_id)
+            self._tooltip_after_id = None
+    
+    def _show_tooltip(self) -> None:
+        """Show the tooltip next to the hovered card."""
+        self._tooltip_after_id = None
+        card = self._cards.get(self._hover_id)
+        if card is None or card.slot is None:
+            return
+        
+        x0, y0 = self._layout.slot_origin(card.slot)
+        x = self.canvas.winfo_rootx() + int(x0 + self._layout.card_width - self.canvas.canvasx(0)) + 5
+        y = self.canvas.winfo_rooty() + int(y0 - self.canvas.canvasy(0))
+        self._tooltip.show(card.disc, x, y)
@@ -0,0 +1,92 @@
+from typing import Dict, List, Tuple
+import customtkinter as ctk
+
+from src.models.completion import BY_ARTIST, BY_SOURCE, GroupProgress
+from src.gui.theme import (
+    GEIST_CARD,
+    GEIST_BORDER,
+    GEIST_TEXT,
+    GEIST_TEXT_SECONDARY,
+    GEIST_ACCENT,
+    resources,
+)
+
+COLUMN_TITLES = {BY_ARTIST: "By Artist", BY_SOURCE: "By Source"}
+
+
+class CompletionPanel(ctk.CTkFrame):
+    """Completion per artist and per obtain source, one progress row per group."""
+    
+    def __init__(self, parent, **kwargs):
+        super().__init__(
+            parent,
+            fg_color=GEIST_CARD,
+            corner_radius=8,
+            border_width=1,
+            border_color=GEIST_BORDER,
+            **kwargs
+        )
+        
+        self._columns: Dict[str, ctk.CTkFrame] = {}
+        # Row widgets per (dimension, group), reused across updates
+        self._rows: Dict[Tuple[str, str], Tuple[ctk.CTkLabel, ctk.CTkProgressBar, ctk.CTkLabel]] = {}
+        
+        for col, (dimension, title) in enumerate(COLUMN_TITLES.items()):
+            self.grid_columnconfigure(col, weight=1, uniform="completion")
+            column = ctk.CTkFrame(self, fg_color="transparent")
+            column.grid(row=0, column=col, padx=12, pady=10, sticky="new")
+            column.grid_columnconfigure(1, weight=1)
+            ctk.CTkLabel(
+                column,
+                text=title,
+                font=resources.font("label"),
+                text_color=GEIST_TEXT_SECONDARY
+            ).grid(row=0, column=0, columnspan=3, sticky="w")
+            self._columns[dimension] = column
+    
+    def set_breakdown(self, breakdown: Dict[str, List[GroupProgress]]) -> None:
+        """Show the latest counts, adding or removing rows as groups come and go."""
+        shown = set()
+        for dimension, groups in breakdown.items():
+            column = self._columns[dimension]
+            for row, group in enumerate(groups, start=1):
+                key = (dimension, group.name)
+                shown.add(key)
+                widgets = self._rows.get(key) or self._create_row(column, group.name)
+                self._rows[key] = widgets
+                name_label, bar, count_label = widgets
+                bar.set(group.fraction)
+                count_label.configure(text=f"{group.owned}/{group.total}")
+                name_label.grid(row=row, column=0, pady=2, sticky="w")
+                bar.grid(row=row, column=1, padx=8, pady=2, sticky="ew")
+                count_label.grid(row=row, column=2, pady=2, sticky="e")
+        
+        for key in [key for key in self._rows if key not in shown]:
+            for widget in self._rows.pop(key):
+                widget.destroy()
+    
+    def _create_row(self, column: ctk.CTkFrame, name: str) -> Tuple[ctk.CTkLabel, ctk.CTkProgressBar, ctk.CTkLabel]:
+        """Create the name, bar and count widgets for one group."""
+        name_label = ctk.CTkLabel(
+            column,
+            text=name,
+            font=resources.font("caption"),
+            text_color=GEIST_TEXT,
+            anchor="w"
+        )
+        bar = ctk.CTkProgressBar(
+            column,
+            height=4,
+            corner_radius=2,
+            progress_color=GEIST_ACCENT,
+            fg_color=GEIST_BORDER
+        )
+        count_label = ctk.CTkLabel(
+            column,
+            text="",
+            font=resources.font("caption"),
+            text_color=GEIST_TEXT_SECONDARY,
+            width=48,
+            anchor="e"
+        )
+        return name_label, bar, count_label
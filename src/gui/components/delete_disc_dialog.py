@@ -0,0 +1,78 @@
+from typing import Callable
+import customtkinter as ctk
+
+from src.models.disc import Disc
+from src.gui.theme import (
+    APP_ICON_PATH,
+    GEIST_BG,
+    GEIST_CARD,
+    GEIST_BORDER,
+    GEIST_TEXT,
+    GEIST_DANGER,
+    GEIST_DANGER_HOVER,
+    resources,
+)
+
+
+class DeleteDiscDialog(ctk.CTkToplevel):
+    """Confirmation dialog shown before deleting a custom disc."""
+    
+    def __init__(self, parent, disc: Disc, on_confirm: Callable[[str], None]):
+        super().__init__(parent)
+        
+        self._disc = disc
+        self._on_confirm = on_confirm
+        
+        self.title("Delete Disc")
+        self.geometry("280x120")
+        self.resizable(False, False)
+        self.configure(fg_color=GEIST_BG)
+        self.transient(parent.winfo_toplevel())
+        self.grab_set()
+        
+        # Set custom icon
+        if APP_ICON_PATH.exists():
+            self.after(200, lambda: self.iconbitmap(str(APP_ICON_PATH)))
+        
+        # Center on parent
+        self.update_idletasks()
+        toplevel = parent.winfo_toplevel()
+        x = toplevel.winfo_x() + (toplevel.winfo_width() - self.winfo_width()) // 2
+        y = toplevel.winfo_y() + (toplevel.winfo_height() - self.winfo_height()) // 2
+        self.geometry(f"+{x}+{y}")
+        
+        self._setup_ui()
+    
+    def _setup_ui(self) -> None:
+        """Set up the dialog UI."""
+        # Message
+        ctk.CTkLabel(
+            self,
+            text=f"Delete '{self._disc.name}'?",
+            font=resources.font("heading"),
+            text_color=GEIST_TEXT
+        ).pack(pady=(20, 15))
+        
+        # Buttons
+        btn_frame = ctk.CTkFrame(self, fg_color="transparent")
+        btn_frame.pack()
+        
+        ctk.CTkButton(
+            btn_frame, text="Cancel", width=80, height=30,
+            fg_color="transparent", hover_color=GEIST_CARD,
+            border_width=1, border_color=GEIST_BORDER,
+            text_color=GEIST_TEXT,
+            command=self.destroy
+        ).pack(side="left", padx=8)
+        
+        ctk.CTkButton(
+            btn_frame, text="Delete", width=80, height=30,
+            fg_color=GEIST_DANGER, hover_color=GEIST_DANGER_HOVER,
+            text_color="#FFFFFF",
+            command=self._delete
+        ).pack(side="left", padx=8)
+    
+    def _delete(self) -> None:
+        """Close the dialog and delete the disc."""
+        self.destroy()
+        self._on_confirm(self._disc.id)
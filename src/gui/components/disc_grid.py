@@ -0,0 +1,293 @@
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+import customtkinter as ctk
+
+from src.services.collection_service import DiscWithStatus
+from src.services.image_loader import ImageLoader
+from src.gui.components.disc_card import DiscCard
+from src.gui.components.disc_tooltip import DiscTooltip
+from src.gui.layout import DEFAULT_COLUMNS, DEFAULT_ZOOM, RELAYOUT_DELAY_MS, ZOOM_LEVELS, CardZoom, compute_layout
+from src.gui.spatial_index import SpatialIndex
+from src.gui.theme import GEIST_BORDER, GEIST_TEXT_SECONDARY
+
+
+TOOLTIP_DELAY_MS = 400
+
+# Padding around each card in its grid cell, in unscaled pixels
+CARD_PAD = 4
+
+# Tk event.state modifier bits
+SHIFT_MASK = 0x0001
+CONTROL_MASK = 0x0004
+
+
+class DiscGrid(ctk.CTkScrollableFrame):
+    """Scrollable grid of disc cards.
+    
+    Pointer events from every card are routed through one bind tag to a
+    single set of handlers, which resolve the card under the pointer from a
+    spatial index of card rectangles. Cards bind nothing themselves.
+    
+    The column count follows the viewport width. Resize bursts are coalesced
+    into one relayout per frame, and only cards whose cell changed are
+    re-gridded.
+    """
+    
+    def __init__(
+        self,
+        parent,
+        image_loader: ImageLoader,
+        on_toggle: Callable[[str], None],
+        on_select: Callable[[str, bool], None],
+        on_delete: Callable[[str], None],
+        **kwargs
+    ):
+        super().__init__(
+            parent,
+            fg_color="transparent",
+            corner_radius=0,
+            scrollbar_button_color=GEIST_BORDER,
+            scrollbar_button_hover_color=GEIST_TEXT_SECONDARY,
+            **kwargs
+        )
+        
+        self._image_loader = image_loader
+        self._on_toggle = on_toggle
+        self._on_select = on_select
+        self._on_delete = on_delete
+        self._cards: Dict[str, DiscCard] = {}
+        self._shown_ids: List[str] = []
+        self._cells: Dict[str, Tuple[int, int]] = {}
+        self._columns = 0
+        self._zoom = ZOOM_LEVELS[DEFAULT_ZOOM]
+        self._relayout_after_id = None
+        self._hit_index: SpatialIndex[str] = SpatialIndex()
+        self._hit_index_dirty = True
+        self._hover_id: Optional[str] = None
+        self._tooltip = DiscTooltip(self)
+        self._tooltip_after_id = None
+        
+        self._set_columns(DEFAULT_COLUMNS)
+        
+        self._event_tag = f"DiscGrid{id(self)}"
+        self._add_event_tag(self)
+        self.bind_class(self._event_tag, "<Motion>", self._on_pointer_motion)
+        self.bind_class(self._event_tag, "<Leave>", self._on_pointer_leave)
+        self.bind_class(self._event_tag, "<Button-1>", self._on_pointer_click)
+        self.bind("<Configure>", self._invalidate_hit_index, add="+")
+        self._parent_canvas.bind("<Configure>", self._schedule_relayout, add="+")
+    
+    def __contains__(self, disc_id: str) -> bool:
+        return disc_id in self._cards
+    
+    def __len__(self) -> int:
+        return len(self._cards)
+    
+    def add_card(self, disc_status: DiscWithStatus) -> None:
+        """Create a card for a disc. It stays hidden until shown."""
+        image_path = self._image_loader.get_image_path(
+            disc_status.disc.id,
+            disc_status.disc.image_url
+        )
+        card = DiscCard(
+            self, disc_status, image_path,
+            on_delete=self._on_delete,
+            image_size=self._zoom.image_size
+        )
+        for widget in card.iter_widgets():
+            self._add_event_tag(widget)
+        self._cards[disc_status.disc.id] = card
+    
+    def remove_card(self, disc_id: str) -> None:
+        """Destroy a disc's card."""
+        card = self._cards.pop(disc_id, None)
+        if card is None:
+            return
+        self._cells.pop(disc_id, None)
+        if self._hover_id == disc_id:
+            self._set_hover(None)
+        card.destroy()
+        self._invalidate_hit_index()
+    
+    def show_cards(self, disc_ids: List[str]) -> None:
+        """Lay out the given cards in order and hide all others."""
+        shown = set(disc_ids)
+        for disc_id in self._shown_ids:
+            if disc_id not in shown and disc_id in self._cards:
+                self._cards[disc_id].grid_forget()
+                self._cells.pop(disc_id, None)
+        
+        self._shown_ids = list(disc_ids)
+        self._place_cards()
+    
+    def append_cards(self, disc_ids: List[str]) -> None:
+        """Lay out more cards after the shown ones, leaving those in place."""
+        start = len(self._shown_ids)
+        self._shown_ids.extend(disc_ids)
+        self._place_cards(start)
+    
+    def update_status(self, disc_id: str, owned: bool) -> None:
+        """Update a card's ownership display."""
+        if disc_id in self._cards:
+            self._cards[disc_id].update_status(owned)
+    
+    def refresh_image(self, disc_id: str) -> None:
+        """Look up a card's icon again, e.g. after it was downloaded."""
+        card = self._cards.get(disc_id)
+        if card is not None:
+            card.set_image_path(self._image_loader.get_image_path(card.disc.id, card.disc.image_url))
+    
+    def set_selected(self, selected_ids: Set[str], disc_ids: Optional[Iterable[str]] = None) -> None:
+        """Highlight exactly the selected cards, checking only `disc_ids` if given."""
+        for disc_id in self._cards if disc_ids is None else disc_ids:
+            self._cards[disc_id].set_selected(disc_id in selected_ids)
+    
+    def set_zoom(self, zoom: CardZoom) -> None:
+        """Resize every card's image and refit the columns."""
+        if zoom == self._zoom:
+            return
+        self._zoom = zoom
+        for card in self._cards.values():
+            card.set_image_size(zoom.image_size)
+        self._schedule_relayout()
+    
+    def _place_cards(self, start: int = 0) -> None:
+        """Grid shown cards in order from `start`, moving only those whose cell changed."""
+        for slot in range(start, len(self._shown_ids)):
+            disc_id = self._shown_ids[slot]
+            cell = divmod(slot, self._columns)
+            if self._cells.get(disc_id) != cell:
+                self._cards[disc_id].grid(row=cell[0], column=cell[1], padx=CARD_PAD, pady=CARD_PAD, sticky="nsew")
+                self._cells[disc_id] = cell
+        self._invalidate_hit_index()
+    
+    def _set_columns(self, columns: int) -> None:
+        """Give exactly `columns` grid columns equal weight."""
+        for i in range(columns, self._columns):
+            self.grid_columnconfigure(i, weight=0, uniform="")
+        for i in range(columns):
+            self.grid_columnconfigure(i, weight=1, uniform="disc")
+        self._columns = columns
+    
+    def _schedule_relayout(self, event=None) -> None:
+        """Coalesce a burst of viewport resizes into one relayout."""
+        if self._relayout_after_id is None:
+            self._relayout_after_id = self.after(RELAYOUT_DELAY_MS, self._relayout)
+    
+    def _relayout(self) -> None:
+        """Re-derive the column count from the viewport width."""
+        self._relayout_after_id = None
+        width = self._parent_canvas.winfo_width()
+        scaling = ctk.ScalingTracker.get_widget_scaling(self)
+        columns = compute_layout(width, scaling, min_card_width=self._zoom.min_card_width).columns
+        if columns != self._columns:
+            self._set_columns(columns)
+            self._place_cards()
+        else:
+            # Card sizes may have changed with the zoom level
+            self._invalidate_hit_index()
+    
+    def _add_event_tag(self, widget) -> None:
+        """Route a widget's pointer events to the grid handlers."""
+        widget.bindtags((self._event_tag,) + widget.bindtags())
+    
+    def _invalidate_hit_index(self, event=None) -> None:
+        """Mark card rectangles as stale after layout or resize."""
+        self._hit_index_dirty = True
+    
+    def _rebuild_hit_index(self) -> None:
+        """Record the rectangle of every shown card from the grid geometry.
+        
+        Columns are uniform and cards share one height, so the bounding box
+        of the occupied cells gives every slot's rectangle without asking
+        each card where it is.
+        """
+        # Size buckets from the layout, not a card that may not be mapped yet
+        scaling = ctk.ScalingTracker.get_widget_scaling(self)
+        self._hit_index.clear(round(max(self._zoom.min_card_width, self._zoom.card_height) * scaling))
+        self._hit_index_dirty = False
+        if not self._shown_ids:
+            return
+        
+        rows = (len(self._shown_ids) + self._columns - 1) // self._columns
+        x0, y0, width, height = self.grid_bbox(0, 0, self._columns - 1, rows - 1)
+        pitch_x, pitch_y = width / self._columns, height / rows
+        pad = round(CARD_PAD * scaling)
+        if pitch_x <= 2 * pad or pitch_y <= 2 * pad:
+            return  # Not laid out yet; the next <Configure> marks the index stale
+        
+        for slot, disc_id in enumerate(self._shown_ids):
+            if disc_id not in self._cards:
+                continue
+            row, col = divmod(slot, self._columns)
+            self._hit_index.insert(
+                disc_id,
+                round(x0 + col * pitch_x) + pad,
+                round(y0 + row * pitch_y) + pad,
+                round(pitch_x) - 2 * pad,
+                round(pitch_y) - 2 * pad
+            )
+    
+    def _card_at(self, x_root: int, y_root: int) -> Optional[str]:
+        """Resolve the card under a screen position."""
+        # Ignore cards scrolled out of view behind the header or below the window
+        viewport = self._parent_canvas
+        vx = x_root - viewport.winfo_rootx()
+        vy = y_root - viewport.winfo_rooty()
+        if not (0 <= vx < viewport.winfo_width() and 0 <= vy < viewport.winfo_height()):
+            return None
+        
+        if self._hit_index_dirty:
+            self._rebuild_hit_index()
+        return self._hit_index.hit(x_root - self.winfo_rootx(), y_root - self.winfo_rooty())
+    
+    def _on_pointer_motion(self, event) -> None:
+        """Track which card is under the pointer."""
+        self._set_hover(self._card_at(event.x_root, event.y_root))
+    
+    def _on_pointer_leave(self, event) -> None:
+        """Clear hover once the pointer leaves the grid entirely."""
+        self._set_hover(self._card_at(event.x_root, event.y_root))
+    
+    def _on_pointer_click(self, event) -> None:
+        """Dispatch a click to toggle or selection."""
+        disc_id = self._card_at(event.x_root, event.y_root)
+        if disc_id is None or self._cards[disc_id].is_delete_widget(event.widget):
+            return
+        
+        # Shift extends the selection as a range, Ctrl toggles a single card
+        if event.state & (SHIFT_MASK | CONTROL_MASK):
+            self._on_select(disc_id, bool(event.state & SHIFT_MASK))
+            return
+        self._on_toggle(disc_id)
+    
+    def _set_hover(self, disc_id: Optional[str]) -> None:
+        """Move the hover highlight and tooltip to another card."""
+        if disc_id == self._hover_id:
+            return
+        
+        if self._hover_id in self._cards:
+            self._cards[self._hover_id].set_hover(False)
+        self._cancel_tooltip()
+        self._tooltip.hide()
+        
+        self._hover_id = disc_id
+        if disc_id is not None:
+            self._cards[disc_id].set_hover(True)
+            self._tooltip_after_id = self.after(TOOLTIP_DELAY_MS, self._show_tooltip)
+    
+    def _cancel_tooltip(self) -> None:
+        """Cancel a scheduled tooltip."""
+        if self._tooltip_after_id:
+            self.after_cancel(self._tooltip_after_id)
+            self._tooltip_after_id = None
+    
+    def _show_tooltip(self) -> None:
+        """Show the tooltip next to the hovered card."""
+        self._tooltip_after_id = None
+        card = self._cards.get(self._hover_id)
+        if card is None:
+            return
+        
+        x = card.winfo_rootx() + card.winfo_width() + 5
+        y = card.winfo_rooty()
+        self._tooltip.show(card.disc, x, y)
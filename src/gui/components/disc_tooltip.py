@@ -0,0 +1,93 @@
+import customtkinter as ctk
+
+from src.models.disc import Disc
+from src.gui.theme import (
+    GEIST_CARD,
+    GEIST_BORDER,
+    GEIST_TEXT,
+    GEIST_TEXT_SECONDARY,
+    GEIST_TEXT_DIM,
+    resources,
+)
+
+
+class DiscTooltip:
+    """A single reusable tooltip window showing disc details.
+    
+    The toplevel and its labels are built once and then only reconfigured
+    and moved, instead of creating a new window for every hover.
+    """
+    
+    def __init__(self, parent):
+        self._parent = parent
+        self._window = None
+        self.disc = None
+    
+    def show(self, disc: Disc, x: int, y: int) -> None:
+        """Show details for a disc at root coordinates (x, y)."""
+        if self._window is None:
+            self._build()
+        
+        self.disc = disc
+        self.name_label.configure(text=disc.name)
+        self.artist_label.configure(text=f"by {disc.artist}")
+        
+        self.description_label.pack_forget()
+        self.obtain_label.pack_forget()
+        if disc.description:
+            self.description_label.configure(text=disc.description)
+            self.description_label.pack(anchor="w", padx=12, pady=(0, 6))
+        if disc.how_to_obtain:
+            self.obtain_label.configure(text=f"📍 {disc.how_to_obtain}")
+            self.obtain_label.pack(anchor="w", padx=12, pady=(0, 10))
+        
+        self._window.wm_geometry(f"+{x}+{y}")
+        self._window.deiconify()
+        self._window.lift()
+    
+    def hide(self) -> None:
+        """Hide the tooltip if it is showing."""
+        if self._window is not None and self.disc is not None:
+            self._window.withdraw()
+        self.disc = None
+    
+    def _build(self) -> None:
+        """Create the tooltip window and its labels."""
+        self._window = tw = ctk.CTkToplevel(self._parent)
+        tw.withdraw()
+        tw.wm_overrideredirect(True)
+        tw.configure(fg_color=GEIST_CARD)
+        
+        frame = ctk.CTkFrame(tw, fg_color=GEIST_CARD, corner_radius=8,
+                            border_width=1, border_color=GEIST_BORDER)
+        frame.pack(padx=1, pady=1)
+        
+        self.name_label = ctk.CTkLabel(
+            frame, text="",
+            font=resources.font("body_bold"),
+            text_color=GEIST_TEXT
+        )
+        self.name_label.pack(anchor="w", padx=12, pady=(10, 2))
+        
+        self.artist_label = ctk.CTkLabel(
+            frame, text="",
+            font=resources.font("caption"),
+            text_color=GEIST_TEXT_SECONDARY
+        )
+        self.artist_label.pack(anchor="w", padx=12, pady=(0, 6))
+        
+        self.description_label = ctk.CTkLabel(
+            frame, text="",
+            font=resources.font("caption"),
+            text_color=GEIST_TEXT_DIM,
+            wraplength=180,
+            justify="left"
+        )
+        
+        self.obtain_label = ctk.CTkLabel(
+            frame, text="",
+            font=resources.font("micro"),
+            text_color=GEIST_TEXT_DIM,
+            wraplength=180,
+            justify="left"
+        )
@@ -0,0 +1,77 @@
+import time
+import tkinter as tk
+from typing import List
+import customtkinter as ctk
+
+from src.models.history import WeeklyProgress
+from src.gui.theme import (
+    GEIST_CARD,
+    GEIST_BORDER,
+    GEIST_TEXT_SECONDARY,
+    GEIST_SUCCESS,
+    GEIST_DANGER,
+)
+
+AXIS_FONT = ("Segoe UI", 9)
+
+
+class HistoryChart(ctk.CTkFrame):
+    """A small bar chart of discs gained and lost per week."""
+    
+    def __init__(self, parent, height: int = 90, **kwargs):
+        super().__init__(
+            parent,
+            fg_color=GEIST_CARD,
+            corner_radius=8,
+            border_width=1,
+            border_color=GEIST_BORDER,
+            **kwargs
+        )
+        
+        self._series: List[WeeklyProgress] = []
+        self.canvas = tk.Canvas(
+            self,
+            height=height,
+            bg=GEIST_CARD,
+            highlightthickness=0
+        )
+        self.canvas.pack(fill="both", expand=True, padx=8, pady=8)
+        self.canvas.bind("<Configure>", lambda event: self._draw())
+    
+    def set_series(self, series: List[WeeklyProgress]) -> None:
+        """Replace the plotted weeks and redraw."""
+        self._series = series
+        self._draw()
+    
+    def _draw(self) -> None:
+        """Draw gained bars above and lost bars below the baseline."""
+        canvas = self.canvas
+        canvas.delete("all")
+        if not self._series:
+            return
+        
+        width = canvas.winfo_width()
+        height = canvas.winfo_height()
+        label_height = 14
+        baseline = (height - label_height) * 2 // 3
+        peak = max(max(week.gained, week.lost) for week in self._series) or 1
+        slot = width / len(self._series)
+        bar_width = max(slot * 0.6, 2)
+        
+        canvas.create_line(0, baseline, width, baseline, fill=GEIST_BORDER)
+        
+        for i, week in enumerate(self._series):
+            x0 = i * slot + (slot - bar_width) / 2
+            x1 = x0 + bar_width
+            if week.gained:
+                top = baseline - week.gained / peak * (baseline - 2)
+                canvas.create_rectangle(x0, top, x1, baseline, fill=GEIST_SUCCESS, width=0)
+            if week.lost:
+                bottom = baseline + week.lost / peak * (height - label_height - baseline - 2)
+                canvas.create_rectangle(x0, baseline, x1, bottom, fill=GEIST_DANGER, width=0)
+        
+        # Label the oldest and newest weeks
+        first = time.strftime("%b %d", time.localtime(self._series[0].week_start))
+        last = time.strftime("%b %d", time.localtime(self._series[-1].week_start))
+        canvas.create_text(0, height, text=first, anchor="sw", fill=GEIST_TEXT_SECONDARY, font=AXIS_FONT)
+        canvas.create_text(width, height, text=last, anchor="se", fill=GEIST_TEXT_SECONDARY, font=AXIS_FONT)
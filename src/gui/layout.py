@@ -0,0 +1,104 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+
+# Card geometry in unscaled pixels
+MIN_CARD_WIDTH = 130
+CARD_HEIGHT = 100
+CARD_GAP = 8
+MAX_COLUMNS = 12
+
+# Column count used before the viewport has been measured
+DEFAULT_COLUMNS = 5
+
+# Coalesce resize bursts into at most one relayout per frame
+RELAYOUT_DELAY_MS = 16
+
+
+@dataclass(frozen=True)
+class CardZoom:
+    """Card and icon geometry for one zoom level, in unscaled pixels."""
+    min_card_width: int
+    card_height: int
+    image_size: int
+
+
+# Card sizes offered by the zoom control
+ZOOM_LEVELS = {
+    "compact": CardZoom(min_card_width=100, card_height=76, image_size=24),
+    "normal": CardZoom(min_card_width=MIN_CARD_WIDTH, card_height=CARD_HEIGHT, image_size=36),
+    "large": CardZoom(min_card_width=180, card_height=148, image_size=72),
+}
+DEFAULT_ZOOM = "normal"
+
+
+@dataclass(frozen=True)
+class GridLayout:
+    """Column count and slot geometry for a card grid of a given width."""
+    columns: int
+    card_width: float
+    card_height: int
+    gap: int
+    
+    @property
+    def pitch_x(self) -> float:
+        return self.card_width + self.gap
+    
+    @property
+    def pitch_y(self) -> int:
+        return self.card_height + self.gap
+    
+    def cell(self, slot: int) -> Tuple[int, int]:
+        """Get the (row, column) of a slot."""
+        return divmod(slot, self.columns)
+    
+    def slot_origin(self, slot: int) -> Tuple[float, float]:
+        """Top-left coordinates of a slot."""
+        row, col = self.cell(slot)
+        return self.gap + col * self.pitch_x, self.gap + row * self.pitch_y
+    
+    def slot_at(self, x: float, y: float) -> Optional[int]:
+        """Get the slot containing a point, or None if it falls in a gap."""
+        x -= self.gap
+        y -= self.gap
+        if x < 0 or y < 0:
+            return None
+        
+        col, row = int(x // self.pitch_x), int(y // self.pitch_y)
+        if col >= self.columns:
+            return None
+        if x - col * self.pitch_x >= self.card_width or y - row * self.pitch_y >= self.card_height:
+            return None
+        return row * self.columns + col
+    
+    def content_height(self, count: int) -> int:
+        """Total height needed to show `count` cards."""
+        rows = (count + self.columns - 1) // self.columns
+        return self.gap + rows * self.pitch_y
+    
+    def visible_slots(self, top: float, bottom: float, count: int) -> range:
+        """Slots whose rows intersect the vertical range [top, bottom)."""
+        first_row = max(int(top // self.pitch_y), 0)
+        last_row = int(bottom // self.pitch_y) + 1
+        return range(first_row * self.columns, min((last_row + 1) * self.columns, count))
+
+
+def compute_layout(
+    viewport_width: float,
+    scaling: float = 1.0,
+    min_card_width: int = MIN_CARD_WIDTH,
+    card_height: int = CARD_HEIGHT,
+    gap: int = CARD_GAP
+) -> GridLayout:
+    """Fit as many columns as the viewport allows without crushing cards."""
+    min_width = min_card_width * scaling
+    gap = round(gap * scaling)
+    columns = int((viewport_width - gap) // (min_width + gap))
+    columns = min(max(columns, 1), MAX_COLUMNS)
+    card_width = max((viewport_width - gap * (columns + 1)) / columns, 1)
+    return GridLayout(
+        columns=columns,
+        card_width=card_width,
+        card_height=round(card_height * scaling),
+        gap=gap
+    )
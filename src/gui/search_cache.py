@@ -0,0 +1,57 @@
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# Recent queries whose results are kept for refining and backspacing
+MAX_CACHED_QUERIES = 32
+
+
+class SearchCache:
+    """Recent search results, reused when a query is refined.
+    
+    Matching is by substring, so every result for "cat" is also a result for
+    "ca" (or "at"). A new query only filters the smallest cached result set
+    whose query it contains, and backspacing to an earlier query is a cache
+    hit. Results are kept in catalog order.
+    """
+    
+    def __init__(self, max_queries: int = MAX_CACHED_QUERIES):
+        self._max_queries = max_queries
+        self._texts: Dict[str, str] = {}
+        self._all_ids: List[str] = []
+        self._results: "OrderedDict[str, List[str]]" = OrderedDict()
+    
+    def reset(self, items: Iterable[Tuple[str, str]]) -> None:
+        """Replace the searchable (id, text) pairs and drop all cached results."""
+        self._texts = {item_id: text.lower() for item_id, text in items}
+        self._all_ids = list(self._texts)
+        self._results.clear()
+    
+    def get(self, query: str) -> Optional[List[str]]:
+        """Cached results for a normalized query, or None on a miss."""
+        if not query:
+            return self._all_ids
+        results = self._results.get(query)
+        if results is not None:
+            self._results.move_to_end(query)
+        return results
+    
+    def candidates(self, query: str) -> List[str]:
+        """The smallest cached result set that must contain every match for `query`."""
+        best = self._all_ids
+        for cached_query, results in self._results.items():
+            if cached_query in query and len(results) < len(best):
+                best = results
+        return best
+    
+    def matches(self, query: str, ids: Iterable[str]) -> List[str]:
+        """Filter IDs whose text contains the query."""
+        texts = self._texts
+        return [item_id for item_id in ids if query in texts[item_id]]
+    
+    def store(self, query: str, results: List[str]) -> None:
+        """Remember a query's results, evicting the least recently used."""
+        self._results[query] = results
+        self._results.move_to_end(query)
+        while len(self._results) > self._max_queries:
+            self._results.popitem(last=False)
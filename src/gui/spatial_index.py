@@ -0,0 +1,49 @@
+from typing import Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+
+K = TypeVar("K", bound=Hashable)
+
+
+class SpatialIndex(Generic[K]):
+    """Uniform-grid bucket index for hit-testing rectangles.
+    
+    Each rectangle is registered in every bucket it overlaps. With a bucket
+    size close to the rectangle size, a point lookup only has to check the
+    handful of rectangles in a single bucket, whatever the total count.
+    """
+    
+    def __init__(self, bucket_size: int = 64):
+        self._bucket_size = max(bucket_size, 1)
+        self._buckets: Dict[Tuple[int, int], List[Tuple[K, int, int, int, int]]] = {}
+        self._rects: Dict[K, Tuple[int, int, int, int]] = {}
+    
+    def __len__(self) -> int:
+        return len(self._rects)
+    
+    def clear(self, bucket_size: Optional[int] = None) -> None:
+        """Remove all rectangles, optionally changing the bucket size."""
+        if bucket_size:
+            self._bucket_size = max(bucket_size, 1)
+        self._buckets.clear()
+        self._rects.clear()
+    
+    def insert(self, key: K, x: int, y: int, width: int, height: int) -> None:
+        """Register a rectangle for a key."""
+        x1, y1 = x + width, y + height
+        self._rects[key] = (x, y, x1, y1)
+        size = self._bucket_size
+        for bx in range(x // size, (x1 - 1) // size + 1):
+            for by in range(y // size, (y1 - 1) // size + 1):
+                self._buckets.setdefault((bx, by), []).append((key, x, y, x1, y1))
+    
+    def rect(self, key: K) -> Optional[Tuple[int, int, int, int]]:
+        """Get the (x0, y0, x1, y1) rectangle registered for a key."""
+        return self._rects.get(key)
+    
+    def hit(self, x: int, y: int) -> Optional[K]:
+        """Get the key whose rectangle contains the point, if any."""
+        size = self._bucket_size
+        for key, x0, y0, x1, y1 in self._buckets.get((x // size, y // size), ()):
+            if x0 <= x < x1 and y0 <= y < y1:
+                return key
+        return None
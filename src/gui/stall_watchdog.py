@@ -0,0 +1,126 @@
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass
+from types import FrameType
+from typing import Deque, Optional, Tuple
+import tkinter
+import customtkinter as ctk
+
+
+logger = logging.getLogger(__name__)
+
+# Frames from these packages are event loop plumbing, not the callback
+_TK_DIRS = tuple(os.path.dirname(module.__file__) + os.sep for module in (tkinter, ctk))
+_SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) + os.sep
+
+# Stalls kept for inspection, newest last
+MAX_RECORDED_STALLS = 50
+
+
+@dataclass
+class Stall:
+    """A period during which the Tk main loop did not run."""
+    duration_ms: float
+    callback: str
+    stack: str
+
+
+class StallWatchdog:
+    """Detects main-loop stalls and attributes them to the running callback.
+    
+    A heartbeat scheduled with after() records when the main loop last ran.
+    A helper thread watches the heartbeat; once it is late by more than the
+    threshold, the thread samples the main thread's stack. When the loop
+    recovers, the stall is logged with its duration and the callback that
+    was running.
+    """
+    
+    def __init__(self, root: tkinter.Misc, threshold_ms: int = 200, heartbeat_ms: int = 50):
+        self._root = root
+        self._threshold = threshold_ms / 1000
+        self._heartbeat_ms = heartbeat_ms
+        self._main_thread_id = threading.main_thread().ident
+        self._last_beat = time.monotonic()
+        self._sample: Optional[Tuple[str, str]] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._after_id = None
+        self.stalls: Deque[Stall] = deque(maxlen=MAX_RECORDED_STALLS)
+    
+    def start(self) -> None:
+        """Start the heartbeat and the watching thread."""
+        self._last_beat = time.monotonic()
+        self._after_id = self._root.after(self._heartbeat_ms, self._beat)
+        threading.Thread(target=self._watch, name="StallWatchdog", daemon=True).start()
+    
+    def stop(self) -> None:
+        """Stop watching."""
+        self._stop.set()
+        if self._after_id:
+            self._root.after_cancel(self._after_id)
+            self._after_id = None
+    
+    def _beat(self) -> None:
+        """Heartbeat on the Tk thread; reports the stall it just recovered from."""
+        now = time.monotonic()
+        with self._lock:
+            late = now - self._last_beat - self._heartbeat_ms / 1000
+            self._last_beat = now
+            sample, self._sample = self._sample, None
+        
+        if late > self._threshold:
+            callback, stack = sample or ("<not sampled>", "")
+            stall = Stall(duration_ms=late * 1000, callback=callback, stack=stack)
+            self.stalls.append(stall)
+            logger.warning("UI stalled for %.0f ms in %s\n%s", stall.duration_ms, callback, stack)
+        
+        self._after_id = self._root.after(self._heartbeat_ms, self._beat)
+    
+    def _watch(self) -> None:
+        """Helper thread: sample the main thread once per stall."""
+        interval = self._threshold / 4
+        while not self._stop.wait(interval):
+            with self._lock:
+                overdue = time.monotonic() - self._last_beat - self._heartbeat_ms / 1000
+                if overdue <= self._threshold or self._sample is not None:
+                    continue
+                frame = sys._current_frames().get(self._main_thread_id)
+                if frame is not None:
+                    self._sample = (_describe_callback(frame), "".join(traceback.format_stack(frame)))
+
+
+def _describe_callback(frame: FrameType) -> str:
+    """Name the callback Tk was running when a stack was sampled.
+    
+    That is the first app frame called from inside the event loop, or the
+    innermost frame if the stall is inside Tk or CustomTkinter code.
+    """
+    frames = []
+    while frame is not None:
+        frames.append(frame)
+        frame = frame.f_back
+    frames.reverse()
+    
+    in_loop = False
+    chosen = frames[-1]
+    for f in frames:
+        filename = os.path.abspath(f.f_code.co_filename)
+        if filename.startswith(_TK_DIRS):
+            in_loop = True
+        elif in_loop and filename.startswith(_SRC_DIR):
+            chosen = f
+            break
+    
+    code = chosen.f_code
+    name = getattr(code, "co_qualname", code.co_name)
+    try:
+        filename = os.path.relpath(code.co_filename)
+    except ValueError:
+        # On Windows, a file on another drive than the working directory
+        filename = os.path.abspath(code.co_filename)
+    return f"{name} ({filename}:{chosen.f_lineno})"
@@ -0,0 +1,224 @@
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Tuple
+import customtkinter as ctk
+from PIL import Image, ImageDraw, ImageTk
+
+from src.services.image_loader import ImageLoader, ImageSource
+from src.services.memory_diagnostics import deep_sizeof
+from src.gui.tk_dispatcher import TkDispatcher
+
+
+# Geist-like Design System Colors
+GEIST_BG = "#000000"
+GEIST_CARD = "#111111"
+GEIST_CARD_HOVER = "#1A1A1A"
+GEIST_CARD_SELECTED = "#0A2A4A"
+GEIST_BORDER = "#333333"
+GEIST_BORDER_ACTIVE = "#FFFFFF"
+GEIST_TEXT = "#EDEDED"
+GEIST_TEXT_SECONDARY = "#888888"
+GEIST_TEXT_DIM = "#666666"
+GEIST_ACCENT = "#FFFFFF"
+GEIST_SUCCESS = "#45A557"
+GEIST_DANGER = "#FF4444"
+GEIST_DANGER_HOVER = "#CC3333"
+GEIST_DANGER_SUBTLE = "#331111"
+GEIST_ERROR = "#FF0000"
+GEIST_PRIMARY_HOVER = "#CCCCCC"
+
+# Font roles used across components
+FONT_SPECS: Dict[str, dict] = {
+    "title": {"family": "Segoe UI", "size": 18, "weight": "bold"},
+    "heading": {"size": 14},
+    "heading_bold": {"size": 14, "weight": "bold"},
+    "body": {"size": 13},
+    "body_bold": {"size": 13, "weight": "bold"},
+    "label": {"size": 12},
+    "caption": {"size": 11},
+    "micro": {"size": 10},
+}
+
+APP_ICON_PATH = Path(__file__).parent.parent.parent / "data" / "app-icon" / "icon.ico"
+
+
+class _ThumbnailImage(ctk.CTkImage):
+    """A CTkImage drawn from the nearest prebuilt thumbnail level.
+    
+    Plain CTkImage keeps one source image and resamples it for every
+    scaling factor; this one asks the loader for the level that suits each
+    scaled size instead, so a DPI change never touches the original.
+    """
+    
+    def __init__(self, loader: ImageLoader, source: ImageSource, base: Image.Image, size: Tuple[int, int]):
+        self._loader = loader
+        self._source = source
+        super().__init__(light_image=base, size=size)
+    
+    def _get_scaled_light_photo_image(self, scaled_size: Tuple[int, int]) -> ImageTk.PhotoImage:
+        photo = self._scaled_light_photo_images.get(scaled_size)
+        if photo is None:
+            level = self._loader.thumbnail(self._source, max(scaled_size)) or self._light_image
+            if level.size != scaled_size:
+                level = level.resize(scaled_size, Image.LANCZOS)
+            photo = ImageTk.PhotoImage(level)
+            self._scaled_light_photo_images[scaled_size] = photo
+        return photo
+
+
+class ResourceRegistry:
+    """Shared fonts and images for all GUI components.
+    
+    Tk fonts and images can only be created once a root window exists, so
+    everything is created lazily on first use and then reused by every card,
+    tooltip and dialog.
+    """
+    
+    def __init__(self):
+        self._fonts: Dict[str, ctk.CTkFont] = {}
+        self._images: Dict[Tuple[ImageSource, Tuple[int, int]], ctk.CTkImage] = {}
+        self._placeholders: Dict[Tuple[int, int], ctk.CTkImage] = {}
+        self._photo_images: Dict[Tuple[ImageSource, int], ImageTk.PhotoImage] = {}
+        self._image_loader: Optional[ImageLoader] = None
+        self._dispatcher: Optional[TkDispatcher] = None
+    
+    def use_image_loader(self, loader: ImageLoader, dispatcher: Optional[TkDispatcher] = None) -> None:
+        """Set where disc icons come from; the app does this before creating cards.
+        
+        With a dispatcher, icons whose thumbnails are not built yet are built
+        in the background instead of on the Tk thread.
+        """
+        self._image_loader = loader
+        self._dispatcher = dispatcher
+    
+    def font(self, role: str) -> ctk.CTkFont:
+        """Get the shared font for a role."""
+        font = self._fonts.get(role)
+        if font is None:
+            font = ctk.CTkFont(**FONT_SPECS[role])
+            self._fonts[role] = font
+        return font
+    
+    def canvas_font(self, role: str, scaling: float) -> tuple:
+        """Get a font description for drawing on a plain tk.Canvas.
+        
+        CTk widgets scale their fonts themselves; canvas text has to be given
+        the scaled size directly.
+        """
+        return self.font(role).create_scaled_tuple(scaling)
+    
+    def image(
+        self,
+        path: ImageSource,
+        size: Tuple[int, int],
+        on_ready: Optional[Callable[[], None]] = None
+    ) -> Optional[ctk.CTkImage]:
+        """Get a shared image for a file or pack icon, or None if it cannot be loaded yet.
+        
+        `on_ready` is called on the Tk thread once a thumbnail being built in
+        the background can be shown.
+        """
+        key = (path, size)
+        image = self._images.get(key)
+        if image is None:
+            base = self._thumbnail(path, max(size), on_ready)
+            if base is None:
+                return None
+            image = _ThumbnailImage(self._image_loader, path, base, size)
+            self._images[key] = image
+        return image
+    
+    def photo_image(
+        self,
+        path: ImageSource,
+        size: int,
+        on_ready: Optional[Callable[[], None]] = None
+    ) -> Optional[ImageTk.PhotoImage]:
+        """Get a shared, pre-scaled Tk image for drawing on a plain tk.Canvas.
+        
+        Like image(), returns None while the thumbnail is built in the background.
+        """
+        key = (path, size)
+        image = self._photo_images.get(key)
+        if image is None:
+            level = self._thumbnail(path, size, on_ready)
+            if level is None:
+                return None
+            if level.width != size:
+                level = level.resize((size, size), Image.LANCZOS)
+            image = ImageTk.PhotoImage(level)
+            self._photo_images[key] = image
+        return image
+    
+    def _thumbnail(
+        self,
+        path: ImageSource,
+        pixels: int,
+        on_ready: Optional[Callable[[], None]]
+    ) -> Optional[Image.Image]:
+        """Get a thumbnail level without building its pyramid on the Tk thread."""
+        loader = self._image_loader
+        if loader is None:
+            return None
+        if self._dispatcher is None:
+            return loader.thumbnail(path, pixels)
+        
+        level = loader.thumbnail(path, pixels, build=False)
+        if level is None:
+            future = loader.request_thumbnail(path, pixels)
+            if future is not None and on_ready is not None:
+                self._dispatcher.then(future, lambda _: on_ready())
+        return level
+    
+    def release_images(self, keep_sizes: Iterable[int]) -> None:
+        """Drop shared disc images of sizes no longer shown, e.g. after a zoom change.
+        
+        `keep_sizes` are widths: display units for CTk images and pixels for
+        canvas images. Widgets still using a dropped image keep it alive.
+        """
+        keep = set(keep_sizes)
+        self._images = {key: image for key, image in self._images.items() if key[1][0] in keep}
+        self._photo_images = {key: image for key, image in self._photo_images.items() if key[1] in keep}
+        self._placeholders = {size: image for size, image in self._placeholders.items() if size[0] in keep}
+    
+    def font_usage(self) -> Tuple[int, int]:
+        """Count shared fonts and estimate their Python-side size in bytes."""
+        return len(self._fonts), deep_sizeof(list(self._fonts.values()))
+    
+    def image_usage(self) -> Tuple[int, int]:
+        """Count shared images and estimate their pixel memory in bytes.
+        
+        A CTkImage keeps its source image plus one Tk copy per scaling
+        factor it has been drawn at; all are counted as 4 bytes per pixel.
+        """
+        size = 0
+        for image in (*self._images.values(), *self._placeholders.values()):
+            light, dark = image.cget("light_image"), image.cget("dark_image")
+            for source in (light, dark if dark is not light else None):
+                if source is not None:
+                    size += source.width * source.height * 4
+            for photo in getattr(image, "_scaled_light_photo_images", {}).values():
+                size += photo.width() * photo.height() * 4
+        for photo in self._photo_images.values():
+            size += photo.width() * photo.height() * 4
+        
+        count = len(self._images) + len(self._placeholders) + len(self._photo_images)
+        return count, size
+    
+    def placeholder_image(self, size: Tuple[int, int]) -> ctk.CTkImage:
+        """Get the shared "no icon" disc placeholder."""
+        image = self._placeholders.get(size)
+        if image is None:
+            # Draw at 4x and let CTkImage downscale for smooth edges
+            width, height = size[0] * 4, size[1] * 4
+            pil_image = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+            inset = width // 5
+            ImageDraw.Draw(pil_image).ellipse(
+                (inset, inset, width - inset, height - inset),
+                fill=GEIST_TEXT_SECONDARY
+            )
+            image = ctk.CTkImage(pil_image, size=size)
+            self._placeholders[size] = image
+        return image
+
+
+resources = ResourceRegistry()
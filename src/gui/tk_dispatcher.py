@@ -0,0 +1,69 @@
+import logging
+import queue
+from concurrent.futures import Future
+from typing import Callable, Optional
+
+import tkinter
+
+
+logger = logging.getLogger(__name__)
+
+# How often the Tk thread drains callbacks posted from worker threads
+DISPATCH_POLL_MS = 16
+
+
+class TkDispatcher:
+    """Runs callbacks posted from worker threads on the Tk thread.
+    
+    Tk may only be used from the thread running the main loop, so workers
+    post to a thread-safe queue that the Tk thread drains with after().
+    Callbacks run in the order they were posted.
+    """
+    
+    def __init__(self, root: tkinter.Misc, poll_ms: int = DISPATCH_POLL_MS):
+        self._root = root
+        self._poll_ms = poll_ms
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._after_id = root.after(poll_ms, self._drain)
+    
+    def call_soon(self, callback: Callable, *args) -> None:
+        """Schedule a callback on the Tk thread. Safe to call from any thread."""
+        self._queue.put((callback, args))
+    
+    def then(
+        self,
+        future: Future,
+        on_result: Callable,
+        on_error: Optional[Callable[[BaseException], None]] = None
+    ) -> None:
+        """Deliver a future's result (or exception) to the Tk thread."""
+        future.add_done_callback(lambda done: self.call_soon(self._settle, done, on_result, on_error))
+    
+    def stop(self) -> None:
+        """Stop draining; callbacks still queued are dropped."""
+        if self._after_id:
+            self._root.after_cancel(self._after_id)
+            self._after_id = None
+    
+    def _settle(self, future: Future, on_result: Callable, on_error: Optional[Callable]) -> None:
+        """Call the result or error handler for a finished future."""
+        error = future.exception()
+        if error is None:
+            on_result(future.result())
+        elif on_error:
+            on_error(error)
+        else:
+            logger.error("Error in background task", exc_info=error)
+    
+    def _drain(self) -> None:
+        """Run everything posted since the last poll."""
+        while True:
+            try:
+                callback, args = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback(*args)
+            except Exception:
+                logger.exception("Error in Tk callback %r", callback)
+        self._after_id = self._root.after(self._poll_ms, self._drain)
@@ -2,34 +2,114 @@
 Minecraft Music Disc Tracker
 A GUI application to track your Minecraft music disc collection.
 """
+import argparse
+import logging
 import sys
 from pathlib import Path
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.repositories import JsonDiscRepository, JsonCollectionRepository
-from src.services import CollectionService, ImageLoader
+from src.repositories import (
+    JsonCollectionRepository,
+    BinaryHistoryRepository,
+    DiscPackLibrary,
+    open_disc_repository,
+)
+from src.services import (
+    AsyncCollectionService,
+    CollectionService,
+    IconFetcher,
+    IconStore,
+    ImageLoader,
+    MemoryDiagnostics,
+)
 from src.gui import App
+from src.gui.app import GRID_RENDERERS
+from src.gui.layout import DEFAULT_ZOOM, ZOOM_LEVELS
+from src.gui.stall_watchdog import StallWatchdog
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Track your Minecraft music disc collection.")
+    parser.add_argument(
+        "--renderer",
+        choices=sorted(GRID_RENDERERS),
+        default="widgets",
+        help="how the disc grid is drawn: one widget tree per card, or a single canvas"
+    )
+    parser.add_argument(
+        "--zoom",
+        choices=list(ZOOM_LEVELS),
+        default=DEFAULT_ZOOM,
+        help="initial card size; it can also be changed next to the search bar"
+    )
+    parser.add_argument(
+        "--eager-startup",
+        action="store_true",
+        help="build every card before showing the window instead of progressively"
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="never download missing disc icons from their image URLs"
+    )
+    parser.add_argument(
+        "--debug-memory",
+        action="store_true",
+        help="trace allocations and print a per-subsystem memory report on F12"
+    )
+    parser.add_argument(
+        "--watchdog-ms",
+        type=int,
+        metavar="MS",
+        help="log the callback and stack whenever the UI stops responding for longer than MS"
+    )
+    return parser.parse_args(argv)
 
 
 def main():
     """Entry point for the application."""
+    args = parse_args()
+    logging.basicConfig(format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    # Start tracing first so startup allocations show up in reports
+    memory_diagnostics = MemoryDiagnostics() if args.debug_memory else None
+    
     # Paths
     base_path = Path(__file__).parent.parent
     data_path = base_path / "data"
     disc_icons_path = data_path / "disc-icons"
     
     # Initialize repositories (Dependency Injection)
-    disc_repo = JsonDiscRepository(data_path / "discs.json")
+    packs = DiscPackLibrary(data_path / "packs", data_path / "packs.json")
     collection_repo = JsonCollectionRepository(data_path / "collection.json")
+    history_repo = BinaryHistoryRepository(data_path / "history.bin", data_path / "history_ids.txt")
     
-    # Initialize services
-    image_loader = ImageLoader(disc_icons_path)
-    collection_service = CollectionService(disc_repo, collection_repo)
+    # Initialize services. Loading the catalog and collection, and scanning
+    # icons, run on background threads while Tk starts up; the first call
+    # that needs a result waits for it
+    collection_service = AsyncCollectionService(
+        lambda: CollectionService(open_disc_repository(data_path, packs), collection_repo, history_repo)
+    )
+    fetcher = None if args.offline else IconFetcher(data_path / "icon-cache")
+    image_loader = ImageLoader(
+        disc_icons_path, packs, data_path / "thumbnails", fetcher,
+        store=IconStore(data_path / "icon-store")
+    )
+    image_loader.warm_up()
     
     # Create and run app
-    app = App(collection_service, image_loader)
+    app = App(
+        collection_service,
+        image_loader,
+        renderer=args.renderer,
+        progressive=not args.eager_startup,
+        memory_diagnostics=memory_diagnostics,
+        zoom=args.zoom
+    )
+    if args.watchdog_ms:
+        StallWatchdog(app, threshold_ms=args.watchdog_ms).start()
     app.mainloop()
 
 
@@ -1,4 +1,15 @@
 from .disc import Disc
 from .collection import Collection, CollectionEntry
+from .history import HistoryEvent, ProgressHistory, WeeklyProgress
+from .completion import CompletionStats, GroupProgress
 
-__all__ = ["Disc", "Collection", "CollectionEntry"]
+__all__ = [
+    "Disc",
+    "Collection",
+    "CollectionEntry",
+    "HistoryEvent",
+    "ProgressHistory",
+    "WeeklyProgress",
+    "CompletionStats",
+    "GroupProgress"
+]
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Dict
+from typing import Dict, Iterable, List, Set
 
 
 @dataclass
@@ -17,6 +17,9 @@ class CollectionEntry:
 class Collection:
     """Represents a user's complete music disc collection."""
     entries: Dict[str, CollectionEntry] = field(default_factory=dict)
+    # IDs changed locally since the last pop_changes(), so saves can be
+    # merged with edits other processes made to the same file
+    changed_ids: Set[str] = field(default_factory=set, repr=False, compare=False)
     
     def get_entry(self, disc_id: str) -> CollectionEntry:
         """Get or create a collection entry for a disc."""
@@ -28,8 +31,40 @@ class Collection:
         """Toggle ownership of a disc. Returns new ownership status."""
         entry = self.get_entry(disc_id)
         entry.toggle_ownership()
+        self.changed_ids.add(disc_id)
         return entry.owned
     
+    def set_owned_many(self, disc_ids: Iterable[str], owned: bool) -> List[str]:
+        """Set ownership of several discs in one pass. Returns IDs that changed."""
+        changed = []
+        for disc_id in disc_ids:
+            entry = self.get_entry(disc_id)
+            if entry.owned != owned:
+                entry.owned = owned
+                changed.append(disc_id)
+        self.changed_ids.update(changed)
+        return changed
+    
+    def pop_changes(self) -> Dict[str, bool]:
+        """Get {disc_id: owned} for local changes since the last call, and reset them."""
+        changes = {disc_id: self.is_owned(disc_id) for disc_id in self.changed_ids}
+        self.changed_ids.clear()
+        return changes
+    
+    def merge_from(self, other: "Collection") -> Dict[str, bool]:
+        """Adopt the ownership states of another collection.
+        
+        Returns {disc_id: owned} for discs whose status changed. Merged
+        changes are not recorded as local changes.
+        """
+        changed = {}
+        for disc_id in self.entries.keys() | other.entries.keys():
+            owned = other.is_owned(disc_id)
+            if self.is_owned(disc_id) != owned:
+                self.get_entry(disc_id).owned = owned
+                changed[disc_id] = owned
+        return changed
+    
     def is_owned(self, disc_id: str) -> bool:
         """Check if a disc is owned."""
         return self.entries.get(disc_id, CollectionEntry(disc_id=disc_id)).owned
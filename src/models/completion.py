@@ -0,0 +1,100 @@
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from src.models.disc import Disc
+
+
+# Dimensions a completion breakdown can be grouped by
+BY_ARTIST = "artist"
+BY_SOURCE = "source"
+
+# Group for discs that leave the grouping field empty
+UNKNOWN_GROUP = "Unknown"
+
+
+@dataclass
+class GroupProgress:
+    """Owned and total disc counts for one artist or obtain source."""
+    name: str
+    owned: int = 0
+    total: int = 0
+    
+    @property
+    def fraction(self) -> float:
+        """Share of the group's discs that are owned."""
+        return self.owned / self.total if self.total else 0.0
+
+
+def obtain_sources(how_to_obtain: str) -> List[str]:
+    """Split a how-to-obtain description into its individual sources."""
+    sources = [part.strip() for part in how_to_obtain.split(",")]
+    return [source for source in sources if source] or [UNKNOWN_GROUP]
+
+
+class CompletionStats:
+    """Completion per artist and per obtain source, kept up to date incrementally.
+    
+    Discs are grouped once when the stats are built. Afterwards adding,
+    removing or toggling a disc only adjusts the counters of the groups
+    that disc belongs to, without scanning the catalog.
+    """
+    
+    def __init__(self):
+        self._groups: Dict[str, Dict[str, GroupProgress]] = {BY_ARTIST: {}, BY_SOURCE: {}}
+        # Disc ID -> ((dimension, counter) pairs it contributes to, counted as owned)
+        self._discs: Dict[str, Tuple[List[Tuple[str, GroupProgress]], bool]] = {}
+    
+    @classmethod
+    def build(cls, discs: Iterable[Disc], is_owned: Callable[[str], bool]) -> "CompletionStats":
+        """Group a whole catalog."""
+        stats = cls()
+        for disc in discs:
+            stats.add(disc, is_owned(disc.id))
+        return stats
+    
+    def add(self, disc: Disc, owned: bool) -> None:
+        """Count a disc that joined the catalog."""
+        if disc.id in self._discs:
+            self.remove(disc.id)
+        
+        keys = [(BY_ARTIST, disc.artist.strip() or UNKNOWN_GROUP)]
+        # A source listed twice for one disc still counts the disc once
+        keys.extend((BY_SOURCE, source) for source in dict.fromkeys(obtain_sources(disc.how_to_obtain)))
+        
+        counters = []
+        for dimension, name in keys:
+            groups = self._groups[dimension]
+            counter = groups.get(name)
+            if counter is None:
+                counter = groups[name] = GroupProgress(name)
+            counter.total += 1
+            counter.owned += owned
+            counters.append((dimension, counter))
+        self._discs[disc.id] = (counters, owned)
+    
+    def remove(self, disc_id: str) -> None:
+        """Stop counting a disc that left the catalog."""
+        entry = self._discs.pop(disc_id, None)
+        if entry is None:
+            return
+        counters, owned = entry
+        for dimension, counter in counters:
+            counter.total -= 1
+            counter.owned -= owned
+            if counter.total == 0:
+                del self._groups[dimension][counter.name]
+    
+    def set_owned(self, disc_id: str, owned: bool) -> None:
+        """Move a disc between owned and missing. Unknown IDs are ignored."""
+        entry = self._discs.get(disc_id)
+        if entry is None or entry[1] == owned:
+            return
+        counters = entry[0]
+        for _, counter in counters:
+            counter.owned += 1 if owned else -1
+        self._discs[disc_id] = (counters, owned)
+    
+    def breakdown(self, dimension: str) -> List[GroupProgress]:
+        """Copies of every group's counts for a dimension, largest groups first."""
+        groups = self._groups[dimension].values()
+        return [replace(group) for group in sorted(groups, key=lambda g: (-g.total, g.name))]
@@ -0,0 +1,157 @@
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+
+WEEK_SECONDS = 7 * 24 * 60 * 60
+
+
+@dataclass(frozen=True)
+class HistoryEvent:
+    """A single ownership change in the progress log."""
+    timestamp: int
+    ordinal: int
+    owned: bool
+
+
+@dataclass
+class WeeklyProgress:
+    """Discs gained and lost during one week."""
+    week_start: int
+    gained: int
+    lost: int
+    
+    @property
+    def net(self) -> int:
+        """Net change in owned discs for the week."""
+        return self.gained - self.lost
+
+
+class ProgressHistory:
+    """Time-ordered log of ownership changes with rolling weekly aggregates.
+    
+    Disc IDs are mapped to small ordinals so the log can store fixed-width
+    records. Aggregates are kept as prefix sums per bucket, so any time-window
+    query is answered in O(1) without replaying events. Events usually arrive
+    in time order; an older one (e.g. merged from another process's log)
+    costs one pass over the later buckets.
+    """
+    
+    def __init__(self, disc_ids: Optional[List[str]] = None, bucket_seconds: int = WEEK_SECONDS):
+        self.disc_ids: List[str] = list(disc_ids or [])
+        self._ordinals: Dict[str, int] = {disc_id: i for i, disc_id in enumerate(self.disc_ids)}
+        self._bucket_seconds = bucket_seconds
+        self._first_bucket: Optional[int] = None
+        self._gained_prefix: List[int] = []
+        self._lost_prefix: List[int] = []
+        self.last_timestamp = 0
+        self.event_count = 0
+    
+    def ordinal_for(self, disc_id: str) -> int:
+        """Get or assign the ordinal for a disc ID."""
+        ordinal = self._ordinals.get(disc_id)
+        if ordinal is None:
+            ordinal = len(self.disc_ids)
+            self.disc_ids.append(disc_id)
+            self._ordinals[disc_id] = ordinal
+        return ordinal
+    
+    def adopt_ids(self, start: int, stored: List[str]) -> Dict[int, int]:
+        """Take on disc IDs another process stored from ordinal `start` on.
+        
+        IDs this history assigned from `start` on but has not stored yet move
+        after them. Returns the old -> new ordinal of every moved ID.
+        """
+        unsaved = self.disc_ids[start:]
+        self.disc_ids[start:] = stored
+        self._ordinals = {disc_id: i for i, disc_id in enumerate(self.disc_ids)}
+        moved = {}
+        for old, disc_id in enumerate(unsaved, start):
+            new = self.ordinal_for(disc_id)
+            if new != old:
+                moved[old] = new
+        return moved
+    
+    def record(self, disc_id: str, owned: bool, timestamp: int) -> HistoryEvent:
+        """Record an ownership change. Returns the event to persist."""
+        # Keep the log time-ordered even if the clock goes backwards
+        event = HistoryEvent(
+            timestamp=max(timestamp, self.last_timestamp),
+            ordinal=self.ordinal_for(disc_id),
+            owned=owned
+        )
+        self.apply(event)
+        return event
+    
+    def apply(self, event: HistoryEvent) -> None:
+        """Fold an event into the rolling aggregates, whenever it happened."""
+        bucket = event.timestamp // self._bucket_seconds
+        if self._first_bucket is None:
+            self._first_bucket = bucket
+        elif bucket < self._first_bucket:
+            # Older than anything so far: add empty buckets in front
+            padding = [0] * (self._first_bucket - bucket)
+            self._gained_prefix[:0] = padding
+            self._lost_prefix[:0] = padding
+            self._first_bucket = bucket
+        
+        index = bucket - self._first_bucket
+        while len(self._gained_prefix) <= index:
+            self._gained_prefix.append(self._gained_prefix[-1] if self._gained_prefix else 0)
+            self._lost_prefix.append(self._lost_prefix[-1] if self._lost_prefix else 0)
+        
+        # Every prefix sum from the event's bucket on includes it
+        prefix = self._gained_prefix if event.owned else self._lost_prefix
+        for i in range(index, len(prefix)):
+            prefix[i] += 1
+        
+        self.last_timestamp = max(self.last_timestamp, event.timestamp)
+        self.event_count += 1
+    
+    def apply_all(self, events: Iterable[HistoryEvent]) -> None:
+        """Fold a batch of events into the aggregates."""
+        for event in events:
+            self.apply(event)
+    
+    def clear(self) -> None:
+        """Drop every aggregate, keeping the disc ordinals."""
+        self._first_bucket = None
+        self._gained_prefix = []
+        self._lost_prefix = []
+        self.last_timestamp = 0
+        self.event_count = 0
+    
+    def gained_between(self, start: int, end: int) -> int:
+        """Discs gained in buckets overlapping [start, end)."""
+        return self._window(self._gained_prefix, start, end)
+    
+    def lost_between(self, start: int, end: int) -> int:
+        """Discs lost in buckets overlapping [start, end)."""
+        return self._window(self._lost_prefix, start, end)
+    
+    def weekly_progress(self, weeks: int, now: int) -> List[WeeklyProgress]:
+        """Get gained/lost counts for the last `weeks` buckets ending at `now`."""
+        current = now // self._bucket_seconds
+        result = []
+        for bucket in range(current - weeks + 1, current + 1):
+            start = bucket * self._bucket_seconds
+            end = start + self._bucket_seconds
+            result.append(WeeklyProgress(
+                week_start=start,
+                gained=self.gained_between(start, end),
+                lost=self.lost_between(start, end)
+            ))
+        return result
+    
+    def _window(self, prefix: List[int], start: int, end: int) -> int:
+        """Sum a prefix array over the buckets covering [start, end)."""
+        if self._first_bucket is None or end <= start:
+            return 0
+        
+        last = len(prefix) - 1
+        lo = max(start // self._bucket_seconds - self._first_bucket, 0)
+        hi = min((end - 1) // self._bucket_seconds - self._first_bucket, last)
+        if hi < 0 or lo > last:
+            return 0
+        
+        before = prefix[lo - 1] if lo > 0 else 0
+        return prefix[hi] - before
@@ -1,10 +1,25 @@
-from .interfaces import IDiscRepository, ICollectionRepository
+from .interfaces import IDiscRepository, ICollectionRepository, IHistoryRepository
 from .json_disc_repository import JsonDiscRepository
 from .json_collection_repository import JsonCollectionRepository
+from .compiled_disc_repository import CompiledDiscRepository
+from .binary_history_repository import BinaryHistoryRepository
+from .disc_pack import DiscPack, DiscPackLibrary, PackIcon
+from .packed_disc_repository import PackedDiscRepository, open_disc_repository
+from .layered_disc_repository import LayeredDiscRepository, move_custom_discs
 
 __all__ = [
     "IDiscRepository", 
     "ICollectionRepository",
+    "IHistoryRepository",
     "JsonDiscRepository",
-    "JsonCollectionRepository"
+    "JsonCollectionRepository",
+    "CompiledDiscRepository",
+    "BinaryHistoryRepository",
+    "DiscPack",
+    "DiscPackLibrary",
+    "PackIcon",
+    "PackedDiscRepository",
+    "LayeredDiscRepository",
+    "move_custom_discs",
+    "open_disc_repository"
 ]
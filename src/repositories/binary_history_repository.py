@@ -0,0 +1,209 @@
+import logging
+import os
+import struct
+from dataclasses import replace
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.models.history import WEEK_SECONDS, HistoryEvent, ProgressHistory
+from src.repositories.file_lock import FileLock
+from src.repositories.interfaces import IHistoryRepository
+
+
+logger = logging.getLogger(__name__)
+
+
+# Fixed-width record: uint32 timestamp, uint32 (ordinal << 1 | owned)
+RECORD = struct.Struct("<II")
+
+# Only consider compaction once the log has grown past this many records
+COMPACT_MIN_RECORDS = 4096
+
+
+class BinaryHistoryRepository(IHistoryRepository):
+    """Append-only binary implementation of the progress history log.
+    
+    Events are stored as 8-byte records in `log_path`; the disc ID for each
+    ordinal is stored one per line in `ids_path`.
+    
+    Several processes may share the log. Writes hold a lock on it, and each
+    process folds in what the others appended since it last looked, so
+    their ordinals agree and no change is counted twice.
+    """
+    
+    def __init__(self, log_path: Path, ids_path: Path, bucket_seconds: int = WEEK_SECONDS):
+        self._log_path = log_path
+        self._ids_path = ids_path
+        self._bucket_seconds = bucket_seconds
+        self._persisted_ids = 0
+        # Inode of the log and bytes of it already folded into the history
+        self._log_inode: Optional[int] = None
+        self._log_size = 0
+    
+    def load(self) -> ProgressHistory:
+        """Load the log, compacting it first if it is mostly churn."""
+        with FileLock(self._log_path):
+            disc_ids = self._read_ids()
+            self._persisted_ids = len(disc_ids)
+            
+            events = self._read_events(0)
+            if len(events) >= COMPACT_MIN_RECORDS:
+                compacted = self._compact(events)
+                if len(compacted) <= len(events) * 3 // 4:
+                    self._write_events(compacted)
+                    events = compacted
+            self._log_inode = self._current_inode()
+            self._log_size = len(events) * RECORD.size
+        
+        history = ProgressHistory(disc_ids, bucket_seconds=self._bucket_seconds)
+        history.apply_all(events)
+        return history
+    
+    def reload_if_changed(self, history: ProgressHistory) -> List[HistoryEvent]:
+        """Fold in events other processes appended since the last load or append."""
+        try:
+            with FileLock(self._log_path):
+                return self._read_new(history)
+        except OSError as e:
+            logger.warning("Error reading history: %s", e)
+            return []
+    
+    def append(self, history: ProgressHistory, events: List[HistoryEvent]) -> None:
+        """Append events and any new disc ordinals to the log."""
+        if not events:
+            return
+        
+        self._log_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with FileLock(self._log_path):
+                # Take on what others stored first, so new ordinals follow theirs
+                moved = self._sync_ids(history)
+                self._read_new(history, pending=events)
+                events = [replace(event, ordinal=moved.get(event.ordinal, event.ordinal)) for event in events]
+                
+                new_ids = history.disc_ids[self._persisted_ids:]
+                if new_ids:
+                    with open(self._ids_path, "a", encoding="utf-8") as f:
+                        f.write("".join(f"{disc_id}\n" for disc_id in new_ids))
+                    self._persisted_ids = len(history.disc_ids)
+                
+                with open(self._log_path, "ab") as f:
+                    end = f.seek(0, os.SEEK_END)
+                    if end % RECORD.size:
+                        # Drop a torn record left by a crashed write
+                        f.truncate(end - end % RECORD.size)
+                    f.write(b"".join(self._pack(event) for event in events))
+                self._log_inode = self._current_inode()
+                self._log_size += len(events) * RECORD.size
+        except OSError as e:
+            logger.error("Error saving history: %s", e)
+    
+    def _sync_ids(self, history: ProgressHistory) -> Dict[int, int]:
+        """Take on disc IDs other processes stored. Returns ordinals that moved."""
+        stored = self._read_ids()
+        if len(stored) <= self._persisted_ids:
+            return {}
+        moved = history.adopt_ids(self._persisted_ids, stored[self._persisted_ids:])
+        self._persisted_ids = len(stored)
+        return moved
+    
+    def _read_new(self, history: ProgressHistory, pending: Iterable[HistoryEvent] = ()) -> List[HistoryEvent]:
+        """Fold records appended by other processes into the history. Caller holds the lock.
+        
+        `pending` are events already in the history but not in the log yet.
+        """
+        self._sync_ids(history)
+        inode = self._current_inode()
+        if inode is None:
+            return []
+        if inode != self._log_inode and self._log_size:
+            # Another process compacted (replaced) the log: rebuild from it
+            previous_last = history.last_timestamp
+            events = self._read_events(0)
+            history.clear()
+            history.apply_all(events)
+            history.apply_all(pending)
+            self._log_inode = inode
+            self._log_size = len(events) * RECORD.size
+            return [event for event in events if event.timestamp > previous_last]
+        
+        # Also the first read of a log another process created
+        self._log_inode = inode
+        events = self._read_events(self._log_size)
+        history.apply_all(events)
+        self._log_size += len(events) * RECORD.size
+        return events
+    
+    def _current_inode(self) -> Optional[int]:
+        """Inode of the log file, or None if there is none yet."""
+        try:
+            return self._log_path.stat().st_ino
+        except FileNotFoundError:
+            return None
+    
+    def _read_ids(self) -> List[str]:
+        """Read the disc ID of every stored ordinal."""
+        if not self._ids_path.exists():
+            return []
+        return self._ids_path.read_text(encoding="utf-8").splitlines()
+    
+    def _read_events(self, offset: int) -> List[HistoryEvent]:
+        """Read the records from byte `offset` of the log on."""
+        if not self._log_path.exists():
+            return []
+        
+        with open(self._log_path, "rb") as f:
+            f.seek(offset)
+            data = f.read()
+        # Ignore a torn trailing record from an interrupted write
+        data = data[:len(data) - len(data) % RECORD.size]
+        return [
+            HistoryEvent(timestamp=timestamp, ordinal=packed >> 1, owned=bool(packed & 1))
+            for timestamp, packed in RECORD.iter_unpack(data)
+        ]
+    
+    def _write_events(self, events: List[HistoryEvent]) -> None:
+        """Atomically replace the log with the given events."""
+        tmp_path = self._log_path.with_suffix(self._log_path.suffix + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(b"".join(self._pack(event) for event in events))
+        os.replace(tmp_path, self._log_path)
+    
+    def _compact(self, events: List[HistoryEvent]) -> List[HistoryEvent]:
+        """Collapse each disc's changes within a bucket to its net change.
+        
+        Per-bucket net progress is preserved; a disc toggled back to where it
+        started within the same week leaves no record at all.
+        """
+        state: Dict[int, bool] = {}
+        compacted: List[HistoryEvent] = []
+        bucket_events: Dict[int, Tuple[bool, HistoryEvent]] = {}
+        current_bucket = None
+        
+        def flush() -> None:
+            kept = []
+            for ordinal, (first_owned, last) in bucket_events.items():
+                # Each event is a change, so the state before the first one is its inverse
+                before = state.get(ordinal, not first_owned)
+                if before != last.owned:
+                    kept.append(last)
+                state[ordinal] = last.owned
+            kept.sort(key=lambda event: event.timestamp)
+            compacted.extend(kept)
+            bucket_events.clear()
+        
+        for event in events:
+            bucket = event.timestamp // self._bucket_seconds
+            if bucket != current_bucket:
+                flush()
+                current_bucket = bucket
+            first_owned = bucket_events.get(event.ordinal, (event.owned, event))[0]
+            bucket_events[event.ordinal] = (first_owned, event)
+        flush()
+        
+        return compacted
+    
+    @staticmethod
+    def _pack(event: HistoryEvent) -> bytes:
+        """Encode an event as a fixed-width record."""
+        return RECORD.pack(event.timestamp, (event.ordinal << 1) | int(event.owned))
@@ -0,0 +1,244 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Dict, Optional
+
+from src.models.disc import Disc
+
+
+MAGIC = b"MDTC"
+VERSION = 1
+
+# magic, version, reserved, record count, records offset, index offset,
+# index slot count, strings offset, source mtime_ns, source size, source sha1
+HEADER = struct.Struct("<4sHHIIIIIQQ20s")
+# The source (mtime_ns, size) pair, which sits just before the trailing sha1
+FINGERPRINT = struct.Struct("<QQ")
+FINGERPRINT_OFFSET = HEADER.size - 20 - FINGERPRINT.size
+
+# Six (offset, length) string references followed by flags
+RECORD = struct.Struct("<12II")
+STRING_FIELDS = ("id", "name", "artist", "description", "how_to_obtain", "image_url")
+FLAG_PROTECTED = 0x1
+FLAG_HAS_IMAGE_URL = 0x2
+
+FLAGS = struct.Struct("<I")
+FLAGS_OFFSET = RECORD.size - FLAGS.size
+
+SLOT = struct.Struct("<I")
+
+
+def _fnv1a(data: bytes) -> int:
+    """32-bit FNV-1a hash, stable across processes unlike hash()."""
+    h = 0x811C9DC5
+    for byte in data:
+        h = ((h ^ byte) * 0x01000193) & 0xFFFFFFFF
+    return h
+
+
+def _source_fingerprint(source_path: Path) -> tuple:
+    """Get (mtime_ns, size) of the JSON source."""
+    stat = source_path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def compile_catalog(source_path: Path, catalog_path: Path) -> int:
+    """Compile a discs.json file into the binary catalog format.
+    
+    Returns the number of discs written. The catalog is written to a
+    temporary file and atomically moved into place.
+    """
+    raw = source_path.read_bytes()
+    discs = json.loads(raw.decode("utf-8")).get("discs", [])
+    
+    strings = bytearray()
+    string_refs: Dict[str, tuple] = {}
+    
+    def intern(value: str) -> tuple:
+        # Artists and obtain methods repeat a lot, so store each string once
+        ref = string_refs.get(value)
+        if ref is None:
+            encoded = value.encode("utf-8")
+            ref = (len(strings), len(encoded))
+            strings.extend(encoded)
+            string_refs[value] = ref
+        return ref
+    
+    records = bytearray()
+    for disc in discs:
+        values = [
+            disc["id"],
+            disc["name"],
+            disc.get("artist", ""),
+            disc.get("description", ""),
+            disc.get("how_to_obtain", ""),
+            disc.get("image_url") or "",
+        ]
+        refs = [part for value in values for part in intern(value)]
+        flags = FLAG_PROTECTED if disc.get("protected", False) else 0
+        if disc.get("image_url"):
+            flags |= FLAG_HAS_IMAGE_URL
+        records.extend(RECORD.pack(*refs, flags))
+    
+    # Open-addressing id index at <= 50% load; slots hold record index + 1
+    slots = 1
+    while slots < len(discs) * 2:
+        slots *= 2
+    index = [0] * slots
+    for i, disc in enumerate(discs):
+        pos = _fnv1a(disc["id"].encode("utf-8")) & (slots - 1)
+        while index[pos]:
+            pos = (pos + 1) & (slots - 1)
+        index[pos] = i + 1
+    
+    records_offset = HEADER.size
+    index_offset = records_offset + len(records)
+    strings_offset = index_offset + slots * SLOT.size
+    mtime_ns, size = _source_fingerprint(source_path)
+    header = HEADER.pack(
+        MAGIC, VERSION, 0, len(discs), records_offset, index_offset, slots,
+        strings_offset, mtime_ns, size, hashlib.sha1(raw).digest()
+    )
+    
+    tmp_path = catalog_path.with_suffix(catalog_path.suffix + ".tmp")
+    catalog_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(records)
+        f.write(struct.pack(f"<{slots}I", *index))
+        f.write(strings)
+    os.replace(tmp_path, catalog_path)
+    return len(discs)
+
+
+class CompiledCatalog:
+    """Read-only view of a compiled catalog, memory-mapped and decoded on access."""
+    
+    def __init__(self, catalog_path: Path):
+        self._path = catalog_path
+        with open(catalog_path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        try:
+            (magic, version, _, self._count, self._records_offset, self._index_offset,
+             self._index_slots, self._strings_offset, self.source_mtime_ns,
+             self.source_size, self.source_sha1) = HEADER.unpack_from(self._mm, 0)
+        except struct.error:
+            self.close()
+            raise ValueError(f"Truncated catalog: {catalog_path}")
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Unsupported catalog format: {catalog_path}")
+        
+        # Only discs looked up by ID are kept; full scans decode as they go
+        self._decoded: Dict[int, Disc] = {}
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def close(self) -> None:
+        """Unmap the catalog file."""
+        self._mm.close()
+    
+    def is_current(self, source_path: Path) -> bool:
+        """Check whether the catalog was compiled from the source as it is now.
+        
+        Copies (e.g. release bundles) change the mtime but not the content.
+        When only the hash matches, the new fingerprint is written back to
+        the header so later checks can skip hashing the source again.
+        """
+        if not source_path.exists():
+            return False
+        fingerprint = _source_fingerprint(source_path)
+        if fingerprint == (self.source_mtime_ns, self.source_size):
+            return True
+        if hashlib.sha1(source_path.read_bytes()).digest() != self.source_sha1:
+            return False
+        self._restamp(fingerprint)
+        return True
+    
+    def _restamp(self, fingerprint: tuple) -> None:
+        """Record a new source fingerprint in the header, if the file is writable."""
+        try:
+            with open(self._path, "r+b") as f:
+                f.seek(FINGERPRINT_OFFSET)
+                f.write(FINGERPRINT.pack(*fingerprint))
+        except OSError:
+            # Read-only install: the hash is simply checked again next time
+            return
+        self.source_mtime_ns, self.source_size = fingerprint
+    
+    def disc_at(self, index: int, cache: bool = False) -> Disc:
+        """Decode the disc stored at a record index.
+        
+        Discs decoded with `cache` are kept and returned by later calls;
+        otherwise the disc is decoded without being stored.
+        """
+        disc = self._decoded.get(index)
+        if disc is None:
+            fields = RECORD.unpack_from(self._mm, self._records_offset + index * RECORD.size)
+            values = [self._string(fields[i * 2], fields[i * 2 + 1]) for i in range(len(STRING_FIELDS))]
+            flags = fields[-1]
+            disc = Disc(
+                id=values[0],
+                name=values[1],
+                artist=values[2],
+                description=values[3],
+                how_to_obtain=values[4],
+                protected=bool(flags & FLAG_PROTECTED),
+                image_url=values[5] if flags & FLAG_HAS_IMAGE_URL else None
+            )
+            if cache:
+                self._decoded[index] = disc
+        return disc
+    
+    def has_unprotected(self) -> bool:
+        """Check whether any disc is unprotected, reading only record flags."""
+        for i in range(self._count):
+            (flags,) = FLAGS.unpack_from(self._mm, self._records_offset + i * RECORD.size + FLAGS_OFFSET)
+            if not flags & FLAG_PROTECTED:
+                return True
+        return False
+    
+    def record_digests(self) -> Dict[str, bytes]:
+        """Map every disc ID to a digest of its record, without decoding any disc.
+        
+        Comparing the digests of two catalogs finds the discs added, removed
+        or edited between them.
+        """
+        digests = {}
+        for i in range(self._count):
+            fields = RECORD.unpack_from(self._mm, self._records_offset + i * RECORD.size)
+            digest = hashlib.blake2b(FLAGS.pack(fields[-1]), digest_size=16)
+            for offset, length in zip(fields[0:-1:2], fields[1:-1:2]):
+                start = self._strings_offset + offset
+                digest.update(struct.pack("<I", length))
+                digest.update(self._mm[start:start + length])
+            digests[self._string(fields[0], fields[1])] = digest.digest()
+        return digests
+    
+    def index_of(self, disc_id: str) -> Optional[int]:
+        """Look up a record index by disc ID through the hash index."""
+        if not self._count:
+            return None
+        
+        encoded = disc_id.encode("utf-8")
+        mask = self._index_slots - 1
+        pos = _fnv1a(encoded) & mask
+        while True:
+            (slot,) = SLOT.unpack_from(self._mm, self._index_offset + pos * SLOT.size)
+            if not slot:
+                return None
+            offset, length = RECORD.unpack_from(self._mm, self._records_offset + (slot - 1) * RECORD.size)[:2]
+            start = self._strings_offset + offset
+            if self._mm[start:start + length] == encoded:
+                return slot - 1
+            pos = (pos + 1) & mask
+    
+    def _string(self, offset: int, length: int) -> str:
+        """Decode a string from the string table."""
+        start = self._strings_offset + offset
+        return self._mm[start:start + length].decode("utf-8")
@@ -0,0 +1,141 @@
+import logging
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+from src.models.disc import Disc
+from src.repositories.compiled_catalog import CompiledCatalog, compile_catalog
+from src.repositories.file_lock import FileLock, file_stamp
+from src.repositories.interfaces import CatalogChanges, IDiscRepository
+from src.repositories.json_disc_repository import JsonDiscRepository
+
+
+logger = logging.getLogger(__name__)
+
+
+class CompiledDiscRepository(IDiscRepository):
+    """Disc repository served from a memory-mapped compiled catalog.
+    
+    `discs.json` stays the editable source. The catalog is recompiled only
+    when the source changes. Edits go through JsonDiscRepository and then
+    recompile. If the catalog cannot be written (e.g. a read-only install),
+    the repository serves the JSON source directly.
+    """
+    
+    def __init__(self, catalog_path: Path, source_path: Path):
+        self._catalog_path = catalog_path
+        self._source_path = source_path
+        self._catalog: Optional[CompiledCatalog] = None
+        self._fallback: Optional[JsonDiscRepository] = None
+        self._source_stamp = None
+        self._open()
+    
+    def _open(self) -> None:
+        """Map the catalog, compiling it first if missing or stale."""
+        # Taken first, so edits made while compiling are caught by the next check
+        self._source_stamp = file_stamp(self._source_path)
+        try:
+            self._catalog = CompiledCatalog(self._catalog_path)
+        except (OSError, ValueError):
+            self._catalog = None
+        
+        if self._catalog is not None and self._catalog.is_current(self._source_path):
+            return
+        
+        if self._catalog is not None:
+            # Unmap before replacing the file (required on Windows)
+            self._catalog.close()
+            self._catalog = None
+        
+        if not self._source_path.exists():
+            self._fallback = JsonDiscRepository(self._source_path)
+            return
+        
+        try:
+            # Another process may be compiling the same catalog
+            with FileLock(self._catalog_path):
+                compile_catalog(self._source_path, self._catalog_path)
+            self._catalog = CompiledCatalog(self._catalog_path)
+        except (OSError, ValueError) as e:
+            logger.warning("Error compiling disc catalog, using JSON source: %s", e)
+            self._fallback = JsonDiscRepository(self._source_path)
+    
+    def _recompile(self) -> None:
+        """Rebuild the catalog after the JSON source was edited."""
+        if self._catalog is not None:
+            self._catalog.close()
+            self._catalog = None
+        self._fallback = None
+        self._open()
+    
+    def reload_if_changed(self) -> CatalogChanges:
+        """Recompile and remap if the JSON source was edited by another process.
+        
+        Changed discs are found by comparing record digests of the old and
+        new catalog, without decoding either.
+        """
+        if self._fallback:
+            return self._fallback.reload_if_changed()
+        
+        stamp = file_stamp(self._source_path)
+        if stamp == self._source_stamp:
+            return CatalogChanges()
+        self._source_stamp = stamp
+        if self._catalog.is_current(self._source_path):
+            return CatalogChanges()
+        
+        previous = self._catalog.record_digests()
+        self._recompile()
+        if self._fallback:
+            # Serving the JSON source now, so every disc may have changed
+            return CatalogChanges(True, set(previous) | {disc.id for disc in self._fallback.get_all()})
+        current = self._catalog.record_digests()
+        return CatalogChanges(True, {
+            disc_id for disc_id in previous.keys() | current.keys()
+            if previous.get(disc_id) != current.get(disc_id)
+        })
+    
+    def get_all(self) -> List[Disc]:
+        """Get all available music discs."""
+        if self._fallback:
+            return self._fallback.get_all()
+        return [self._catalog.disc_at(i) for i in range(len(self._catalog))]
+    
+    def iter_all(self) -> Iterator[Disc]:
+        """Decode discs one at a time; none are kept by the catalog."""
+        if self._fallback:
+            yield from self._fallback.iter_all()
+            return
+        for i in range(len(self._catalog)):
+            yield self._catalog.disc_at(i)
+    
+    def get_by_id(self, disc_id: str) -> Optional[Disc]:
+        """Get a disc by its ID via the catalog's hash index."""
+        if self._fallback:
+            return self._fallback.get_by_id(disc_id)
+        index = self._catalog.index_of(disc_id)
+        return self._catalog.disc_at(index, cache=True) if index is not None else None
+    
+    def has_custom_discs(self) -> bool:
+        """Check for unprotected discs without decoding any records."""
+        if self._fallback:
+            return any(not disc.protected for disc in self._fallback.get_all())
+        return self._catalog.has_unprotected()
+    
+    def count(self) -> int:
+        """Get the number of discs without decoding any records."""
+        if self._fallback:
+            return self._fallback.count()
+        return len(self._catalog)
+    
+    def add_disc(self, disc_data: dict) -> Disc:
+        """Add a new disc to the JSON source and recompile."""
+        new_disc = JsonDiscRepository(self._source_path).add_disc(disc_data)
+        self._recompile()
+        return new_disc
+    
+    def delete_disc(self, disc_id: str) -> bool:
+        """Delete a disc from the JSON source and recompile."""
+        deleted = JsonDiscRepository(self._source_path).delete_disc(disc_id)
+        if deleted:
+            self._recompile()
+        return deleted
@@ -0,0 +1,202 @@
+import io
+import json
+import logging
+import os
+import threading
+import zipfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from src.models.disc import Disc
+from src.repositories.file_lock import FileLock, atomic_write_json, file_stamp, stat_stamp
+
+
+logger = logging.getLogger(__name__)
+
+
+# Manifest member inside every pack; same disc format as discs.json
+MANIFEST_NAME = "pack.json"
+
+# Icon member used when a disc entry does not name one
+DEFAULT_ICON = "icons/{id}.png"
+
+
+@dataclass(frozen=True)
+class PackIcon:
+    """An icon stored inside a disc pack, read only when opened."""
+    pack_path: Path
+    member: str
+    _pack: "DiscPack" = field(repr=False, compare=False)
+    _info: zipfile.ZipInfo = field(repr=False, compare=False)
+    
+    @property
+    def version(self) -> str:
+        """Changes whenever the icon's bytes in the pack change."""
+        return f"{self._info.CRC:08x}-{self._info.file_size}"
+    
+    def open(self) -> io.BytesIO:
+        """Read the icon bytes from the pack."""
+        return io.BytesIO(self._pack.read_member(self._info))
+
+
+class DiscPack:
+    """A zip of discs and icons, mounted in place without extracting.
+    
+    Opening the zip reads only its central directory and the manifest.
+    Icons are located by their directory entry and read on demand.
+    """
+    
+    def __init__(self, path: Path):
+        self.path = path
+        self.name = path.name
+        self._zip = zipfile.ZipFile(path)
+        self.stamp = stat_stamp(os.fstat(self._zip.fp.fileno()))
+        try:
+            manifest = json.loads(self._zip.read(MANIFEST_NAME).decode("utf-8"))
+            members = {info.filename: info for info in self._zip.infolist()}
+            
+            self.title: str = manifest.get("name", path.stem)
+            self.discs: List[Disc] = []
+            self._icons: Dict[str, zipfile.ZipInfo] = {}
+            for entry in manifest.get("discs", []):
+                disc = Disc(
+                    id=entry["id"],
+                    name=entry["name"],
+                    artist=entry.get("artist", ""),
+                    description=entry.get("description", ""),
+                    how_to_obtain=entry.get("how_to_obtain", ""),
+                    # Pack discs are removed by disabling the pack
+                    protected=True,
+                    image_url=entry.get("image_url")
+                )
+                self.discs.append(disc)
+                
+                icon = members.get(entry.get("icon") or DEFAULT_ICON.format(id=disc.id))
+                if icon is not None:
+                    self._icons[disc.id] = icon
+        except (KeyError, ValueError) as e:
+            self._zip.close()
+            raise ValueError(f"Invalid disc pack {path.name}: {e}")
+    
+    def icon(self, disc_id: str) -> Optional[PackIcon]:
+        """Get a lazy reference to a disc's icon, if the pack has one."""
+        info = self._icons.get(disc_id)
+        if info is None:
+            return None
+        return PackIcon(self.path, info.filename, self, info)
+    
+    def read_member(self, info: zipfile.ZipInfo) -> bytes:
+        """Read one member, seeking straight to its local header."""
+        return self._zip.read(info)
+    
+    def close(self) -> None:
+        """Close the underlying zip file."""
+        self._zip.close()
+
+
+class DiscPackLibrary:
+    """The packs in a folder, and which of them are enabled.
+    
+    Packs are enabled by default. Disabling one only records its file name
+    in `state_path`; the zip itself is left untouched.
+    
+    Remounting swaps in the new set of packs at once. Packs it replaces
+    stay open, since icon references to them may still be in use, until
+    close_retired() is called.
+    """
+    
+    def __init__(self, packs_dir: Path, state_path: Path):
+        self._packs_dir = packs_dir
+        self._state_path = state_path
+        self._mounted: Dict[str, DiscPack] = {}
+        # Unmounted packs waiting for their icon users to let go
+        self._retired: List[DiscPack] = []
+        self._retired_lock = threading.Lock()
+        self._stamp: Optional[Tuple] = None
+        # Bumped on every remount so users of the library can tell it changed
+        self.generation = 0
+        self._load()
+    
+    def available(self) -> List[str]:
+        """File names of all packs in the folder."""
+        if not self._packs_dir.is_dir():
+            return []
+        return sorted(path.name for path in self._packs_dir.glob("*.zip"))
+    
+    def is_enabled(self, name: str) -> bool:
+        """Check whether a pack is enabled."""
+        return name not in self._read_disabled()
+    
+    def set_enabled(self, name: str, enabled: bool) -> None:
+        """Enable or disable a pack by file name."""
+        with FileLock(self._state_path):
+            disabled = self._read_disabled()
+            if enabled:
+                disabled.discard(name)
+            else:
+                disabled.add(name)
+            atomic_write_json(self._state_path, {"disabled": sorted(disabled)})
+        self.reload_if_changed()
+    
+    def mounted(self) -> List[DiscPack]:
+        """Enabled packs that could be opened, in file name order."""
+        mounted = self._mounted
+        return [mounted[name] for name in sorted(mounted)]
+    
+    def reload_if_changed(self) -> bool:
+        """Remount if packs were added, removed, replaced, enabled or disabled."""
+        if self._current_stamp() == self._stamp:
+            return False
+        self._load()
+        return True
+    
+    def close_retired(self) -> None:
+        """Close packs unmounted by a remount, once nothing reads their icons."""
+        with self._retired_lock:
+            retired, self._retired = self._retired, []
+        for pack in retired:
+            pack.close()
+    
+    def _current_stamp(self) -> Tuple:
+        """Stamps of the state file and every pack in the folder."""
+        packs = tuple((name, file_stamp(self._packs_dir / name)) for name in self.available())
+        return file_stamp(self._state_path), packs
+    
+    def _load(self) -> None:
+        """Open enabled packs, reusing ones that are already open and unchanged."""
+        self._stamp = self._current_stamp()
+        self.generation += 1
+        disabled = self._read_disabled()
+        previous = dict(self._mounted)
+        mounted: Dict[str, DiscPack] = {}
+        
+        for name, stamp in self._stamp[1]:
+            if name in disabled:
+                continue
+            pack = previous.get(name)
+            if pack is not None and pack.stamp == stamp:
+                mounted[name] = previous.pop(name)
+                continue
+            try:
+                pack = DiscPack(self._packs_dir / name)
+            except (OSError, ValueError, zipfile.BadZipFile) as e:
+                logger.warning("Error loading disc pack %s: %s", name, e)
+                continue
+            mounted[name] = pack
+        
+        # Readers see either the old set or the new one, never a partial one
+        self._mounted = mounted
+        with self._retired_lock:
+            self._retired.extend(previous.values())
+    
+    def _read_disabled(self) -> set:
+        """Read the set of disabled pack names."""
+        try:
+            with open(self._state_path, "r", encoding="utf-8") as f:
+                return set(json.load(f).get("disabled", []))
+        except FileNotFoundError:
+            return set()
+        except (json.JSONDecodeError, AttributeError) as e:
+            logger.warning("Error reading pack settings: %s", e)
+            return set()
@@ -0,0 +1,91 @@
+import json
+import os
+from pathlib import Path
+from typing import Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+# (inode, mtime_ns, size) of a file; atomic replaces always change the inode
+FileStamp = Tuple[int, int, int]
+
+
+def file_stamp(path: Path) -> Optional[FileStamp]:
+    """Get a cheap change-detection stamp for a file, or None if it is missing."""
+    try:
+        return stat_stamp(path.stat())
+    except FileNotFoundError:
+        return None
+
+
+def stat_stamp(stat: os.stat_result) -> FileStamp:
+    """Build a file stamp from a stat result (e.g. os.fstat of an open file)."""
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def atomic_write_json(path: Path, data: dict) -> FileStamp:
+    """Write JSON to a temporary file and rename it over `path`.
+    
+    Readers never see a half-written file. Returns the stamp of the new file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+            stamp = stat_stamp(os.fstat(f.fileno()))
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return stamp
+
+
+class FileLock:
+    """Advisory inter-process lock guarding read-modify-write of a data file.
+    
+    The lock is taken on a `<name>.lock` file beside the data file, so the
+    data file itself can still be atomically replaced while it is held.
+    """
+    
+    def __init__(self, path: Path):
+        self._lock_path = path.with_name(path.name + ".lock")
+        self._file = None
+    
+    def __enter__(self) -> "FileLock":
+        self._lock_path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self._lock_path, "a+b")
+        try:
+            if fcntl:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+            else:
+                self._file.seek(0)
+                while True:
+                    try:
+                        msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        # LK_LOCK gives up after ~10s; keep waiting
+                        continue
+        except BaseException:
+            self._file.close()
+            self._file = None
+            raise
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        try:
+            if fcntl:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            else:
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            self._file.close()
+            self._file = None
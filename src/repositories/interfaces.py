@@ -1,8 +1,31 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from dataclasses import astuple, dataclass, field
+from typing import Dict, Iterator, List, Optional, Set
 
 from src.models.disc import Disc
 from src.models.collection import Collection
+from src.models.history import HistoryEvent, ProgressHistory
+
+
+@dataclass
+class CatalogChanges:
+    """What a disc repository reload picked up. False when storage was unchanged."""
+    reloaded: bool = False
+    # Discs added, removed or edited; look each up again to tell which
+    disc_ids: Set[str] = field(default_factory=set)
+    
+    def __bool__(self) -> bool:
+        return self.reloaded
+
+
+def changed_disc_ids(previous: Dict[str, Disc], current: Dict[str, Disc]) -> Set[str]:
+    """IDs added, removed or edited between two ID -> disc maps."""
+    # Disc equality is by ID only; compare every field to spot edits
+    return {
+        disc_id for disc_id in previous.keys() | current.keys()
+        if disc_id not in previous or disc_id not in current
+        or astuple(previous[disc_id]) != astuple(current[disc_id])
+    }
 
 
 class IDiscRepository(ABC):
@@ -13,11 +36,19 @@ class IDiscRepository(ABC):
         """Get all available music discs."""
         pass
     
+    def iter_all(self) -> Iterator[Disc]:
+        """Yield all discs one at a time, without building a list where storage allows."""
+        return iter(self.get_all())
+    
     @abstractmethod
     def get_by_id(self, disc_id: str) -> Optional[Disc]:
         """Get a disc by its ID."""
         pass
     
+    def count(self) -> int:
+        """Get the number of available discs."""
+        return len(self.get_all())
+    
     @abstractmethod
     def add_disc(self, disc_data: dict) -> Disc:
         """Add a new disc."""
@@ -27,6 +58,10 @@ class IDiscRepository(ABC):
     def delete_disc(self, disc_id: str) -> bool:
         """Delete a disc by ID. Returns True if deleted."""
         pass
+    
+    def reload_if_changed(self) -> CatalogChanges:
+        """Pick up changes other processes made to storage."""
+        return CatalogChanges()
 
 
 class ICollectionRepository(ABC):
@@ -41,3 +76,30 @@ class ICollectionRepository(ABC):
     def save(self, collection: Collection) -> None:
         """Save the user's collection to storage."""
         pass
+    
+    def reload_if_changed(self) -> Optional[Collection]:
+        """Get the stored collection if another process changed it, else None."""
+        return None
+    
+    def flush(self) -> None:
+        """Write any deferred saves now."""
+        pass
+
+
+class IHistoryRepository(ABC):
+    """Abstract interface for the append-only progress history log."""
+    
+    @abstractmethod
+    def load(self) -> ProgressHistory:
+        """Load the history log and build its aggregates."""
+        pass
+    
+    @abstractmethod
+    def append(self, history: ProgressHistory, events: List[HistoryEvent]) -> None:
+        """Append new events (and any newly assigned disc ordinals) to storage."""
+        pass
+    
+    @abstractmethod
+    def reload_if_changed(self, history: ProgressHistory) -> List[HistoryEvent]:
+        """Fold in events other processes stored since the last load or append. Returns them."""
+        pass
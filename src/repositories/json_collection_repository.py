@@ -1,47 +1,177 @@
 import json
+import logging
+import os
 import threading
+import time
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
 
 from src.models.collection import Collection
+from src.repositories.file_lock import FileLock, FileStamp, atomic_write_json, file_stamp, stat_stamp
 from src.repositories.interfaces import ICollectionRepository
 
 
+logger = logging.getLogger(__name__)
+
+# Quiet period after the last save before it is written, so bursts share one write
+SAVE_DELAY_S = 0.5
+# Wait before retrying a write that failed
+RETRY_DELAY_S = 5.0
+
+
 class JsonCollectionRepository(ICollectionRepository):
-    """JSON-based implementation of collection repository."""
+    """JSON-based implementation of collection repository.
+    
+    Saves only write the entries changed locally, merged into whatever is
+    on disk at the time, so edits made by other processes are not lost.
+    
+    save() copies the changed entries into a new immutable snapshot tagged
+    with a version number and returns; it never waits for the disk. One
+    writer thread writes the newest snapshot once saves go quiet, and never
+    looks at the live Collection. Entries saved again during a write keep
+    their newer version and go out with the next write.
+    """
     
     def __init__(self, data_path: Path):
         self._data_path = data_path
+        # Guards the fields below. Never held during a write
+        self._lock = threading.Condition()
+        # Serializes writes between the writer thread and flush()
+        self._write_lock = threading.Lock()
+        # disc ID -> (owned, version of the save that set it). Replaced on every save, never mutated
+        self._pending: Mapping[str, Tuple[bool, int]] = MappingProxyType({})
+        self._version = 0
+        self._written_version = 0
+        self._last_save_time = 0.0
+        self._writer: Optional[threading.Thread] = None
+        self._tracked: Optional[Collection] = None
+        self._stamp: Optional[FileStamp] = None
+        # Last content read or written successfully, used if the file is corrupt
+        self._last_good: dict = {}
+        # Set when a save merged in external edits the caller hasn't seen yet
+        self._unseen_changes = False
     
     def load(self) -> Collection:
         """Load the user's collection from JSON file."""
-        if not self._data_path.exists():
-            return Collection()
+        stamp, collection, data = self._read()
+        with self._lock:
+            self._remember_read(stamp, data)
+            collection = collection or Collection()
+            self._tracked = collection
+            return collection
+    
+    def reload_if_changed(self) -> Optional[Collection]:
+        """Re-read the file if another process changed it, keeping unsaved local changes."""
+        with self._lock:
+            if file_stamp(self._data_path) == self._stamp and not self._unseen_changes:
+                return None
         
-        try:
-            with open(self._data_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return Collection.from_dict(data)
-        except (json.JSONDecodeError, KeyError):
-            return Collection()
+        stamp, collection, data = self._read()
+        with self._lock:
+            self._remember_read(stamp, data)
+            collection = collection or Collection()
+            for disc_id, (owned, _) in self._pending.items():
+                collection.get_entry(disc_id).owned = owned
+            self._unseen_changes = False
+            return collection
     
     def save(self, collection: Collection) -> None:
-        """Save the user's collection to JSON file (Debounced)."""
-        self._collection_cache = collection
-        
-        if hasattr(self, "_save_timer") and self._save_timer:
-            self._save_timer.cancel()
+        """Snapshot the collection's changes for the writer thread (debounced)."""
+        if collection is self._tracked:
+            changes = collection.pop_changes()
+        else:
+            # Not loaded from here, so there is no change log: save it whole
+            changes = {disc_id: entry.owned for disc_id, entry in collection.entries.items()}
+            collection.changed_ids.clear()
+        if not changes:
+            return
         
-        self._save_timer = threading.Timer(0.5, self._perform_save)
-        self._save_timer.start()
+        with self._lock:
+            self._version += 1
+            pending = dict(self._pending)
+            pending.update((disc_id, (owned, self._version)) for disc_id, owned in changes.items())
+            self._pending = MappingProxyType(pending)
+            self._last_save_time = time.monotonic()
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name="collection-writer", daemon=True)
+                self._writer.start()
+            self._lock.notify_all()
     
-    def _perform_save(self) -> None:
-        """Actually write to disk."""
-        if not hasattr(self, "_collection_cache"):
-            return
+    def flush(self) -> None:
+        """Write the newest snapshot now instead of waiting for the writer thread."""
+        self._write_pending()
+    
+    def _write_loop(self) -> None:
+        """Writer thread: write the newest snapshot whenever saves go quiet."""
+        while True:
+            with self._lock:
+                while True:
+                    if self._version == self._written_version:
+                        self._lock.wait()
+                        continue
+                    remaining = self._last_save_time + SAVE_DELAY_S - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._lock.wait(remaining)
+            
+            if not self._write_pending():
+                time.sleep(RETRY_DELAY_S)
+    
+    def _write_pending(self) -> bool:
+        """Merge the newest snapshot into the current file. Returns False if the write failed."""
+        with self._write_lock:
+            with self._lock:
+                version, snapshot = self._version, self._pending
+                if version == self._written_version:
+                    return True
+                previous_stamp, last_good = self._stamp, self._last_good
+            
+            try:
+                with FileLock(self._data_path):
+                    stamp, collection, _ = self._read()
+                    if collection is None:
+                        collection = Collection.from_dict(last_good)
+                    for disc_id, (owned, _) in snapshot.items():
+                        collection.get_entry(disc_id).owned = owned
+                    data = collection.to_dict()
+                    written_stamp = atomic_write_json(self._data_path, data)
+            except Exception:
+                logger.exception("Error saving collection to %s; will retry", self._data_path)
+                return False
             
-        self._data_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._lock:
+                if stamp != previous_stamp:
+                    self._unseen_changes = True
+                self._stamp = written_stamp
+                self._last_good = data
+                self._written_version = version
+                # Keep only entries saved again while this write was running
+                self._pending = MappingProxyType({
+                    disc_id: change for disc_id, change in self._pending.items() if change[1] > version
+                })
+            return True
+    
+    def _read(self) -> Tuple[Optional[FileStamp], Optional[Collection], Optional[dict]]:
+        """Read the file without touching shared state.
+        
+        Returns (stamp, collection, data); collection and data are None if
+        the file is corrupt, and data is None if it is missing.
+        """
+        stamp = None
         try:
-            with open(self._data_path, "w", encoding="utf-8") as f:
-                json.dump(self._collection_cache.to_dict(), f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"Error saving collection: {e}")
+            with open(self._data_path, "r", encoding="utf-8") as f:
+                stamp = stat_stamp(os.fstat(f.fileno()))
+                data = json.load(f)
+            return stamp, Collection.from_dict(data), data
+        except FileNotFoundError:
+            return None, Collection(), None
+        except (json.JSONDecodeError, KeyError, AttributeError):
+            logger.warning("Collection file %s is corrupt; using the last good copy", self._data_path)
+            return stamp, None, None
+    
+    def _remember_read(self, stamp: Optional[FileStamp], data: Optional[dict]) -> None:
+        """Record what a read saw. Call with the lock held."""
+        self._stamp = stamp
+        if data is not None:
+            self._last_good = data
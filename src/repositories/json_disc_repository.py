@@ -1,9 +1,11 @@
 import json
+import os
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Iterable, List, Optional
 
 from src.models.disc import Disc
-from src.repositories.interfaces import IDiscRepository
+from src.repositories.file_lock import FileLock, atomic_write_json, file_stamp, stat_stamp
+from src.repositories.interfaces import CatalogChanges, IDiscRepository, changed_disc_ids
 
 
 class JsonDiscRepository(IDiscRepository):
@@ -12,15 +14,19 @@ class JsonDiscRepository(IDiscRepository):
     def __init__(self, data_path: Path):
         self._data_path = data_path
         self._discs: List[Disc] = []
+        self._stamp = None
         self._load_discs()
     
     def _load_discs(self) -> None:
         """Load disc data from JSON file."""
         if not self._data_path.exists():
             self._discs = []
+            self._stamp = None
             return
         
         with open(self._data_path, "r", encoding="utf-8") as f:
+            # Stamp the file actually read, in case it is replaced meanwhile
+            self._stamp = stat_stamp(os.fstat(f.fileno()))
             data = json.load(f)
         
         self._discs = [
@@ -36,6 +42,14 @@ class JsonDiscRepository(IDiscRepository):
             for disc in data.get("discs", [])
         ]
     
+    def reload_if_changed(self) -> CatalogChanges:
+        """Reload the JSON file if another process replaced or edited it."""
+        if file_stamp(self._data_path) == self._stamp:
+            return CatalogChanges()
+        previous = {disc.id: disc for disc in self._discs}
+        self._load_discs()
+        return CatalogChanges(True, changed_disc_ids(previous, {disc.id: disc for disc in self._discs}))
+    
     def get_all(self) -> List[Disc]:
         """Get all available music discs."""
         return self._discs.copy()
@@ -58,35 +72,66 @@ class JsonDiscRepository(IDiscRepository):
             image_url=disc_data.get("image_url")
         )
         
-        self._discs.append(new_disc)
-        self._save_discs()
+        with FileLock(self._data_path):
+            self.reload_if_changed()
+            self._discs.append(new_disc)
+            self._save_discs()
         
         return new_disc
     
     def _save_discs(self) -> None:
-        """Save all discs to JSON file."""
-        data = {
-            "discs": [
-                {
-                    "id": disc.id,
-                    "name": disc.name,
-                    "artist": disc.artist,
-                    "description": disc.description,
-                    "how_to_obtain": disc.how_to_obtain,
-                    "protected": disc.protected
-                }
-                for disc in self._discs
-            ]
-        }
+        """Atomically save all discs to JSON file. Caller holds the file lock."""
+        data = {"discs": [self._disc_entry(disc) for disc in self._discs]}
         
-        with open(self._data_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        self._stamp = atomic_write_json(self._data_path, data)
+    
+    def apply_changes(self, upserts: Iterable[Disc], deleted_ids: Iterable[str]) -> None:
+        """Replace or append discs and delete others in a single locked write."""
+        with FileLock(self._data_path):
+            self.reload_if_changed()
+            by_id = {disc.id: disc for disc in upserts}
+            deleted = set(deleted_ids)
+            discs = [by_id.pop(disc.id, disc) for disc in self._discs if disc.id not in deleted]
+            self._discs = discs + list(by_id.values())
+            self._save_discs()
+    
+    def rewrite(self, transform: Callable[[List[Disc]], Optional[List[Disc]]]) -> bool:
+        """Replace the disc list with `transform(current discs)` in a single locked write.
+        
+        The transform sees the file as it is under the lock. If it returns
+        None nothing is written. Returns whether the file was written.
+        """
+        with FileLock(self._data_path):
+            self.reload_if_changed()
+            discs = transform(self._discs.copy())
+            if discs is None:
+                return False
+            self._discs = list(discs)
+            self._save_discs()
+        return True
+    
+    @staticmethod
+    def _disc_entry(disc: Disc) -> dict:
+        """Serialize a disc, leaving out an unset image URL."""
+        entry = {
+            "id": disc.id,
+            "name": disc.name,
+            "artist": disc.artist,
+            "description": disc.description,
+            "how_to_obtain": disc.how_to_obtain,
+            "protected": disc.protected
+        }
+        if disc.image_url:
+            entry["image_url"] = disc.image_url
+        return entry
     
     def delete_disc(self, disc_id: str) -> bool:
         """Delete a disc by ID."""
-        for i, disc in enumerate(self._discs):
-            if disc.id == disc_id:
-                self._discs.pop(i)
-                self._save_discs()
-                return True
+        with FileLock(self._data_path):
+            self.reload_if_changed()
+            for i, disc in enumerate(self._discs):
+                if disc.id == disc_id:
+                    self._discs.pop(i)
+                    self._save_discs()
+                    return True
         return False
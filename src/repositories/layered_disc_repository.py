@@ -0,0 +1,139 @@
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from src.models.disc import Disc
+from src.repositories.file_lock import FileLock, atomic_write_json
+from src.repositories.interfaces import CatalogChanges, IDiscRepository, changed_disc_ids
+from src.repositories.json_disc_repository import JsonDiscRepository
+
+
+logger = logging.getLogger(__name__)
+
+
+class LayeredDiscRepository(IDiscRepository):
+    """A read-only base catalog with a small writable overlay of custom discs.
+    
+    The base holds the official discs and is never written, so it can be
+    shipped precompiled and shared. Adding or deleting a custom disc writes
+    only the overlay. Layers are merged at read time: overlay discs are
+    listed after the base and found through an ID index. An overlay disc
+    whose ID the base already has is ignored.
+    """
+    
+    def __init__(self, base: IDiscRepository, overlay: JsonDiscRepository):
+        self._base = base
+        self._overlay = overlay
+        self._custom: Dict[str, Disc] = {}
+        self._index_overlay()
+    
+    def _index_overlay(self) -> None:
+        """Index the overlay discs not shadowed by the base."""
+        self._custom = {}
+        for disc in self._overlay.get_all():
+            if disc.id not in self._custom and self._base.get_by_id(disc.id) is None:
+                self._custom[disc.id] = disc
+    
+    def get_all(self) -> List[Disc]:
+        """Get base discs followed by custom discs."""
+        return self._base.get_all() + list(self._custom.values())
+    
+    def iter_all(self) -> Iterator[Disc]:
+        """Yield base discs followed by custom discs."""
+        yield from self._base.iter_all()
+        yield from self._custom.values()
+    
+    def get_by_id(self, disc_id: str) -> Optional[Disc]:
+        """Get a disc by its ID from either layer."""
+        return self._base.get_by_id(disc_id) or self._custom.get(disc_id)
+    
+    def count(self) -> int:
+        """Get the number of discs across both layers."""
+        return self._base.count() + len(self._custom)
+    
+    def custom_ids(self) -> List[str]:
+        """IDs of the custom discs, which can change without the base changing."""
+        return list(self._custom)
+    
+    def add_disc(self, disc_data: dict) -> Disc:
+        """Add a custom disc to the overlay."""
+        if self.get_by_id(disc_data["id"]) is not None:
+            raise ValueError(f"A disc with ID {disc_data['id']} already exists")
+        new_disc = self._overlay.add_disc(disc_data)
+        self._custom[new_disc.id] = new_disc
+        return new_disc
+    
+    def delete_disc(self, disc_id: str) -> bool:
+        """Delete a custom disc. Base discs are read-only."""
+        if disc_id not in self._custom:
+            return False
+        deleted = self._overlay.delete_disc(disc_id)
+        self._index_overlay()
+        return deleted
+    
+    def apply_changes(self, upserts: Iterable[Disc], deleted_ids: Iterable[str]) -> List[str]:
+        """Replace, add or delete custom discs in one overlay write.
+        
+        Returns the IDs that were skipped because they belong to the base.
+        """
+        skipped = []
+        custom_upserts = []
+        for disc in upserts:
+            if self._base.get_by_id(disc.id) is not None:
+                skipped.append(disc.id)
+            else:
+                custom_upserts.append(disc)
+        custom_deletions = []
+        for disc_id in deleted_ids:
+            if self._base.get_by_id(disc_id) is not None:
+                skipped.append(disc_id)
+            else:
+                custom_deletions.append(disc_id)
+        
+        self._overlay.apply_changes(custom_upserts, custom_deletions)
+        self._index_overlay()
+        return skipped
+    
+    def reload_if_changed(self) -> CatalogChanges:
+        """Pick up edits other processes made to either layer."""
+        base_changes = self._base.reload_if_changed()
+        overlay_changes = self._overlay.reload_if_changed()
+        if not (base_changes or overlay_changes):
+            return CatalogChanges()
+        previous = self._custom
+        self._index_overlay()
+        # Base changes can also shadow or unshadow custom discs
+        return CatalogChanges(True, base_changes.disc_ids | changed_disc_ids(previous, self._custom))
+
+
+def move_custom_discs(base_path: Path, overlay_path: Path) -> int:
+    """Move unprotected discs out of a combined discs.json into the overlay file.
+    
+    Catalogs from before the split keep custom discs next to the official
+    ones. Returns the number of discs moved; 0 if there were none or the
+    base cannot be rewritten.
+    """
+    def read_custom() -> tuple:
+        with open(base_path, "r", encoding="utf-8") as f:
+            entries = json.load(f).get("discs", [])
+        return entries, [entry for entry in entries if not entry.get("protected", False)]
+    
+    # Check without locking first, so a read-only shared base is never touched
+    try:
+        if not base_path.exists() or not read_custom()[1]:
+            return 0
+        with FileLock(base_path):
+            entries, custom = read_custom()
+            if not custom:
+                return 0
+            
+            # Overlay first: if interrupted, the discs are in both files and the next run retries
+            JsonDiscRepository(overlay_path).apply_changes([Disc(**entry) for entry in custom], [])
+            atomic_write_json(base_path, {
+                "discs": [entry for entry in entries if entry.get("protected", False)]
+            })
+    except (OSError, ValueError, AttributeError, TypeError) as e:
+        logger.error("Error moving custom discs to %s: %s", overlay_path.name, e)
+        return 0
+    return len(custom)
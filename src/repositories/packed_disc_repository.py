@@ -0,0 +1,122 @@
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from src.models.disc import Disc
+from src.repositories.compiled_disc_repository import CompiledDiscRepository
+from src.repositories.disc_pack import DiscPackLibrary
+from src.repositories.interfaces import CatalogChanges, IDiscRepository, changed_disc_ids
+from src.repositories.json_disc_repository import JsonDiscRepository
+from src.repositories.layered_disc_repository import LayeredDiscRepository, move_custom_discs
+
+
+class PackedDiscRepository(IDiscRepository):
+    """Disc repository that mounts enabled disc packs over a base catalog.
+    
+    Pack discs are read-only and listed after the base discs. A pack disc
+    whose ID is already taken (by the catalog or an earlier pack) is ignored.
+    """
+    
+    def __init__(self, base: LayeredDiscRepository, packs: DiscPackLibrary):
+        self._base = base
+        self._packs = packs
+        self._pack_discs: Dict[str, Disc] = {}
+        self._generation = None
+        self._mount()
+    
+    def _mount(self) -> None:
+        """Index the discs of every mounted pack."""
+        self._generation = self._packs.generation
+        self._pack_discs = {}
+        for pack in self._packs.mounted():
+            for disc in pack.discs:
+                if disc.id not in self._pack_discs and self._base.get_by_id(disc.id) is None:
+                    self._pack_discs[disc.id] = disc
+    
+    def get_all(self) -> List[Disc]:
+        """Get catalog discs followed by pack discs."""
+        return self._base.get_all() + list(self._pack_discs.values())
+    
+    def iter_all(self) -> Iterator[Disc]:
+        """Yield catalog discs followed by pack discs."""
+        yield from self._base.iter_all()
+        yield from self._pack_discs.values()
+    
+    def get_by_id(self, disc_id: str) -> Optional[Disc]:
+        """Get a disc by its ID from the catalog or a pack."""
+        return self._base.get_by_id(disc_id) or self._pack_discs.get(disc_id)
+    
+    def count(self) -> int:
+        """Get the number of discs across the catalog and packs."""
+        return self._base.count() + len(self._pack_discs)
+    
+    def custom_ids(self) -> List[str]:
+        """IDs of custom and pack discs, which can change without the official catalog changing."""
+        return self._base.custom_ids() + list(self._pack_discs)
+    
+    def add_disc(self, disc_data: dict) -> Disc:
+        """Add a new disc to the base catalog."""
+        new_disc = self._base.add_disc(disc_data)
+        # A pack disc with the same ID is now shadowed
+        self._pack_discs.pop(new_disc.id, None)
+        return new_disc
+    
+    def delete_disc(self, disc_id: str) -> bool:
+        """Delete a disc from the base catalog. Pack discs cannot be deleted."""
+        deleted = self._base.delete_disc(disc_id)
+        if deleted:
+            self._mount()
+        return deleted
+    
+    def apply_changes(self, upserts: Iterable[Disc], deleted_ids: Iterable[str]) -> List[str]:
+        """Replace, add or delete custom discs in one write.
+        
+        Returns the IDs that were skipped because they belong to the
+        official catalog or a pack.
+        """
+        skipped = []
+        custom_upserts = []
+        for disc in upserts:
+            if disc.id in self._pack_discs:
+                skipped.append(disc.id)
+            else:
+                custom_upserts.append(disc)
+        custom_deletions = []
+        for disc_id in deleted_ids:
+            if disc_id in self._pack_discs:
+                skipped.append(disc_id)
+            else:
+                custom_deletions.append(disc_id)
+        
+        skipped.extend(self._base.apply_changes(custom_upserts, custom_deletions))
+        # A new custom disc may shadow a pack disc, or a deleted one reveal it
+        self._mount()
+        return skipped
+    
+    def reload_if_changed(self) -> CatalogChanges:
+        """Pick up catalog edits and packs being added, enabled or disabled."""
+        base_changes = self._base.reload_if_changed()
+        self._packs.reload_if_changed()
+        if not base_changes and self._packs.generation == self._generation:
+            return CatalogChanges()
+        previous = self._pack_discs
+        self._mount()
+        return CatalogChanges(True, base_changes.disc_ids | changed_disc_ids(previous, self._pack_discs))
+
+
+def open_disc_repository(data_path: Path, packs: DiscPackLibrary, migrate: bool = True) -> PackedDiscRepository:
+    """Open the official catalog, custom discs and packs of a data folder as one repository.
+    
+    With migrate=False, custom discs still in discs.json are left there
+    (and listed with the official discs), so the data folder is not written.
+    """
+    base_path, overlay_path = data_path / "discs.json", data_path / "custom_discs.json"
+    official = CompiledDiscRepository(data_path / "discs.bin", base_path)
+    # Official discs are read-only; custom discs live in their own small file.
+    # Only catalogs from before the split need moving, which the compiled
+    # flags tell without parsing discs.json
+    if migrate and official.has_custom_discs() and move_custom_discs(base_path, overlay_path):
+        official.reload_if_changed()
+    return PackedDiscRepository(
+        LayeredDiscRepository(official, JsonDiscRepository(overlay_path)),
+        packs
+    )
@@ -1,4 +1,24 @@
-from .collection_service import CollectionService, DiscWithStatus
+from .async_collection_service import AsyncCollectionService
+from .collection_service import CollectionService, DiscWithStatus, ExternalChanges
+from .icon_fetcher import FetchResult, IconFetcher
+from .icon_store import IconStore, IngestReport, ingest_icons
 from .image_loader import ImageLoader
+from .memory_diagnostics import MemoryDiagnostics, SubsystemUsage
+from .report_exporter import ReportExporter, ReportFilter
 
-__all__ = ["CollectionService", "DiscWithStatus", "ImageLoader"]
+__all__ = [
+    "AsyncCollectionService",
+    "CollectionService",
+    "DiscWithStatus",
+    "ExternalChanges",
+    "FetchResult",
+    "IconFetcher",
+    "IconStore",
+    "ImageLoader",
+    "IngestReport",
+    "MemoryDiagnostics",
+    "ReportExporter",
+    "ReportFilter",
+    "SubsystemUsage",
+    "ingest_icons",
+]
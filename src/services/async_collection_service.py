@@ -0,0 +1,105 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional, Tuple, Union
+
+from src.services.collection_service import CollectionService, DiscWithStatus, ExternalChanges
+
+
+class AsyncCollectionService:
+    """Runs CollectionService calls on a dedicated worker thread.
+    
+    Every method returns a Future. A single worker runs calls strictly in
+    submission order, so operations on the same disc (or anything else)
+    complete in the order they were requested. The wrapped service and its
+    repositories are only ever touched from that worker.
+    
+    Given a factory instead of a service, the service is built on the
+    worker as its first call, so loading the data files overlaps whatever
+    the caller does next. Calls made meanwhile queue up behind it.
+    """
+    
+    def __init__(self, service: Union[CollectionService, Callable[[], CollectionService]]):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="collection-io")
+        if isinstance(service, CollectionService):
+            self._service: Optional[CollectionService] = service
+            self.ready: Future = Future()
+            self.ready.set_result(None)
+        else:
+            self._service = None
+            # Resolves once the service is built; fails if building it failed
+            self.ready = self._executor.submit(self._start, service)
+    
+    def _start(self, factory: Callable[[], CollectionService]) -> None:
+        """Worker: build the service before running any other call."""
+        self._service = factory()
+    
+    def _started(self) -> CollectionService:
+        """The wrapped service. Only call on the worker, where startup has already run."""
+        if self._service is None:
+            raise RuntimeError("Collection service failed to start") from self.ready.exception()
+        return self._service
+    
+    def submit(self, fn: Callable, *args) -> Future:
+        """Run any callable on the worker, ordered with all other calls."""
+        return self._executor.submit(fn, *args)
+    
+    def get_all_discs_with_status(self) -> Future:
+        """Get all discs with their ownership status."""
+        return self.submit(lambda: self._started().get_all_discs_with_status())
+    
+    def toggle_disc(self, disc_id: str) -> Future:
+        """Toggle ownership of a disc. Resolves to the new status."""
+        return self.submit(lambda: self._started().toggle_disc(disc_id))
+    
+    def set_owned_many(self, disc_ids: Iterable[str], owned: bool) -> Future:
+        """Set ownership of several discs. Resolves to the IDs that changed."""
+        disc_ids = list(disc_ids)
+        return self.submit(lambda: self._started().set_owned_many(disc_ids, owned))
+    
+    def get_progress(self) -> Future:
+        """Get progress as (owned_count, total_count)."""
+        return self.submit(lambda: self._started().get_progress())
+    
+    def get_weekly_progress(self, weeks: int = 12) -> Future:
+        """Get discs gained/lost per week for the last `weeks` weeks."""
+        return self.submit(lambda: self._started().get_weekly_progress(weeks))
+    
+    def get_completion_breakdown(self) -> Future:
+        """Get owned/total per artist and per obtain source."""
+        return self.submit(lambda: self._started().get_completion_breakdown())
+    
+    def add_disc(self, disc_data: dict) -> Future:
+        """Add a new disc. Resolves to the created Disc."""
+        return self.submit(lambda: self._started().add_disc(disc_data))
+    
+    def delete_disc(self, disc_id: str) -> Future:
+        """Delete a disc. Resolves to True if deleted."""
+        return self.submit(lambda: self._started().delete_disc(disc_id))
+    
+    def sync_external_changes(self) -> Future:
+        """Merge in edits made by other processes.
+        
+        Resolves to (changes, discs), where discs is the fresh disc list
+        when the catalog changed and None otherwise.
+        """
+        def sync() -> Tuple[ExternalChanges, Optional[List[DiscWithStatus]]]:
+            changes = self._started().sync_external_changes()
+            discs = self._started().get_all_discs_with_status() if changes.catalog_changed else None
+            return changes, discs
+        return self.submit(sync)
+    
+    def get_collection_footprint(self) -> Future:
+        """Get (entry count, estimated bytes) of the collection."""
+        return self.submit(lambda: self._started().get_collection_footprint())
+    
+    def flush(self) -> None:
+        """Wait for all queued calls, then write any debounced saves."""
+        def flush() -> None:
+            # Nothing to write if startup failed
+            if self._service is not None:
+                self._service.flush()
+        self.submit(flush).result()
+    
+    def shutdown(self) -> None:
+        """Flush pending writes and stop the worker."""
+        self.flush()
+        self._executor.shutdown(wait=True)
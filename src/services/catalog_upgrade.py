@@ -0,0 +1,114 @@
+import json
+from dataclasses import dataclass, field, fields, replace
+from pathlib import Path
+from typing import Collection, Dict, List, Optional, Tuple
+
+from src.models.disc import Disc
+from src.repositories.json_disc_repository import JsonDiscRepository
+
+
+# Disc fields an upgrade may change; `id` is the join key and `protected` is always set
+UPGRADED_FIELDS = tuple(f.name for f in fields(Disc) if f.name not in ("id", "protected"))
+
+
+@dataclass
+class UpgradeReport:
+    """What a catalog upgrade changed, or would change in a dry run."""
+    added: List[str] = field(default_factory=list)
+    # Disc ID -> names of the fields that changed
+    updated: Dict[str, List[str]] = field(default_factory=dict)
+    unchanged: int = 0
+    # Official discs missing from the new list; they are kept
+    retired: List[str] = field(default_factory=list)
+    # New official discs whose ID a custom disc already uses; the official one wins
+    shadowed: List[str] = field(default_factory=list)
+    
+    def __bool__(self) -> bool:
+        return bool(self.added or self.updated)
+
+
+def read_disc_list(path: Path) -> List[Disc]:
+    """Read an official disc list, in the discs.json format or as a bare list.
+    
+    Raises ValueError for entries without an ID or name, or duplicate IDs.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    entries = data.get("discs", []) if isinstance(data, dict) else data
+    
+    discs, seen = [], set()
+    for entry in entries:
+        if not isinstance(entry, dict) or not entry.get("id") or not entry.get("name"):
+            raise ValueError(f"Disc entry without an id or name: {entry!r}")
+        if entry["id"] in seen:
+            raise ValueError(f"Duplicate disc ID in {path.name}: {entry['id']}")
+        seen.add(entry["id"])
+        discs.append(Disc(
+            id=entry["id"],
+            name=entry["name"],
+            artist=entry.get("artist", ""),
+            description=entry.get("description", ""),
+            how_to_obtain=entry.get("how_to_obtain", ""),
+            protected=True,
+            image_url=entry.get("image_url")
+        ))
+    return discs
+
+
+def plan_upgrade(
+    current: List[Disc],
+    official: List[Disc],
+    custom_ids: Collection[str] = ()
+) -> Tuple[List[Disc], UpgradeReport]:
+    """Reconcile the current official catalog with a new official list.
+    
+    One hash join on disc ID: the current catalog is indexed once, then
+    each disc of the new list is probed against it. Matched discs take the
+    new values of the fields that differ, unmatched ones are inserted, and
+    current discs nothing matched are kept at the end. The result follows
+    the new list's order.
+    """
+    report = UpgradeReport()
+    by_id = {disc.id: disc for disc in current}
+    merged = []
+    
+    for new in official:
+        old = by_id.pop(new.id, None)
+        if old is None:
+            report.added.append(new.id)
+            if new.id in custom_ids:
+                report.shadowed.append(new.id)
+            merged.append(new)
+            continue
+        changed = [name for name in UPGRADED_FIELDS if getattr(old, name) != getattr(new, name)]
+        if changed or not old.protected:
+            report.updated[new.id] = changed or ["protected"]
+            merged.append(replace(old, protected=True, **{name: getattr(new, name) for name in changed}))
+        else:
+            report.unchanged += 1
+            merged.append(old)
+    
+    report.retired = list(by_id)
+    merged.extend(by_id.values())
+    return merged, report
+
+
+def upgrade_catalog(
+    base: JsonDiscRepository,
+    official: List[Disc],
+    custom_ids: Collection[str] = (),
+    dry_run: bool = False
+) -> UpgradeReport:
+    """Upgrade the official catalog file in a single locked write.
+    
+    Only the base file is written. Custom discs live in their own file and
+    ownership is keyed by disc ID, so both are left as they are.
+    """
+    outcome: Dict[str, UpgradeReport] = {}
+    
+    def transform(current: List[Disc]) -> Optional[List[Disc]]:
+        merged, outcome["report"] = plan_upgrade(current, official, custom_ids)
+        return merged if outcome["report"] and not dry_run else None
+    
+    base.rewrite(transform)
+    return outcome["report"]
@@ -1,9 +1,13 @@
+import time
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from src.models.disc import Disc
 from src.models.collection import Collection
-from src.repositories.interfaces import IDiscRepository, ICollectionRepository
+from src.models.completion import BY_ARTIST, BY_SOURCE, CompletionStats, GroupProgress
+from src.models.history import HistoryEvent, ProgressHistory, WeeklyProgress
+from src.repositories.interfaces import IDiscRepository, ICollectionRepository, IHistoryRepository
+from src.services.memory_diagnostics import deep_sizeof
 
 
 @dataclass
@@ -13,17 +17,32 @@ class DiscWithStatus:
     owned: bool
 
 
+@dataclass
+class ExternalChanges:
+    """Changes other processes made to the shared data files."""
+    catalog_changed: bool
+    owned: Dict[str, bool]
+    
+    def __bool__(self) -> bool:
+        return self.catalog_changed or bool(self.owned)
+
+
 class CollectionService:
     """Business logic for managing the music disc collection."""
     
     def __init__(
         self, 
         disc_repo: IDiscRepository, 
-        collection_repo: ICollectionRepository
+        collection_repo: ICollectionRepository,
+        history_repo: Optional[IHistoryRepository] = None
     ):
         self._disc_repo = disc_repo
         self._collection_repo = collection_repo
+        self._history_repo = history_repo
         self._collection = self._collection_repo.load()
+        self._history = history_repo.load() if history_repo else ProgressHistory()
+        # Built on first use, so callers that never ask (e.g. exports) skip the catalog scan
+        self._stats: Optional[CompletionStats] = None
     
     def get_all_discs_with_status(self) -> List[DiscWithStatus]:
         """Get all discs with their ownership status."""
@@ -36,26 +55,116 @@ class CollectionService:
             for disc in discs
         ]
     
+    def iter_discs_with_status(self) -> Iterator[DiscWithStatus]:
+        """Yield discs with their ownership status one at a time, for streaming exports."""
+        for disc in self._disc_repo.iter_all():
+            yield DiscWithStatus(disc=disc, owned=self._collection.is_owned(disc.id))
+    
     def toggle_disc(self, disc_id: str) -> bool:
         """Toggle ownership of a disc. Returns new status."""
         new_status = self._collection.toggle_disc(disc_id)
+        if self._stats is not None:
+            self._stats.set_owned(disc_id, new_status)
         self._collection_repo.save(self._collection)
+        self._record_history([disc_id], new_status)
         return new_status
     
+    def set_owned_many(self, disc_ids: Iterable[str], owned: bool) -> List[str]:
+        """Set ownership of several discs and persist once. Returns IDs that changed."""
+        changed = self._collection.set_owned_many(disc_ids, owned)
+        if self._stats is not None:
+            for disc_id in changed:
+                self._stats.set_owned(disc_id, owned)
+        if changed:
+            self._collection_repo.save(self._collection)
+            self._record_history(changed, owned)
+        return changed
+    
+    def sync_external_changes(self) -> ExternalChanges:
+        """Merge in edits other processes made to the catalog or collection."""
+        catalog = self._disc_repo.reload_if_changed()
+        # Before the collection, so changes the writer logged are already here
+        logged = self._history_repo.reload_if_changed(self._history) if self._history_repo else []
+        
+        owned = {}
+        stored = self._collection_repo.reload_if_changed()
+        if stored is not None:
+            owned = self._collection.merge_from(stored)
+        self._record_external_history(owned, logged)
+        
+        if self._stats is not None:
+            # Catalog edits first, so ownership lands on discs that are counted
+            for disc_id in catalog.disc_ids:
+                disc = self._disc_repo.get_by_id(disc_id)
+                if disc is None:
+                    self._stats.remove(disc_id)
+                else:
+                    self._stats.add(disc, self._collection.is_owned(disc_id))
+            for disc_id, is_owned in owned.items():
+                self._stats.set_owned(disc_id, is_owned)
+        
+        return ExternalChanges(catalog_changed=bool(catalog), owned=owned)
+    
+    def flush(self) -> None:
+        """Write any deferred collection saves now."""
+        self._collection_repo.flush()
+    
+    def get_weekly_progress(self, weeks: int = 12) -> List[WeeklyProgress]:
+        """Get discs gained/lost per week for the last `weeks` weeks."""
+        return self._history.weekly_progress(weeks, int(time.time()))
+    
+    def _record_external_history(self, owned: Dict[str, bool], logged: List[HistoryEvent]) -> None:
+        """Log merged ownership changes that the process making them did not."""
+        already = {(self._history.disc_ids[event.ordinal], event.owned) for event in logged}
+        for value in (True, False):
+            self._record_history(
+                [disc_id for disc_id, is_owned in owned.items() if is_owned is value and (disc_id, value) not in already],
+                value
+            )
+    
+    def _record_history(self, disc_ids: List[str], owned: bool) -> None:
+        """Append ownership changes to the progress log."""
+        if not disc_ids:
+            return
+        now = int(time.time())
+        events = [self._history.record(disc_id, owned, now) for disc_id in disc_ids]
+        if self._history_repo:
+            self._history_repo.append(self._history, events)
+    
     def get_progress(self) -> Tuple[int, int]:
         """Get progress as (owned_count, total_count)."""
-        total = len(self._disc_repo.get_all())
+        total = self._disc_repo.count()
         owned = self._collection.get_owned_count()
         return (owned, total)
     
+    def get_completion_breakdown(self) -> Dict[str, List[GroupProgress]]:
+        """Get owned/total per artist and per obtain source."""
+        if self._stats is None:
+            self._stats = CompletionStats.build(self._disc_repo.iter_all(), self._collection.is_owned)
+        return {
+            BY_ARTIST: self._stats.breakdown(BY_ARTIST),
+            BY_SOURCE: self._stats.breakdown(BY_SOURCE),
+        }
+    
+    def get_collection_footprint(self) -> Tuple[int, int]:
+        """Get (entry count, estimated bytes) of the in-memory collection."""
+        entries = self._collection.entries
+        return len(entries), deep_sizeof(entries)
+    
     def get_disc_by_id(self, disc_id: str) -> Disc | None:
         """Get a disc by its ID."""
         return self._disc_repo.get_by_id(disc_id)
     
     def add_disc(self, disc_data: dict) -> Disc:
         """Add a new disc to the collection."""
-        return self._disc_repo.add_disc(disc_data)
+        disc = self._disc_repo.add_disc(disc_data)
+        if self._stats is not None:
+            self._stats.add(disc, self._collection.is_owned(disc.id))
+        return disc
     
     def delete_disc(self, disc_id: str) -> bool:
         """Delete a disc from the collection."""
-        return self._disc_repo.delete_disc(disc_id)
+        deleted = self._disc_repo.delete_disc(disc_id)
+        if deleted and self._stats is not None:
+            self._stats.remove(disc_id)
+        return deleted
@@ -0,0 +1,268 @@
+import hashlib
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.models.collection import Collection
+from src.models.disc import Disc
+
+
+SYNC_FORMAT_VERSION = 1
+
+# Two-level digest tree: 16 nodes of 16 leaves; items land in a leaf by ID hash
+NODE_COUNT = 16
+LEAVES_PER_NODE = 16
+LEAF_COUNT = NODE_COUNT * LEAVES_PER_NODE
+
+# Per-disc state: (hash of the catalog record or "" if not in the catalog, owned)
+ItemState = Tuple[str, bool]
+
+# How to resolve a disc whose catalog record changed on both sides
+PREFER_LOCAL = "local"
+PREFER_REMOTE = "remote"
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _leaf_of(disc_id: str) -> int:
+    return hashlib.blake2b(disc_id.encode("utf-8"), digest_size=2).digest()[0]
+
+
+def file_digest(path: Path) -> str:
+    """Content hash of a file ("" if it does not exist)."""
+    try:
+        return _digest(path.read_bytes())
+    except FileNotFoundError:
+        return ""
+
+
+def disc_record(disc: Disc) -> dict:
+    """The catalog fields of a disc, as stored in discs.json."""
+    return asdict(disc)
+
+
+def record_hash(record: Optional[dict]) -> str:
+    """Content hash of a catalog record ("" for no record)."""
+    if record is None:
+        return ""
+    return _digest(json.dumps(record, sort_keys=True, separators=(",", ":")).encode("utf-8"))
+
+
+EMPTY_LEAF_DIGEST = _digest(b"[]")
+
+
+@dataclass
+class SyncIndex:
+    """Per-disc content hashes arranged in a digest tree.
+    
+    Two indexes are compared top-down: equal roots mean nothing changed,
+    and only nodes and leaves whose digests differ are descended into.
+    `catalog_digest` is the hash of the official discs.json the record
+    hashes were taken from, so a later index can reuse them if it matches.
+    """
+    leaves: List[Dict[str, ItemState]]
+    leaf_digests: List[str] = field(default_factory=list)
+    node_digests: List[str] = field(default_factory=list)
+    root: str = ""
+    catalog_digest: str = ""
+    
+    @classmethod
+    def build(cls, items: Dict[str, ItemState], catalog_digest: str = "") -> "SyncIndex":
+        """Bucket items into leaves and compute the digest tree."""
+        leaves: List[Dict[str, ItemState]] = [{} for _ in range(LEAF_COUNT)]
+        for disc_id, state in items.items():
+            leaves[_leaf_of(disc_id)][disc_id] = state
+        index = cls(leaves, catalog_digest=catalog_digest)
+        index._compute_digests(range(LEAF_COUNT))
+        return index
+    
+    def updated(self, items: Dict[str, ItemState], catalog_digest: str) -> "SyncIndex":
+        """A new index holding `items`, rehashing only the leaves that differ from this one."""
+        remaining = dict(items)
+        leaves = [
+            {disc_id: remaining.pop(disc_id) for disc_id in leaf if disc_id in remaining}
+            for leaf in self.leaves
+        ]
+        for disc_id, state in remaining.items():
+            leaves[_leaf_of(disc_id)][disc_id] = state
+        
+        index = SyncIndex(leaves, list(self.leaf_digests), catalog_digest=catalog_digest)
+        index._compute_digests(i for i in range(LEAF_COUNT) if leaves[i] != self.leaves[i])
+        return index
+    
+    def _compute_digests(self, leaves: Iterable[int]) -> None:
+        """Rehash the given leaves, then the nodes and root above them."""
+        if len(self.leaf_digests) != LEAF_COUNT:
+            self.leaf_digests = [""] * LEAF_COUNT
+        for i in leaves:
+            self.leaf_digests[i] = _digest(
+                json.dumps(sorted(self.leaves[i].items()), separators=(",", ":")).encode("utf-8")
+            )
+        self.node_digests = [
+            _digest("".join(self.leaf_digests[n * LEAVES_PER_NODE:(n + 1) * LEAVES_PER_NODE]).encode())
+            for n in range(NODE_COUNT)
+        ]
+        self.root = _digest("".join(self.node_digests).encode())
+    
+    def get(self, disc_id: str) -> Optional[ItemState]:
+        """Get a disc's state, or None if the index has no such disc."""
+        return self.leaves[_leaf_of(disc_id)].get(disc_id)
+    
+    def changed_ids(self, base: "SyncIndex") -> List[str]:
+        """IDs whose state differs from `base`, skipping identical subtrees."""
+        if self.root == base.root:
+            return []
+        
+        changed = []
+        for n in range(NODE_COUNT):
+            if self.node_digests[n] == base.node_digests[n]:
+                continue
+            for leaf in range(n * LEAVES_PER_NODE, (n + 1) * LEAVES_PER_NODE):
+                if self.leaf_digests[leaf] == base.leaf_digests[leaf]:
+                    continue
+                ours, theirs = self.leaves[leaf], base.leaves[leaf]
+                changed.extend(
+                    disc_id for disc_id in ours.keys() | theirs.keys()
+                    if ours.get(disc_id) != theirs.get(disc_id)
+                )
+        return sorted(changed)
+    
+    def to_dict(self) -> dict:
+        """Serialize as a sync point file."""
+        return {
+            "version": SYNC_FORMAT_VERSION,
+            "root": self.root,
+            "catalog": self.catalog_digest,
+            "nodes": self.node_digests,
+            "leaves": {
+                str(i): {"digest": self.leaf_digests[i], "items": {k: list(v) for k, v in leaf.items()}}
+                for i, leaf in enumerate(self.leaves) if leaf
+            },
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "SyncIndex":
+        """Load a sync point file."""
+        if data.get("version") != SYNC_FORMAT_VERSION:
+            raise ValueError(f"Unsupported sync point version: {data.get('version')}")
+        leaves: List[Dict[str, ItemState]] = [{} for _ in range(LEAF_COUNT)]
+        leaf_digests = [EMPTY_LEAF_DIGEST] * LEAF_COUNT
+        for key, leaf in data.get("leaves", {}).items():
+            leaves[int(key)] = {k: (v[0], bool(v[1])) for k, v in leaf["items"].items()}
+            leaf_digests[int(key)] = leaf["digest"]
+        index = cls(leaves, leaf_digests, catalog_digest=data.get("catalog", ""))
+        # Leaf digests are kept; nodes and root are recomputed from them
+        index._compute_digests(())
+        return index
+
+
+@dataclass
+class MergeResult:
+    """What importing a delta changed locally."""
+    upserts: List[Disc] = field(default_factory=list)
+    deletions: List[str] = field(default_factory=list)
+    owned: Dict[str, bool] = field(default_factory=dict)
+    conflicts: List[str] = field(default_factory=list)
+
+
+class CollectionSync:
+    """Computes and applies collection deltas between data directories.
+    
+    Catalog records are hashed lazily, only for the discs an operation
+    touches. `catalog_digest` is the hash of the official discs.json; when
+    it matches a sync point's, that sync point's record hashes are reused.
+    """
+    
+    def __init__(self, discs: List[Disc], collection: Collection, catalog_digest: str = ""):
+        self._discs = {disc.id: disc for disc in discs}
+        self._collection = collection
+        self._catalog_digest = catalog_digest
+        self._hashes: Dict[str, str] = {}
+        self._index: Optional[SyncIndex] = None
+    
+    @property
+    def index(self) -> SyncIndex:
+        """The current state of every disc, hashing the whole catalog unless index_since() ran."""
+        if self._index is None:
+            ids = self._discs.keys() | self._collection.entries.keys()
+            self._index = SyncIndex.build({disc_id: self._state(disc_id) for disc_id in ids}, self._catalog_digest)
+        return self._index
+    
+    def index_since(self, base: SyncIndex, custom_ids: Iterable[str]) -> SyncIndex:
+        """The current index, derived from a sync point.
+        
+        If the official catalog is unchanged since `base`, only custom discs
+        and discs `base` had no record for are hashed again; ownership is
+        compared by value. Only leaves with changed items are rehashed.
+        """
+        if self._index is None and self._catalog_digest and base.catalog_digest == self._catalog_digest:
+            custom = set(custom_ids)
+            for leaf in base.leaves:
+                for disc_id, (base_hash, _) in leaf.items():
+                    if base_hash and disc_id in self._discs and disc_id not in custom:
+                        self._hashes.setdefault(disc_id, base_hash)
+            ids = self._discs.keys() | self._collection.entries.keys()
+            self._index = base.updated({disc_id: self._state(disc_id) for disc_id in ids}, self._catalog_digest)
+        return self.index
+    
+    def _record(self, disc_id: str) -> Optional[dict]:
+        disc = self._discs.get(disc_id)
+        return disc_record(disc) if disc is not None else None
+    
+    def _record_hash(self, disc_id: str) -> str:
+        """Hash of a disc's catalog record, computed once."""
+        hashed = self._hashes.get(disc_id)
+        if hashed is None:
+            hashed = self._hashes[disc_id] = record_hash(self._record(disc_id))
+        return hashed
+    
+    def _state(self, disc_id: str) -> ItemState:
+        return self._record_hash(disc_id), self._collection.is_owned(disc_id)
+    
+    def export_delta(self, base: SyncIndex) -> dict:
+        """Everything that changed locally since the sync point `base`."""
+        items = {}
+        for disc_id in self.index.changed_ids(base):
+            base_state = base.get(disc_id)
+            items[disc_id] = {
+                "base": list(base_state) if base_state else None,
+                "disc": self._record(disc_id),
+                "owned": self._collection.is_owned(disc_id),
+            }
+        return {"version": SYNC_FORMAT_VERSION, "base_root": base.root, "items": items}
+    
+    def merge_delta(self, delta: dict, prefer: str = PREFER_LOCAL) -> MergeResult:
+        """Work out the local changes needed to merge a remote delta.
+        
+        A side that did not change a value since the sync point takes the
+        other side's value. Ownership can't conflict: if both sides changed
+        a boolean, they changed it to the same thing. A catalog record
+        changed differently on both sides is resolved by `prefer`.
+        """
+        if delta.get("version") != SYNC_FORMAT_VERSION:
+            raise ValueError(f"Unsupported delta version: {delta.get('version')}")
+        
+        result = MergeResult()
+        for disc_id, item in delta.get("items", {}).items():
+            base_hash, base_owned = item["base"] or ("", False)
+            local_hash, local_owned = self._state(disc_id)
+            remote_record = item["disc"]
+            remote_hash = record_hash(remote_record)
+            
+            if local_owned == base_owned and item["owned"] != local_owned:
+                result.owned[disc_id] = item["owned"]
+            
+            if remote_hash == local_hash or remote_hash == base_hash:
+                continue
+            if local_hash != base_hash:
+                result.conflicts.append(disc_id)
+                if prefer != PREFER_REMOTE:
+                    continue
+            if remote_record is None:
+                result.deletions.append(disc_id)
+            else:
+                result.upserts.append(Disc(**remote_record))
+        return result
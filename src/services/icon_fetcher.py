@@ -0,0 +1,232 @@
+import hashlib
+import http.client
+import json
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import Dict, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+from src.repositories.file_lock import atomic_write_json
+
+
+logger = logging.getLogger(__name__)
+
+# Concurrent downloads; each worker keeps its own keep-alive connections
+FETCH_WORKERS = 4
+FETCH_TIMEOUT_S = 10
+MAX_ICON_BYTES = 2 * 1024 * 1024
+MAX_REDIRECTS = 3
+USER_AGENT = "MusicDiscTracker/1.0 (icon fetcher)"
+
+INDEX_NAME = "index.json"
+# Downloads finishing within this window share one index write
+INDEX_SAVE_DELAY_S = 2.0
+
+
+@dataclass(frozen=True)
+class FetchResult:
+    """Outcome of fetching or revalidating one icon URL."""
+    path: Path
+    # False when the cached copy was still current
+    changed: bool
+
+
+class IconFetcher:
+    """Downloads icons from their URLs into an on-disk cache.
+    
+    Requests run on a small worker pool, and each worker reuses keep-alive
+    connections per host. Cached icons are revalidated with ETag and
+    Last-Modified, so unchanged icons cost a 304 and no body. Each URL is
+    fetched at most once per session: concurrent and later requests for the
+    same URL share one Future.
+    
+    A cached file's name includes a hash of its content, so a changed icon
+    gets a new path and nothing keyed by the old path goes stale. The URL
+    index is written at most once per INDEX_SAVE_DELAY_S, and on shutdown.
+    """
+    
+    def __init__(self, cache_dir: Path, max_workers: int = FETCH_WORKERS, timeout: float = FETCH_TIMEOUT_S):
+        self._cache_dir = cache_dir
+        self._timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="icon-fetch")
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._requests: Dict[str, Future] = {}
+        self._index: Dict[str, dict] = self._read_index()
+        self._index_dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        self._closed = False
+        # Serializes index writes so an older snapshot never replaces a newer one
+        self._save_lock = threading.Lock()
+    
+    def cached_path(self, url: str) -> Optional[Path]:
+        """Path of the cached download for a URL, without any network access."""
+        with self._lock:
+            entry = self._index.get(url)
+        if entry is None:
+            return None
+        path = self._cache_dir / entry["file"]
+        return path if path.exists() else None
+    
+    def fetch(self, url: str) -> Future:
+        """Download or revalidate an icon. Resolves to a FetchResult."""
+        with self._lock:
+            future = self._requests.get(url)
+            if future is None:
+                future = self._executor.submit(self._fetch, url)
+                self._requests[url] = future
+            return future
+    
+    def shutdown(self) -> None:
+        """Drop queued downloads, write the index and close connections once running ones finish."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            self._closed = True
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+        self._save_index()
+    
+    def _fetch(self, url: str) -> FetchResult:
+        """Worker: conditional GET, following redirects, then update the cache."""
+        with self._lock:
+            entry = dict(self._index.get(url) or {})
+        cached = self._cache_dir / entry["file"] if entry else None
+        if cached is not None and not cached.exists():
+            cached, entry = None, {}
+        
+        headers = {"User-Agent": USER_AGENT}
+        if cached is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        
+        status, response_headers, body = self._get(url, headers)
+        if status == 304 and cached is not None:
+            return FetchResult(cached, changed=False)
+        if status != 200:
+            raise OSError(f"HTTP {status} fetching {url}")
+        if not body:
+            raise OSError(f"Empty response fetching {url}")
+        
+        url_hash = hashlib.blake2b(url.encode("utf-8"), digest_size=8).hexdigest()
+        content_hash = hashlib.blake2b(body, digest_size=6).hexdigest()
+        suffix = PurePosixPath(urlsplit(url).path).suffix.lower() or ".png"
+        path = self._cache_dir / f"{url_hash}-{content_hash}{suffix}"
+        changed = path != cached
+        if changed:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.tmp")
+            tmp_path.write_bytes(body)
+            tmp_path.replace(path)
+        
+        with self._lock:
+            self._index[url] = {
+                "file": path.name,
+                "etag": response_headers.get("etag"),
+                "last_modified": response_headers.get("last-modified"),
+            }
+            self._index_dirty = True
+            save_now = self._closed
+            if not save_now and self._save_timer is None:
+                self._save_timer = threading.Timer(INDEX_SAVE_DELAY_S, self._save_index)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+        if save_now:
+            # Downloads still running at shutdown have no timer to write for them
+            self._save_index()
+        if changed and cached is not None:
+            cached.unlink(missing_ok=True)
+        return FetchResult(path, changed=changed)
+    
+    def _get(self, url: str, headers: Dict[str, str]) -> Tuple[int, Dict[str, str], bytes]:
+        """GET a URL over a pooled connection. Returns (status, lowercased headers, body)."""
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            target = parts.path or "/"
+            if parts.query:
+                target += f"?{parts.query}"
+            
+            status, response_headers, body = self._request(parts.scheme, parts.netloc, target, headers)
+            if status in (301, 302, 303, 307, 308) and "location" in response_headers:
+                url = urljoin(url, response_headers["location"])
+                continue
+            return status, response_headers, body
+        raise OSError(f"Too many redirects fetching {url}")
+    
+    def _request(self, scheme: str, netloc: str, target: str, headers: Dict[str, str]) -> Tuple[int, Dict[str, str], bytes]:
+        """Send one request, retrying once if a kept-alive connection went stale."""
+        for attempt in range(2):
+            connection = self._connection(scheme, netloc)
+            try:
+                connection.request("GET", target, headers=headers)
+                response = connection.getresponse()
+                body = response.read(MAX_ICON_BYTES + 1)
+                response_headers = {k.lower(): v for k, v in response.getheaders()}
+                if len(body) > MAX_ICON_BYTES:
+                    raise OSError(f"Icon at {netloc}{target} is larger than {MAX_ICON_BYTES} bytes")
+                if response.will_close:
+                    self._drop_connection(scheme, netloc)
+                return response.status, response_headers, body
+            except (http.client.HTTPException, ConnectionError):
+                self._drop_connection(scheme, netloc)
+                if attempt:
+                    raise
+            except OSError:
+                self._drop_connection(scheme, netloc)
+                raise
+        raise AssertionError("unreachable")
+    
+    def _connection(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        """This worker's keep-alive connection to a host, opened on first use."""
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = self._local.connections = {}
+        connection = connections.get((scheme, netloc))
+        if connection is None:
+            if scheme == "https":
+                connection = http.client.HTTPSConnection(netloc, timeout=self._timeout)
+            elif scheme == "http":
+                connection = http.client.HTTPConnection(netloc, timeout=self._timeout)
+            else:
+                raise OSError(f"Unsupported URL scheme: {scheme}")
+            connections[(scheme, netloc)] = connection
+        return connection
+    
+    def _drop_connection(self, scheme: str, netloc: str) -> None:
+        """Close and forget this worker's connection to a host."""
+        connection = getattr(self._local, "connections", {}).pop((scheme, netloc), None)
+        if connection is not None:
+            connection.close()
+    
+    def _save_index(self) -> None:
+        """Write the index if it changed, outside the lock that lookups take."""
+        with self._save_lock:
+            with self._lock:
+                self._save_timer = None
+                if not self._index_dirty:
+                    return
+                snapshot = dict(self._index)
+                self._index_dirty = False
+            try:
+                atomic_write_json(self._cache_dir / INDEX_NAME, snapshot)
+            except OSError as e:
+                logger.error("Error writing icon cache index: %s", e)
+                with self._lock:
+                    self._index_dirty = True
+    
+    def _read_index(self) -> Dict[str, dict]:
+        """Load the URL -> cached file and validators map."""
+        try:
+            with open(self._cache_dir / INDEX_NAME, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            return index if isinstance(index, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.error("Error reading icon cache index: %s", e)
+            return {}
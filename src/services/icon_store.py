@@ -0,0 +1,223 @@
+import hashlib
+import io
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from PIL import Image, UnidentifiedImageError
+
+from src.repositories.file_lock import FileStamp, atomic_write_json, file_stamp
+from src.services.thumbnails import THUMBNAIL_SIZES, build_levels
+
+
+logger = logging.getLogger(__name__)
+
+
+MANIFEST_NAME = "manifest.json"
+# Version 2 added the 192 and 256 px levels; older stores are re-ingested
+MANIFEST_VERSION = 2
+
+# Stored icons are squares of the largest thumbnail size
+ICON_SIZE = THUMBNAIL_SIZES[-1]
+IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg", ".gif", ".webp", ".bmp", ".tga"}
+# Refuse to decode anything larger; disc art never needs it
+MAX_SOURCE_PIXELS = 4096 * 4096
+
+
+class IconStore:
+    """Disc icons prepared by the ingest tool, read through its manifest.
+    
+    Each distinct image is stored once as `<digest>.png`, with its smaller
+    thumbnail levels beside it as `<digest>-<size>.png`. Discs sharing art
+    map to the same digest and so to the same file.
+    """
+    
+    def __init__(self, store_dir: Path):
+        self._dir = store_dir
+        self._icons: Dict[str, str] = {}
+        self._stamp: Optional[FileStamp] = None
+        # The manifest is read on first use, or ahead of it by reload_if_changed()
+        self._loaded = False
+    
+    def __len__(self) -> int:
+        if not self._loaded:
+            self.reload_if_changed()
+        return len(self._icons)
+    
+    def icon_path(self, disc_id: str) -> Optional[Path]:
+        """Path of a disc's stored icon, or None if it has none."""
+        if not self._loaded:
+            self.reload_if_changed()
+        digest = self._icons.get(disc_id)
+        return self._dir / f"{digest}.png" if digest else None
+    
+    def level_path(self, path: Path, level: int) -> Optional[Path]:
+        """Where the ingest tool put a thumbnail level of a stored icon.
+        
+        Returns None for paths outside the store.
+        """
+        if path.parent != self._dir:
+            return None
+        return path if level == ICON_SIZE else self._dir / f"{path.stem}-{level}.png"
+    
+    def reload_if_changed(self) -> bool:
+        """Re-read the manifest if the ingest tool rewrote it."""
+        stamp = file_stamp(self._dir / MANIFEST_NAME)
+        if self._loaded and stamp == self._stamp:
+            return False
+        self._stamp = stamp
+        self._icons = _read_manifest(self._dir).get("icons", {})
+        self._loaded = True
+        return True
+
+
+@dataclass
+class IngestReport:
+    """What one ingest run did."""
+    # Source files decoded and normalized this run
+    processed: int = 0
+    # Source files skipped because their size, date or content hash matched
+    unchanged: int = 0
+    removed: int = 0
+    unique_images: int = 0
+    # (source file, reason) for files that were not ingested
+    failed: List[Tuple[str, str]] = field(default_factory=list)
+
+
+def ingest_icons(source_dir: Path, store_dir: Path, workers: Optional[int] = None) -> IngestReport:
+    """Normalize every image in a folder into the icon store.
+    
+    Files are named after their disc ID, as in data/disc-icons/. They are
+    decoded, squared and resized to every thumbnail level in a process
+    pool. Identical images are stored once, keyed by a hash of their
+    pixels. The run is incremental: files whose size and date, or failing
+    that whose byte hash, match the previous run are not decoded again.
+    Stored images no disc uses any more are deleted. A file that fails to
+    decode keeps the image stored for it by an earlier run, if any.
+    """
+    report = IngestReport()
+    previous = _read_manifest(store_dir).get("sources", {})
+    sources: Dict[str, dict] = {}
+    claimed: Dict[str, str] = {}
+    jobs = []
+    
+    for path in sorted(p for p in source_dir.rglob("*") if p.suffix.lower() in IMAGE_SUFFIXES):
+        if store_dir in path.parents or not path.is_file():
+            continue
+        name = path.relative_to(source_dir).as_posix()
+        disc_id = path.stem
+        if disc_id in claimed:
+            report.failed.append((name, f"disc ID {disc_id} already taken by {claimed[disc_id]}"))
+            continue
+        claimed[disc_id] = name
+        
+        stat = path.stat()
+        old = previous.get(name)
+        if (old and old["size"] == stat.st_size and old["mtime_ns"] == stat.st_mtime_ns
+                and (store_dir / f"{old['image']}.png").exists()):
+            sources[name] = old
+            report.unchanged += 1
+            continue
+        known = (old["sha"], old["image"]) if old else None
+        jobs.append((name, path, stat, known))
+    
+    if jobs:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                _ingest_file,
+                [str(path) for _, path, _, _ in jobs],
+                [str(store_dir)] * len(jobs),
+                [known for _, _, _, known in jobs],
+                chunksize=max(1, len(jobs) // (4 * (workers or os.cpu_count() or 1)))
+            )
+            for (name, path, stat, known), (sha, digest, error) in zip(jobs, results):
+                if error:
+                    report.failed.append((name, error))
+                    # Keep serving the last good copy; its old size and date make the next run retry
+                    if previous.get(name):
+                        sources[name] = previous[name]
+                    continue
+                if known and known[0] == sha:
+                    report.unchanged += 1
+                else:
+                    report.processed += 1
+                sources[name] = {
+                    "disc_id": path.stem,
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "sha": sha,
+                    "image": digest,
+                }
+    
+    report.removed = len(previous.keys() - sources.keys())
+    used = {entry["image"] for entry in sources.values()}
+    report.unique_images = len(used)
+    
+    store_dir.mkdir(parents=True, exist_ok=True)
+    atomic_write_json(store_dir / MANIFEST_NAME, {
+        "version": MANIFEST_VERSION,
+        "icons": {entry["disc_id"]: entry["image"] for entry in sources.values()},
+        "sources": sources,
+    })
+    for path in store_dir.glob("*.png"):
+        if path.stem.split("-")[0] not in used:
+            path.unlink(missing_ok=True)
+    return report
+
+
+def _ingest_file(path: str, store_dir: str, known: Optional[Tuple[str, str]]) -> Tuple[str, Optional[str], Optional[str]]:
+    """Worker: hash, validate and normalize one source image.
+    
+    Returns (byte hash, image digest, error). Runs in a child process, so
+    it only takes and returns plain values.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        sha = hashlib.blake2b(data, digest_size=16).hexdigest()
+        store = Path(store_dir)
+        if known and known[0] == sha and (store / f"{known[1]}.png").exists():
+            return sha, known[1], None
+        
+        with Image.open(io.BytesIO(data)) as original:
+            if original.width * original.height > MAX_SOURCE_PIXELS:
+                return sha, None, f"image is {original.width}x{original.height}, larger than allowed"
+            # Animated formats keep their first frame
+            image = original.convert("RGBA")
+        
+        levels = build_levels(image)
+        digest = hashlib.blake2b(levels[ICON_SIZE].tobytes(), digest_size=12).hexdigest()
+        
+        # Another worker may store the same art at the same time; both write identical files
+        if not (store / f"{digest}.png").exists():
+            store.mkdir(parents=True, exist_ok=True)
+            # The full-size file goes last: once it exists, every level does
+            for size, level in sorted(levels.items()):
+                target = store / (f"{digest}.png" if size == ICON_SIZE else f"{digest}-{size}.png")
+                tmp_path = target.with_name(f"{target.stem}.{os.getpid()}.tmp")
+                level.save(tmp_path, format="PNG")
+                os.replace(tmp_path, target)
+        return sha, digest, None
+    except UnidentifiedImageError:
+        return "", None, "not a supported image"
+    except (OSError, ValueError, Image.DecompressionBombError) as e:
+        return "", None, str(e) or type(e).__name__
+
+
+def _read_manifest(store_dir: Path) -> dict:
+    """Load the manifest, treating a missing or unreadable one as empty."""
+    try:
+        with open(store_dir / MANIFEST_NAME, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning("Error reading icon store manifest: %s", e)
+        return {}
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest
@@ -1,25 +1,369 @@
+import hashlib
+import io
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Dict, FrozenSet, Iterable, Optional, Set, Tuple, Union
 
 
 from functools import lru_cache
 
+from PIL import Image
+
+from src.models.disc import Disc
+from src.repositories.disc_pack import DiscPackLibrary, PackIcon
+from src.services.icon_fetcher import IconFetcher
+from src.services.icon_store import IconStore
+from src.services.thumbnails import build_levels, thumbnail_level
+
+
+logger = logging.getLogger(__name__)
+
+
+# A disc image is either a file on disk or an icon inside a mounted disc pack
+ImageSource = Union[Path, PackIcon]
+
+
+def open_image(source: ImageSource) -> Image.Image:
+    """Open an image file, or read a pack icon out of its zip."""
+    if isinstance(source, Path):
+        return Image.open(source)
+    return Image.open(source.open())
+
+
 class ImageLoader:
-    """Service for loading disc images from cache."""
+    """Service for loading disc images from cache.
+    
+    Icons are displayed from a pyramid of prebuilt thumbnails. The first
+    request for an icon decodes the original once and builds every level,
+    writing them to the thumbnail folder; later requests at any size load
+    just the nearest level. Only levels in use are kept in memory.
+    
+    Icons ingested into an icon store come with their levels prebuilt and
+    are used before any other source. With a fetcher, discs without a
+    local or pack icon fall back to an icon downloaded from their image URL.
     
-    def __init__(self, cache_dir: Path):
+    Startup work can run on a background thread: warm_up() lists the icon
+    folder and reads the store manifest, and predecode() decodes the icons
+    the first cards will show. Lookups that need either wait for it. The
+    icon folder is only listed, never probed per disc; rescan_if_changed()
+    picks up icons added to it later.
+    
+    The Tk thread never builds a pyramid itself: it asks for levels with
+    build=False and has request_thumbnail() build missing ones on the
+    background thread.
+    """
+    
+    def __init__(
+        self,
+        cache_dir: Path,
+        packs: Optional[DiscPackLibrary] = None,
+        thumbnail_dir: Optional[Path] = None,
+        fetcher: Optional[IconFetcher] = None,
+        store: Optional[IconStore] = None
+    ):
         self._cache_dir = cache_dir
         self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._packs = packs
+        self._thumbnail_dir = thumbnail_dir
+        self._fetcher = fetcher
+        self._store = store
+        self._levels: Dict[Tuple[ImageSource, int], Image.Image] = {}
+        # File names in the icon folder, the only source for icon lookups there
+        self._icon_names: Optional[FrozenSet[str]] = None
+        self._icon_dir_mtime: Optional[int] = None
+        self._warm_up: Optional[Future] = None
+        # Held while decoding or dropping levels, so a level is never built twice at once
+        self._decode_lock = threading.Lock()
+        self._background: Optional[ThreadPoolExecutor] = None
+        # Background loads in flight, and icons that failed to load
+        self._requests: Dict[Tuple[ImageSource, int], Future] = {}
+        self._failed: Set[ImageSource] = set()
+        self._request_lock = threading.Lock()
+    
+    def warm_up(self) -> None:
+        """Start scanning the icon folder and icon store in the background."""
+        self._warm_up = self._run_in_background(self._scan)
+    
+    def predecode(self, discs: Iterable[Disc], pixel_sizes: Iterable[int]) -> Future:
+        """Decode the thumbnail levels of some discs in the background, ahead of their cards."""
+        discs, pixel_sizes = list(discs), list(pixel_sizes)
+        
+        def decode() -> None:
+            for disc in discs:
+                source = self.get_image_path(disc.id, disc.image_url)
+                if source is None:
+                    continue
+                for pixels in pixel_sizes:
+                    self.thumbnail(source, pixels)
+        return self._run_in_background(decode)
+    
+    def _run_in_background(self, fn) -> Future:
+        """Run startup work on the loader's own thread, in submission order."""
+        if self._background is None:
+            self._background = ThreadPoolExecutor(max_workers=1, thread_name_prefix="icon-startup")
+        return self._background.submit(fn)
+    
+    def _scan(self) -> None:
+        """List the icon folder and read the store manifest."""
+        try:
+            # Stat first, so a file added during the listing still changes it next time
+            self._icon_dir_mtime = self._cache_dir.stat().st_mtime_ns
+            self._icon_names = frozenset(entry.name for entry in os.scandir(self._cache_dir))
+        except OSError as e:
+            logger.warning("Error scanning %s: %s", self._cache_dir, e)
+            self._icon_names = frozenset()
+        if self._store:
+            self._store.reload_if_changed()
+    
+    def _wait_for_warm_up(self) -> None:
+        """Join the background scan before the first lookup that needs it, or scan now without one."""
+        warm_up = self._warm_up
+        if warm_up is not None:
+            warm_up.result()
+            self._warm_up = None
+        elif self._icon_names is None:
+            self._scan()
     
     @lru_cache(maxsize=128)
-    def get_image_path(self, disc_id: str, image_url: Optional[str] = None) -> Optional[Path]:
+    def get_image_path(self, disc_id: str, image_url: Optional[str] = None) -> Optional[ImageSource]:
         """Get the local path for a disc image.
         
         Images should be placed in data/disc-icons/ with filename: {disc_id}.png
+        An ingested copy in the icon store is preferred to the file itself.
+        Otherwise the icon is taken from the first mounted disc pack that has one,
+        and failing that from an earlier download of the disc's image URL.
         """
-        cache_path = self._cache_dir / f"{disc_id}.png"
+        icon = self._local_icon(disc_id)
+        if icon is None and image_url and self._fetcher:
+            icon = self._fetcher.cached_path(image_url)
+        return icon
+    
+    def fetch_icon(self, disc_id: str, image_url: Optional[str]) -> Optional[Future]:
+        """Download or revalidate a disc's icon from its image URL.
         
-        if cache_path.exists():
+        Returns None when there is nothing to fetch: no URL, no fetcher, or
+        the disc has a local or pack icon. Otherwise returns a Future for a
+        FetchResult; call invalidate_downloads() on the Tk thread when it
+        reports a change.
+        """
+        if not image_url or self._fetcher is None or self._local_icon(disc_id) is not None:
+            return None
+        return self._fetcher.fetch(image_url)
+    
+    def _local_icon(self, disc_id: str) -> Optional[ImageSource]:
+        """Find a disc's icon in the icon store, the icon folder or a mounted pack."""
+        self._wait_for_warm_up()
+        if self._store:
+            stored = self._store.icon_path(disc_id)
+            if stored is not None:
+                return stored
+        
+        cache_path = self._cache_dir / f"{disc_id}.png"
+        if cache_path.name in self._icon_names:
             return cache_path
         
+        if self._packs:
+            for pack in self._packs.mounted():
+                icon = pack.icon(disc_id)
+                if icon is not None:
+                    return icon
+        
         return None
+    
+    def thumbnail(self, source: ImageSource, pixels: int, build: bool = True) -> Optional[Image.Image]:
+        """Get the prebuilt thumbnail level for drawing an icon `pixels` wide.
+        
+        Returns None if the icon cannot be loaded. With build=False it also
+        returns None instead of building a missing pyramid, and never waits
+        on a background decode; request_thumbnail() builds it instead.
+        """
+        level = thumbnail_level(pixels)
+        key = (source, level)
+        image = self._levels.get(key)
+        if image is None and not build:
+            try:
+                image = self._read_level(source, level)
+            except OSError:
+                return None
+            if image is not None:
+                # No lock, so the Tk thread never waits on a decode; it is also
+                # the thread that drops levels, so nothing iterates meanwhile
+                self._levels[key] = image
+        elif image is None:
+            with self._decode_lock:
+                # A background predecode may have loaded it meanwhile
+                image = self._levels.get(key)
+                if image is None:
+                    try:
+                        image = self._load_level(source, level)
+                    except Exception as e:
+                        logger.warning("Error loading image %s: %s", source, e)
+                        return None
+                    self._levels[key] = image
+        return image
+    
+    def thumbnail_png(self, source: ImageSource, pixels: int) -> Optional[bytes]:
+        """Get the thumbnail level for `pixels` as PNG bytes, without keeping it in memory.
+        
+        Returns None if the icon cannot be loaded.
+        """
+        level = thumbnail_level(pixels)
+        path = self._thumbnail_path(source, level)
+        try:
+            if path is not None and path.exists():
+                return path.read_bytes()
+            with self._decode_lock:
+                image = self._build_pyramid(source)[level]
+            buffer = io.BytesIO()
+            image.save(buffer, format="PNG")
+            return buffer.getvalue()
+        except Exception as e:
+            logger.warning("Error loading image %s: %s", source, e)
+            return None
+    
+    def request_thumbnail(self, source: ImageSource, pixels: int) -> Optional[Future]:
+        """Load a thumbnail level on the background thread, building the pyramid if needed.
+        
+        The Future resolves once thumbnail(source, pixels, build=False) can
+        return the level. Returns None if the icon already failed to load,
+        so there is nothing to wait for.
+        """
+        key = (source, thumbnail_level(pixels))
+        with self._request_lock:
+            if source in self._failed:
+                return None
+            future = self._requests.get(key)
+            if future is None:
+                future = self._run_in_background(lambda: self._load_requested(key))
+                self._requests[key] = future
+        return future
+    
+    def _load_requested(self, key: Tuple[ImageSource, int]) -> None:
+        """Background: load a requested level and settle its request."""
+        source, level = key
+        image = self.thumbnail(source, level)
+        with self._request_lock:
+            del self._requests[key]
+            if image is None:
+                self._failed.add(source)
+    
+    def retain_sizes(self, pixel_sizes: Iterable[int]) -> None:
+        """Drop in-memory thumbnail levels not needed for the given pixel sizes."""
+        keep = {thumbnail_level(pixels) for pixels in pixel_sizes}
+        # In place and locked, so levels a background predecode is storing are not lost
+        with self._decode_lock:
+            for key in [key for key in self._levels if key[1] not in keep]:
+                del self._levels[key]
+    
+    def level_usage(self) -> Tuple[int, int]:
+        """Count in-memory thumbnail levels and their pixel bytes."""
+        size = sum(image.width * image.height * 4 for image in self._levels.values())
+        return len(self._levels), size
+    
+    def _load_level(self, source: ImageSource, level: int) -> Image.Image:
+        """Read one level from the thumbnail folder, building the pyramid if needed."""
+        image = self._read_level(source, level)
+        return image if image is not None else self._build_pyramid(source)[level]
+    
+    def _read_level(self, source: ImageSource, level: int) -> Optional[Image.Image]:
+        """Read one level from the thumbnail folder, or None if it is not there."""
+        path = self._thumbnail_path(source, level)
+        if path is None or not path.exists():
+            return None
+        try:
+            with Image.open(path) as image:
+                image.load()
+                return image
+        except OSError:
+            return None  # Damaged thumbnail; the next build replaces it
+    
+    def _build_pyramid(self, source: ImageSource) -> Dict[int, Image.Image]:
+        """Decode the original once and build every level, largest first."""
+        with open_image(source) as original:
+            levels = build_levels(original.convert("RGBA"))
+        
+        for size, image in levels.items():
+            path = self._thumbnail_path(source, size)
+            if path is None:
+                break
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_name(f"{path.stem}.tmp.png")
+                image.save(tmp_path)
+                tmp_path.replace(path)
+            except OSError as e:
+                logger.error("Error caching thumbnail for %s: %s", source, e)
+                break
+        return levels
+    
+    def _thumbnail_path(self, source: ImageSource, level: int) -> Optional[Path]:
+        """Where a level is cached; the name changes whenever the original does."""
+        if isinstance(source, Path) and self._store:
+            stored = self._store.level_path(source, level)
+            if stored is not None:
+                return stored
+        if self._thumbnail_dir is None:
+            return None
+        if isinstance(source, Path):
+            stat = source.stat()
+            identity = f"{source.resolve()}|{stat.st_mtime_ns}|{stat.st_size}"
+        else:
+            identity = f"{source.pack_path.resolve()}|{source.member}|{source.version}"
+        digest = hashlib.blake2b(identity.encode("utf-8"), digest_size=10).hexdigest()
+        return self._thumbnail_dir / f"{digest}-{level}.png"
+    
+    def invalidate(self) -> None:
+        """Forget cached lookups, e.g. after packs were enabled or disabled.
+        
+        Packs unmounted since the last call are closed once their icons are
+        no longer cached.
+        """
+        self._wait_for_warm_up()
+        self._scan()
+        self.get_image_path.cache_clear()
+        with self._decode_lock:
+            self._levels.clear()
+            # Under the lock, so no build is reading from a pack being closed
+            if self._packs:
+                self._packs.close_retired()
+        with self._request_lock:
+            self._failed.clear()
+    
+    def rescan_if_changed(self) -> Set[str]:
+        """Rescan the icon folder if files were added to or removed from it.
+        
+        Returns the IDs of discs whose icon file appeared or disappeared;
+        their lookups are forgotten so the next one sees the change.
+        """
+        self._wait_for_warm_up()
+        try:
+            mtime = self._cache_dir.stat().st_mtime_ns
+        except OSError:
+            return set()
+        if mtime == self._icon_dir_mtime:
+            return set()
+        
+        previous = self._icon_names
+        self._scan()
+        changed = previous ^ self._icon_names
+        if changed:
+            self.get_image_path.cache_clear()
+        return {name[:-len(".png")] for name in changed if name.endswith(".png")}
+    
+    def invalidate_downloads(self) -> None:
+        """Forget cached lookups after a download finished.
+        
+        A downloaded icon's path changes with its content, so thumbnail
+        levels already loaded stay valid.
+        """
+        self.get_image_path.cache_clear()
+    
+    def close(self) -> None:
+        """Stop downloading icons and decoding in the background."""
+        if self._fetcher:
+            self._fetcher.shutdown()
+        if self._background:
+            self._background.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,121 @@
+import sys
+import tracemalloc
+from dataclasses import dataclass, fields, is_dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+# Number of allocation sites listed in a snapshot diff
+TOP_ALLOCATION_SITES = 15
+
+
+@dataclass
+class SubsystemUsage:
+    """Live object count and estimated size of one subsystem."""
+    name: str
+    count: int
+    bytes: int
+    detail: str = ""
+
+
+# A probe returns (live object count, estimated bytes, optional detail)
+MemoryProbe = Callable[[], Tuple[int, int, str]]
+
+
+def deep_sizeof(obj, _seen: Optional[set] = None) -> int:
+    """Estimate the memory held by plain data: containers, strings and dataclasses.
+    
+    Other objects are counted shallowly, so widgets or file handles reachable
+    from the data do not drag their whole object graph into the estimate.
+    """
+    seen = _seen if _seen is not None else set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    elif is_dataclass(obj) and not isinstance(obj, type):
+        if hasattr(obj, "__dict__"):
+            size += sys.getsizeof(obj.__dict__)
+        size += sum(deep_sizeof(getattr(obj, f.name), seen) for f in fields(obj))
+    elif hasattr(obj, "__dict__") and not isinstance(obj, type):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def format_bytes(size: int) -> str:
+    """Format a byte count for humans."""
+    for unit in ("B", "KB", "MB"):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+class MemoryDiagnostics:
+    """Per-subsystem memory accounting plus tracemalloc snapshot diffs.
+    
+    Subsystems register probes that report their live objects. Each call to
+    snapshot() diffs Python allocations against the previous snapshot, which
+    shows what grew between two points in a session.
+    """
+    
+    def __init__(self, trace_frames: int = 1):
+        self._probes: Dict[str, MemoryProbe] = {}
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(trace_frames)
+    
+    def register(self, name: str, probe: MemoryProbe) -> None:
+        """Add or replace the probe for a subsystem."""
+        self._probes[name] = probe
+    
+    def collect(self) -> List[SubsystemUsage]:
+        """Run every probe."""
+        usage = []
+        for name, probe in self._probes.items():
+            try:
+                count, size, detail = probe()
+            except Exception as e:
+                count, size, detail = 0, 0, f"probe failed: {e}"
+            usage.append(SubsystemUsage(name, count, size, detail))
+        return usage
+    
+    def snapshot(self) -> List[str]:
+        """Take a tracemalloc snapshot and diff it against the previous one.
+        
+        Returns the allocation sites that grew the most, or an empty list
+        for the first snapshot.
+        """
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+        previous, self._snapshot = self._snapshot, snapshot
+        if previous is None:
+            return []
+        stats = snapshot.compare_to(previous, "lineno")
+        return [str(stat) for stat in stats[:TOP_ALLOCATION_SITES]]
+    
+    def report(self) -> str:
+        """Build a text report of subsystem usage and the latest snapshot diff."""
+        current, peak = tracemalloc.get_traced_memory()
+        lines = [
+            f"Python heap: {format_bytes(current)} (peak {format_bytes(peak)})",
+            f"{'Subsystem':<20}{'Objects':>10}{'Est. size':>14}  Detail",
+        ]
+        for usage in self.collect():
+            lines.append(
+                f"{usage.name:<20}{usage.count:>10}{format_bytes(usage.bytes):>14}  {usage.detail}"
+            )
+        
+        diff = self.snapshot()
+        if diff:
+            lines.append("Top allocation changes since last report:")
+            lines.extend(f"  {line}" for line in diff)
+        else:
+            lines.append("Baseline snapshot taken; the next report shows what changed since now.")
+        return "\n".join(lines)
@@ -0,0 +1,187 @@
+import base64
+import csv
+import html
+import io
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional, TextIO
+
+from src.models.completion import UNKNOWN_GROUP, obtain_sources
+from src.services.collection_service import CollectionService, DiscWithStatus
+from src.services.image_loader import ImageLoader, ImageSource
+
+
+# Report formats
+CSV = "csv"
+MARKDOWN = "md"
+HTML = "html"
+FORMATS = (CSV, MARKDOWN, HTML)
+
+# Ownership filters
+ALL = "all"
+OWNED = "owned"
+MISSING = "missing"
+
+# Rows rendered per write, so output streams without one write per line
+WRITE_BATCH = 256
+
+CSV_COLUMNS = ("id", "name", "artist", "how_to_obtain", "owned")
+
+HTML_STYLE = """
+body { font-family: system-ui, sans-serif; margin: 2rem; color: #171717; }
+table { border-collapse: collapse; width: 100%; }
+th, td { text-align: left; padding: 6px 10px; border-bottom: 1px solid #eaeaea; vertical-align: middle; }
+th { font-weight: 600; color: #666; }
+td.icon img { image-rendering: pixelated; display: block; }
+tr.missing td { color: #8f8f8f; }
+td.status { width: 1.5rem; }
+""".strip()
+
+
+@dataclass(frozen=True)
+class ReportFilter:
+    """Which discs a report lists. Artist and source match case-insensitively."""
+    status: str = ALL
+    artist: Optional[str] = None
+    source: Optional[str] = None
+    
+    def matches(self, disc_status: DiscWithStatus) -> bool:
+        """Check whether a disc belongs in the report."""
+        if self.status == OWNED and not disc_status.owned:
+            return False
+        if self.status == MISSING and disc_status.owned:
+            return False
+        disc = disc_status.disc
+        if self.artist is not None and (disc.artist.strip() or UNKNOWN_GROUP).casefold() != self.artist.casefold():
+            return False
+        if self.source is not None:
+            sources = {source.casefold() for source in obtain_sources(disc.how_to_obtain)}
+            if self.source.casefold() not in sources:
+                return False
+        return True
+
+
+class ReportExporter:
+    """Writes checklists of owned and missing discs as CSV, Markdown or HTML.
+    
+    Rows are produced by generators straight from the catalog and written
+    in small batches, so memory use does not grow with the catalog size.
+    HTML reports are self-contained; thumbnails, if included, are inlined
+    as data URIs read from the thumbnail cache.
+    """
+    
+    def __init__(self, service: CollectionService, image_loader: Optional[ImageLoader] = None):
+        self._service = service
+        self._image_loader = image_loader
+    
+    def export(
+        self,
+        out: TextIO,
+        fmt: str,
+        report_filter: ReportFilter = ReportFilter(),
+        title: str = "Music Disc Checklist",
+        thumbnail_size: Optional[int] = None
+    ) -> int:
+        """Write a report to a text stream. Returns the number of discs listed."""
+        rows = _Counter(d for d in self._service.iter_discs_with_status() if report_filter.matches(d))
+        if fmt == CSV:
+            chunks = self._csv(rows)
+        elif fmt == MARKDOWN:
+            chunks = self._markdown(rows, title)
+        elif fmt == HTML:
+            chunks = self._html(rows, title, thumbnail_size)
+        else:
+            raise ValueError(f"Unknown report format: {fmt}")
+        
+        batch = []
+        for chunk in chunks:
+            batch.append(chunk)
+            if len(batch) >= WRITE_BATCH:
+                out.write("".join(batch))
+                batch.clear()
+        out.write("".join(batch))
+        return rows.count
+    
+    def _csv(self, rows: Iterable[DiscWithStatus]) -> Iterator[str]:
+        """One CSV line per disc, after a header line."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        
+        def line(values) -> str:
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerow(values)
+            return buffer.getvalue()
+        
+        yield line(CSV_COLUMNS)
+        for disc_status in rows:
+            disc = disc_status.disc
+            yield line((disc.id, disc.name, disc.artist, disc.how_to_obtain, "yes" if disc_status.owned else "no"))
+    
+    def _markdown(self, rows: "_Counter", title: str) -> Iterator[str]:
+        """A task list with one checkbox per disc."""
+        yield f"# {_markdown_escape(title)}\n\n"
+        owned = 0
+        for disc_status in rows:
+            disc = disc_status.disc
+            owned += disc_status.owned
+            mark = "x" if disc_status.owned else " "
+            details = " · ".join(_markdown_escape(part) for part in (disc.artist, disc.how_to_obtain) if part)
+            yield f"- [{mark}] **{_markdown_escape(disc.name)}**" + (f" — {details}" if details else "") + "\n"
+        yield f"\n{owned} of {rows.count} discs owned.\n"
+    
+    def _html(self, rows: "_Counter", title: str, thumbnail_size: Optional[int]) -> Iterator[str]:
+        """A single HTML page with one table row per disc."""
+        with_icons = thumbnail_size is not None and self._image_loader is not None
+        data_uri = lru_cache(maxsize=256)(lambda source: self._data_uri(source, thumbnail_size))
+        
+        yield (
+            "<!DOCTYPE html>\n<html lang=\"en\">\n<head>\n<meta charset=\"utf-8\">\n"
+            f"<title>{html.escape(title)}</title>\n<style>\n{HTML_STYLE}\n</style>\n</head>\n<body>\n"
+            f"<h1>{html.escape(title)}</h1>\n<table>\n<thead><tr><th></th>"
+            + ("<th></th>" if with_icons else "")
+            + "<th>Name</th><th>Artist</th><th>How to obtain</th></tr></thead>\n<tbody>\n"
+        )
+        owned = 0
+        for disc_status in rows:
+            disc = disc_status.disc
+            owned += disc_status.owned
+            cells = [f"<td class=\"status\">{'&#10003;' if disc_status.owned else ''}</td>"]
+            if with_icons:
+                source = self._image_loader.get_image_path(disc.id, disc.image_url)
+                uri = data_uri(source) if source is not None else None
+                image = (
+                    f"<img src=\"{uri}\" width=\"{thumbnail_size}\" height=\"{thumbnail_size}\" alt=\"\">"
+                    if uri else ""
+                )
+                cells.append(f"<td class=\"icon\">{image}</td>")
+            cells.extend(f"<td>{html.escape(value)}</td>" for value in (disc.name, disc.artist, disc.how_to_obtain))
+            yield f"<tr class=\"{OWNED if disc_status.owned else MISSING}\">{''.join(cells)}</tr>\n"
+        yield f"</tbody>\n</table>\n<p>{owned} of {rows.count} discs owned.</p>\n</body>\n</html>\n"
+    
+    def _data_uri(self, source: ImageSource, size: int) -> Optional[str]:
+        """Inline a thumbnail as a PNG data URI."""
+        png = self._image_loader.thumbnail_png(source, size)
+        if png is None:
+            return None
+        return "data:image/png;base64," + base64.b64encode(png).decode("ascii")
+
+
+class _Counter:
+    """Passes items through once, counting them."""
+    
+    def __init__(self, items: Iterable):
+        self._items = items
+        self.count = 0
+    
+    def __iter__(self) -> Iterator:
+        for item in self._items:
+            self.count += 1
+            yield item
+
+
+def _markdown_escape(text: str) -> str:
+    """Escape characters Markdown would treat as formatting."""
+    for char in "\\`*_[]<>|#":
+        text = text.replace(char, "\\" + char)
+    return " ".join(text.split())
@@ -0,0 +1,44 @@
+from typing import Dict
+
+from PIL import Image
+
+
+# Prebuilt square thumbnail sizes in pixels, each about 1.4x the previous.
+# The top level covers the largest zoom at 3x display scaling
+THUMBNAIL_SIZES = (16, 24, 32, 48, 64, 96, 128, 192, 256)
+
+
+def thumbnail_level(pixels: int) -> int:
+    """The smallest prebuilt thumbnail size covering `pixels`, so it is scaled down.
+    
+    Requests beyond the largest level get the largest level.
+    """
+    for size in THUMBNAIL_SIZES:
+        if size >= pixels:
+            return size
+    return THUMBNAIL_SIZES[-1]
+
+
+def build_levels(image: Image.Image) -> Dict[int, Image.Image]:
+    """Resize an RGBA image to every thumbnail size, largest first.
+    
+    Non-square art is centered on a transparent square instead of being
+    stretched. Levels larger than the art are enlarged with nearest-neighbour
+    sampling, so small pixel art stays crisp instead of blurring. Smaller
+    levels are each reduced from the one above them, not from the original.
+    """
+    if image.width != image.height:
+        side = max(image.size)
+        square = Image.new("RGBA", (side, side), (0, 0, 0, 0))
+        square.paste(image, ((side - image.width) // 2, (side - image.height) // 2))
+        image = square
+    
+    original = image
+    levels = {}
+    for size in reversed(THUMBNAIL_SIZES):
+        if size >= original.width:
+            levels[size] = original.resize((size, size), Image.NEAREST)
+        else:
+            image = image.resize((size, size), Image.LANCZOS)
+            levels[size] = image
+    return levels
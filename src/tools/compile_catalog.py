@@ -0,0 +1,32 @@
+"""
+Compile data/discs.json into the binary catalog loaded at startup.
+
+Usage: python -m src.tools.compile_catalog [--source PATH] [--output PATH]
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.repositories.compiled_catalog import compile_catalog
+
+
+DATA_PATH = Path(__file__).parent.parent.parent / "data"
+
+
+def main(argv=None) -> int:
+    """Entry point for the catalog compiler."""
+    parser = argparse.ArgumentParser(description="Compile discs.json into a binary disc catalog.")
+    parser.add_argument("--source", type=Path, default=DATA_PATH / "discs.json")
+    parser.add_argument("--output", type=Path, default=DATA_PATH / "discs.bin")
+    args = parser.parse_args(argv)
+    
+    count = compile_catalog(args.source, args.output)
+    print(f"Compiled {count} discs into {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
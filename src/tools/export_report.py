@@ -0,0 +1,76 @@
+"""
+Export a checklist of owned and missing discs as CSV, Markdown or HTML.
+
+Usage:
+    python -m src.tools.export_report OUT [--format csv|md|html]
+        [--status all|owned|missing] [--artist NAME] [--source SOURCE]
+        [--title TITLE] [--thumbnails PIXELS]
+
+OUT may be - for standard output. The format defaults to OUT's extension.
+HTML reports are single files; --thumbnails inlines each disc's icon.
+Output is streamed, so huge catalogs export in constant memory.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.repositories import DiscPackLibrary, JsonCollectionRepository, open_disc_repository
+from src.services.collection_service import CollectionService
+from src.services.icon_store import IconStore
+from src.services.image_loader import ImageLoader
+from src.services.report_exporter import ALL, CSV, FORMATS, HTML, MARKDOWN, MISSING, OWNED, ReportExporter, ReportFilter
+
+
+DATA_PATH = Path(__file__).parent.parent.parent / "data"
+
+SUFFIX_FORMATS = {".csv": CSV, ".md": MARKDOWN, ".markdown": MARKDOWN, ".html": HTML, ".htm": HTML}
+
+
+def main(argv=None) -> int:
+    """Entry point for the report exporter."""
+    parser = argparse.ArgumentParser(description="Export a checklist of owned and missing discs.")
+    parser.add_argument("out", help="output file, or - for standard output")
+    parser.add_argument("--data-dir", type=Path, default=DATA_PATH)
+    parser.add_argument("--format", choices=FORMATS, help="defaults to the output file's extension")
+    parser.add_argument("--status", choices=(ALL, OWNED, MISSING), default=ALL)
+    parser.add_argument("--artist", help="only list discs by this artist")
+    parser.add_argument("--source", help="only list discs obtainable from this source")
+    parser.add_argument("--title", default="Music Disc Checklist")
+    parser.add_argument("--thumbnails", type=int, metavar="PIXELS", help="inline icons of this size (HTML only)")
+    args = parser.parse_args(argv)
+    
+    fmt = args.format or SUFFIX_FORMATS.get(Path(args.out).suffix.lower())
+    if fmt is None:
+        print("Cannot tell the format from the file name; pass --format")
+        return 1
+    if args.thumbnails is not None and fmt != HTML:
+        print("--thumbnails only applies to HTML reports")
+        return 1
+    
+    data_dir = args.data_dir
+    packs = DiscPackLibrary(data_dir / "packs", data_dir / "packs.json")
+    service = CollectionService(
+        open_disc_repository(data_dir, packs),
+        JsonCollectionRepository(data_dir / "collection.json")
+    )
+    image_loader = ImageLoader(
+        data_dir / "disc-icons", packs, data_dir / "thumbnails",
+        store=IconStore(data_dir / "icon-store")
+    )
+    exporter = ReportExporter(service, image_loader)
+    report_filter = ReportFilter(args.status, args.artist, args.source)
+    
+    if args.out == "-":
+        exporter.export(sys.stdout, fmt, report_filter, args.title, args.thumbnails)
+        return 0
+    with open(args.out, "w", encoding="utf-8", newline="") as out:
+        count = exporter.export(out, fmt, report_filter, args.title, args.thumbnails)
+    print(f"{count} discs written to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
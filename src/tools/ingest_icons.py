@@ -0,0 +1,48 @@
+"""
+Prepare a folder of disc icons so the app never decodes the originals.
+
+Usage: python -m src.tools.ingest_icons [SOURCE] [--workers N]
+
+Images in SOURCE (default data/disc-icons/, searched recursively) are named
+after their disc ID. Each is validated, squared and resized to every
+thumbnail size in parallel, and stored once per distinct image in
+data/icon-store/ with a manifest the app reads at startup. Re-running only
+processes files that changed.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.services.icon_store import ingest_icons
+
+
+DATA_PATH = Path(__file__).parent.parent.parent / "data"
+
+
+def main(argv=None) -> int:
+    """Entry point for the icon ingest tool."""
+    parser = argparse.ArgumentParser(description="Normalize and deduplicate a folder of disc icons.")
+    parser.add_argument("source", type=Path, nargs="?", default=DATA_PATH / "disc-icons")
+    parser.add_argument("--store", type=Path, default=DATA_PATH / "icon-store")
+    parser.add_argument("--workers", type=int, help="worker processes (default: one per CPU)")
+    args = parser.parse_args(argv)
+
+    if not args.source.is_dir():
+        print(f"No folder at {args.source}")
+        return 1
+
+    report = ingest_icons(args.source, args.store, args.workers)
+    for name, reason in report.failed:
+        print(f"Skipped {name}: {reason}")
+    print(
+        f"Processed {report.processed}, unchanged {report.unchanged}, removed {report.removed}; "
+        f"{report.unique_images} distinct images in {args.store}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
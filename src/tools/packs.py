@@ -0,0 +1,54 @@
+"""
+List, enable and disable disc packs in data/packs/.
+
+Usage: python -m src.tools.packs [list | enable NAME | disable NAME]
+
+A running app picks up the change within a few seconds.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.repositories.disc_pack import DiscPackLibrary
+
+
+DATA_PATH = Path(__file__).parent.parent.parent / "data"
+
+
+def main(argv=None) -> int:
+    """Entry point for the pack manager."""
+    parser = argparse.ArgumentParser(description="Manage zip disc packs.")
+    parser.add_argument("--packs-dir", type=Path, default=DATA_PATH / "packs")
+    parser.add_argument("--state", type=Path, default=DATA_PATH / "packs.json")
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser("list", help="show packs and whether they are enabled")
+    for command in ("enable", "disable"):
+        commands.add_parser(command, help=f"{command} a pack").add_argument("name")
+    args = parser.parse_args(argv)
+
+    library = DiscPackLibrary(args.packs_dir, args.state)
+
+    if args.command in ("enable", "disable"):
+        if args.name not in library.available():
+            print(f"No pack named {args.name} in {args.packs_dir}")
+            return 1
+        library.set_enabled(args.name, args.command == "enable")
+        print(f"{args.name}: {args.command}d")
+        return 0
+
+    mounted = {pack.name: pack for pack in library.mounted()}
+    for name in library.available():
+        pack = mounted.get(name)
+        if pack is not None:
+            print(f"[x] {name}  {pack.title} ({len(pack.discs)} discs)")
+        else:
+            state = "disabled" if not library.is_enabled(name) else "failed to load"
+            print(f"[ ] {name}  ({state})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
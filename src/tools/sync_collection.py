@@ -0,0 +1,126 @@
+"""
+Sync a collection between data folders on different machines using deltas.
+
+Usage:
+    python -m src.tools.sync_collection snapshot OUT
+    python -m src.tools.sync_collection status SYNC_POINT
+    python -m src.tools.sync_collection export SYNC_POINT OUT
+    python -m src.tools.sync_collection import DELTA [--prefer local|remote]
+
+A sync point records per-disc hashes of a data folder. After a full sync,
+take one snapshot and keep a copy on each machine. Each side then exports
+what changed since it, imports the other side's delta, and takes a new
+snapshot once both sides match. Only changed discs are written to deltas.
+While discs.json is unchanged since the sync point, status and export
+only rehash custom and pack discs and the parts of the index whose discs
+changed. Discs from enabled packs are synced like any other, but are
+only ever changed by their packs.
+Imported ownership changes are recorded in the progress history.
+
+A running app picks up imported changes within a few seconds.
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.repositories.binary_history_repository import BinaryHistoryRepository
+from src.repositories.disc_pack import DiscPackLibrary
+from src.repositories.file_lock import atomic_write_json
+from src.repositories.json_collection_repository import JsonCollectionRepository
+from src.repositories.packed_disc_repository import open_disc_repository
+from src.services.collection_service import CollectionService
+from src.services.collection_sync import PREFER_LOCAL, PREFER_REMOTE, CollectionSync, SyncIndex, file_digest
+
+
+DATA_PATH = Path(__file__).parent.parent.parent / "data"
+
+
+def _read_json(path: Path) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(argv=None) -> int:
+    """Entry point for the sync tool."""
+    parser = argparse.ArgumentParser(description="Sync a collection between data folders.")
+    parser.add_argument("--data-dir", type=Path, default=DATA_PATH)
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("snapshot", help="write a sync point for this data folder").add_argument("out", type=Path)
+    commands.add_parser("status", help="list discs changed since a sync point").add_argument("sync_point", type=Path)
+    export = commands.add_parser("export", help="write the changes since a sync point to a delta file")
+    export.add_argument("sync_point", type=Path)
+    export.add_argument("out", type=Path)
+    merge = commands.add_parser("import", help="merge a delta from another machine into this data folder")
+    merge.add_argument("delta", type=Path)
+    merge.add_argument(
+        "--prefer", choices=(PREFER_LOCAL, PREFER_REMOTE), default=PREFER_LOCAL,
+        help="which catalog entry wins when a disc was edited on both sides"
+    )
+    args = parser.parse_args(argv)
+
+    base_path = args.data_dir / "discs.json"
+    packs = DiscPackLibrary(args.data_dir / "packs", args.data_dir / "packs.json")
+    # Same catalog as the app; status only reads, so it leaves an old discs.json as it is
+    disc_repository = open_disc_repository(args.data_dir, packs, migrate=args.command != "status")
+    collection_repository = JsonCollectionRepository(args.data_dir / "collection.json")
+    collection = collection_repository.load()
+    sync = CollectionSync(disc_repository.get_all(), collection, file_digest(base_path))
+
+    if args.command == "snapshot":
+        atomic_write_json(args.out, sync.index.to_dict())
+        print(f"Sync point {sync.index.root} written to {args.out}")
+        return 0
+
+    if args.command in ("status", "export"):
+        try:
+            base = SyncIndex.from_dict(_read_json(args.sync_point))
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Cannot read sync point {args.sync_point}: {e}")
+            return 1
+        sync.index_since(base, disc_repository.custom_ids())
+        if args.command == "status":
+            for disc_id in sync.index.changed_ids(base):
+                print(disc_id)
+            return 0
+        delta = sync.export_delta(base)
+        atomic_write_json(args.out, delta)
+        print(f"{len(delta['items'])} changed discs written to {args.out}")
+        return 0
+
+    try:
+        delta = _read_json(args.delta)
+        result = sync.merge_delta(delta, prefer=args.prefer)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"Cannot read delta {args.delta}: {e}")
+        return 1
+
+    skipped = []
+    if result.upserts or result.deletions:
+        skipped = disc_repository.apply_changes(result.upserts, result.deletions)
+    # Through the service, so the changes are recorded in the progress history
+    service = CollectionService(
+        disc_repository, collection_repository,
+        BinaryHistoryRepository(args.data_dir / "history.bin", args.data_dir / "history_ids.txt")
+    )
+    for owned in (True, False):
+        service.set_owned_many([i for i, value in result.owned.items() if value is owned], owned)
+    service.flush()
+
+    print(
+        f"Updated {len(result.upserts)} and deleted {len(result.deletions)} catalog discs; "
+        f"changed ownership of {len(result.owned)} discs"
+    )
+    for disc_id in result.conflicts:
+        winner = "theirs" if args.prefer == PREFER_REMOTE else "ours"
+        print(f"Conflict: {disc_id} was edited on both sides; kept {winner}")
+    for disc_id in skipped:
+        print(f"Skipped: {disc_id} is an official or pack disc; update discs.json or the pack instead")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
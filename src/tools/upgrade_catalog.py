@@ -0,0 +1,59 @@
+"""
+Upgrade the official disc catalog from a newer disc list.
+
+Usage: python -m src.tools.upgrade_catalog NEW_DISCS_JSON [--dry-run]
+
+New discs are added and changed fields of official discs are updated in
+data/discs.json, in one write. Custom discs and owned discs are left as
+they are. Official discs missing from the new list are kept. A running
+app picks up the upgrade within a few seconds.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.repositories.json_disc_repository import JsonDiscRepository
+from src.repositories.layered_disc_repository import move_custom_discs
+from src.services.catalog_upgrade import read_disc_list, upgrade_catalog
+
+
+DATA_PATH = Path(__file__).parent.parent.parent / "data"
+
+
+def main(argv=None) -> int:
+    """Entry point for the catalog upgrade."""
+    parser = argparse.ArgumentParser(description="Merge a newer official disc list into the catalog.")
+    parser.add_argument("new_discs", type=Path, help="disc list in the discs.json format")
+    parser.add_argument("--data-dir", type=Path, default=DATA_PATH)
+    parser.add_argument("--dry-run", action="store_true", help="report the changes without writing them")
+    args = parser.parse_args(argv)
+
+    try:
+        official = read_disc_list(args.new_discs)
+    except (OSError, ValueError, AttributeError) as e:
+        print(f"Cannot read disc list {args.new_discs}: {e}")
+        return 1
+
+    base_path, overlay_path = args.data_dir / "discs.json", args.data_dir / "custom_discs.json"
+    move_custom_discs(base_path, overlay_path)
+    custom_ids = {disc.id for disc in JsonDiscRepository(overlay_path).get_all()}
+    report = upgrade_catalog(JsonDiscRepository(base_path), official, custom_ids, dry_run=args.dry_run)
+
+    for disc_id in report.added:
+        print(f"Added: {disc_id}")
+    for disc_id, changed in report.updated.items():
+        print(f"Updated: {disc_id} ({', '.join(changed)})")
+    for disc_id in report.retired:
+        print(f"Kept: {disc_id} is not in the new list")
+    for disc_id in report.shadowed:
+        print(f"Shadowed: custom disc {disc_id} now has an official disc with the same ID")
+    summary = f"{len(report.added)} added, {len(report.updated)} updated, {report.unchanged} unchanged"
+    print(f"Dry run, nothing written: {summary}" if args.dry_run else summary)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
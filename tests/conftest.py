@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Make the src package importable, as the entry points and tools do
+sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -0,0 +1,61 @@
+import threading
+
+import pytest
+
+from src.repositories import JsonCollectionRepository, JsonDiscRepository
+from src.repositories.file_lock import atomic_write_json
+from src.services.async_collection_service import AsyncCollectionService
+from src.services.collection_service import CollectionService
+
+
+@pytest.fixture
+def make_service(tmp_path):
+    atomic_write_json(tmp_path / "discs.json", {"discs": [
+        {"id": disc_id, "name": disc_id, "artist": "C418"} for disc_id in ("cat", "13")
+    ]})
+    
+    def make():
+        return CollectionService(
+            JsonDiscRepository(tmp_path / "discs.json"),
+            JsonCollectionRepository(tmp_path / "collection.json")
+        )
+    return make
+
+
+def test_calls_run_in_order_on_one_worker(make_service):
+    service = AsyncCollectionService(make_service())
+    caller = threading.get_ident()
+    threads = set()
+    futures = [service.toggle_disc("cat") for _ in range(5)]
+    futures.append(service.submit(lambda: threads.add(threading.get_ident())))
+    assert [future.result() for future in futures[:5]] == [True, False, True, False, True]
+    futures[-1].result()
+    assert caller not in threads
+    assert service.get_collection_footprint().result()[0] == 1
+    service.shutdown()
+
+
+def test_factory_runs_on_the_worker_before_queued_calls(make_service):
+    started = threading.Event()
+    
+    def factory():
+        started.wait(5)
+        return make_service()
+    
+    service = AsyncCollectionService(factory)
+    progress = service.get_progress()
+    assert not progress.done()
+    started.set()
+    assert progress.result(timeout=5) == (0, 2)
+    service.shutdown()
+
+
+def test_failed_startup_fails_every_call():
+    def factory():
+        raise OSError("data folder missing")
+    
+    service = AsyncCollectionService(factory)
+    assert isinstance(service.ready.exception(timeout=5), OSError)
+    with pytest.raises(RuntimeError):
+        service.get_progress().result(timeout=5)
+    service.shutdown()
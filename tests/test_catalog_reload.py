@@ -0,0 +1,93 @@
+import json
+import zipfile
+
+from src.models.completion import BY_ARTIST
+from src.repositories import (
+    CompiledDiscRepository,
+    DiscPackLibrary,
+    JsonCollectionRepository,
+    JsonDiscRepository,
+    LayeredDiscRepository,
+    PackedDiscRepository,
+)
+from src.repositories.file_lock import atomic_write_json
+from src.services.collection_service import CollectionService
+
+
+def disc(disc_id, artist="C418", **fields):
+    return {"id": disc_id, "name": disc_id.title(), "artist": artist, "protected": True, **fields}
+
+
+def write_discs(path, *entries):
+    atomic_write_json(path, {"discs": list(entries)})
+
+
+def test_json_reload_reports_added_removed_and_edited_ids(tmp_path):
+    path = tmp_path / "discs.json"
+    write_discs(path, disc("cat"), disc("13"), disc("blocks"))
+    repository = JsonDiscRepository(path)
+    assert not repository.reload_if_changed()
+    
+    write_discs(path, disc("cat"), disc("13", artist="Someone"), disc("pigstep"))
+    changes = repository.reload_if_changed()
+    assert changes
+    assert changes.disc_ids == {"13", "blocks", "pigstep"}
+
+
+def test_compiled_reload_diffs_records_without_decoding(tmp_path):
+    source = tmp_path / "discs.json"
+    write_discs(source, disc("cat"), disc("13"), disc("blocks", image_url="http://x/blocks.png"))
+    repository = CompiledDiscRepository(tmp_path / "discs.bin", source)
+    
+    write_discs(source, disc("cat"), disc("13"), disc("blocks", image_url="http://x/other.png"), disc("mall"))
+    changes = repository.reload_if_changed()
+    assert changes.disc_ids == {"blocks", "mall"}
+    assert repository.get_by_id("blocks").image_url == "http://x/other.png"
+
+
+def test_layered_reload_reports_unshadowed_custom_discs(tmp_path):
+    base_path, overlay_path = tmp_path / "discs.json", tmp_path / "custom_discs.json"
+    write_discs(base_path, disc("cat"), disc("mine"))
+    write_discs(overlay_path, {**disc("mine", artist="Me"), "protected": False})
+    repository = LayeredDiscRepository(JsonDiscRepository(base_path), JsonDiscRepository(overlay_path))
+    assert repository.get_by_id("mine").artist == "C418"
+    
+    # The base drops the disc, so the custom one shows through
+    write_discs(base_path, disc("cat"))
+    changes = repository.reload_if_changed()
+    assert "mine" in changes.disc_ids
+    assert repository.get_by_id("mine").artist == "Me"
+
+
+def test_packed_reload_reports_discs_of_added_packs(tmp_path):
+    write_discs(tmp_path / "discs.json", disc("cat"))
+    packs_dir = tmp_path / "packs"
+    packs = DiscPackLibrary(packs_dir, tmp_path / "packs.json")
+    repository = PackedDiscRepository(JsonDiscRepository(tmp_path / "discs.json"), packs)
+    
+    packs_dir.mkdir()
+    with zipfile.ZipFile(packs_dir / "extra.zip", "w") as pack:
+        pack.writestr("pack.json", json.dumps({"discs": [disc("cat"), disc("otherside")]}))
+    changes = repository.reload_if_changed()
+    # cat is shadowed by the catalog, so only the new disc counts
+    assert changes.disc_ids == {"otherside"}
+    assert not repository.reload_if_changed()
+
+
+def test_service_applies_catalog_changes_to_built_stats(tmp_path):
+    path = tmp_path / "discs.json"
+    write_discs(path, disc("cat"), disc("13"), disc("pigstep", artist="Lena Raine"))
+    collection_repository = JsonCollectionRepository(tmp_path / "collection.json")
+    service = CollectionService(JsonDiscRepository(path), collection_repository)
+    service.set_owned_many(["cat", "pigstep"], True)
+    assert {g.name: (g.owned, g.total) for g in service.get_completion_breakdown()[BY_ARTIST]} == {
+        "C418": (1, 2), "Lena Raine": (1, 1)
+    }
+    
+    write_discs(path, disc("cat"), disc("13", artist="Lena Raine"), disc("otherside", artist="Lena Raine"))
+    changes = service.sync_external_changes()
+    assert changes.catalog_changed
+    assert {g.name: (g.owned, g.total) for g in service.get_completion_breakdown()[BY_ARTIST]} == {
+        "C418": (1, 1), "Lena Raine": (0, 2)
+    }
+    collection_repository.flush()
@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+from src.models.disc import Disc
+from src.repositories.file_lock import atomic_write_json
+from src.repositories.json_disc_repository import JsonDiscRepository
+from src.services.catalog_upgrade import plan_upgrade, read_disc_list, upgrade_catalog
+
+
+def official(disc_id, name=None, **fields):
+    return Disc(disc_id, name or disc_id.title(), "C418", protected=True, **fields)
+
+
+def test_plan_joins_on_id_and_follows_the_new_order():
+    current = [official("cat"), official("13"), official("far")]
+    new = [official("13", description="Eerie"), official("pigstep"), official("cat")]
+    
+    merged, report = plan_upgrade(current, new, custom_ids={"pigstep"})
+    assert [disc.id for disc in merged] == ["13", "pigstep", "cat", "far"]
+    assert merged[0].description == "Eerie"
+    assert report.added == ["pigstep"]
+    assert report.updated == {"13": ["description"]}
+    assert report.unchanged == 1
+    assert report.retired == ["far"]
+    assert report.shadowed == ["pigstep"]
+
+
+def test_plan_protects_discs_that_became_official():
+    current = [Disc("cat", "Cat", "C418", protected=False)]
+    merged, report = plan_upgrade(current, [official("cat")])
+    assert merged[0].protected
+    assert report.updated == {"cat": ["protected"]}
+
+
+def test_unchanged_catalog_needs_no_upgrade():
+    discs = [official("cat"), official("13")]
+    merged, report = plan_upgrade(discs, list(discs))
+    assert not report
+    assert merged == discs
+
+
+def test_read_disc_list_rejects_duplicates_and_accepts_bare_lists(tmp_path):
+    path = tmp_path / "official.json"
+    path.write_text(json.dumps([{"id": "cat", "name": "Cat"}]), encoding="utf-8")
+    assert read_disc_list(path)[0].protected
+    
+    path.write_text(json.dumps({"discs": [{"id": "cat", "name": "Cat"}, {"id": "cat", "name": "Cat"}]}), encoding="utf-8")
+    with pytest.raises(ValueError):
+        read_disc_list(path)
+
+
+def test_dry_run_leaves_the_catalog_alone(tmp_path):
+    path = tmp_path / "discs.json"
+    atomic_write_json(path, {"discs": [{"id": "cat", "name": "Cat", "artist": "C418", "protected": True}]})
+    before = path.read_bytes()
+    
+    report = upgrade_catalog(JsonDiscRepository(path), [official("cat"), official("13")], dry_run=True)
+    assert report.added == ["13"]
+    assert path.read_bytes() == before
+    
+    upgrade_catalog(JsonDiscRepository(path), [official("cat"), official("13")])
+    assert [disc.id for disc in JsonDiscRepository(path).get_all()] == ["cat", "13"]
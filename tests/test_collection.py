@@ -0,0 +1,41 @@
+from src.models.collection import Collection
+from src.repositories import JsonCollectionRepository, JsonDiscRepository
+from src.repositories.file_lock import atomic_write_json
+from src.services.collection_service import CollectionService
+
+
+def test_set_owned_many_reports_only_discs_that_changed():
+    collection = Collection()
+    collection.toggle_disc("cat")
+    collection.pop_changes()
+    
+    assert collection.set_owned_many(["cat", "13", "13", "far"], True) == ["13", "far"]
+    assert collection.get_owned_count() == 3
+    assert collection.pop_changes() == {"13": True, "far": True}
+    assert collection.pop_changes() == {}
+
+
+def test_merged_states_are_not_local_changes():
+    collection, other = Collection(), Collection()
+    collection.toggle_disc("cat")
+    collection.pop_changes()
+    other.set_owned_many(["13"], True)
+    
+    assert collection.merge_from(other) == {"cat": False, "13": True}
+    assert collection.pop_changes() == {}
+
+
+def test_bulk_changes_update_progress_and_history(tmp_path):
+    atomic_write_json(tmp_path / "discs.json", {"discs": [
+        {"id": disc_id, "name": disc_id, "artist": "C418"} for disc_id in ("cat", "13", "far")
+    ]})
+    repository = JsonCollectionRepository(tmp_path / "collection.json")
+    service = CollectionService(JsonDiscRepository(tmp_path / "discs.json"), repository)
+    
+    assert service.set_owned_many(["cat", "13"], True) == ["cat", "13"]
+    assert service.set_owned_many(["cat", "far"], True) == ["far"]
+    assert service.get_progress() == (3, 3)
+    assert service.get_weekly_progress(1)[-1].gained == 3
+    assert service.set_owned_many(["cat", "far"], False) == ["cat", "far"]
+    service.flush()
+    assert JsonCollectionRepository(tmp_path / "collection.json").load().get_owned_count() == 1
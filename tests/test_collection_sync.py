@@ -0,0 +1,93 @@
+from src.models.collection import Collection
+from src.models.disc import Disc
+from src.services.collection_sync import (
+    PREFER_REMOTE,
+    CollectionSync,
+    SyncIndex,
+    disc_record,
+    record_hash,
+)
+
+
+def make_discs(count=40):
+    return [Disc(f"disc-{i}", f"Disc {i}", "C418") for i in range(count)]
+
+
+def owned(*disc_ids):
+    collection = Collection()
+    collection.set_owned_many(disc_ids, True)
+    return collection
+
+
+def test_equal_indexes_report_nothing_changed():
+    discs = make_discs()
+    first = CollectionSync(discs, owned("disc-1")).index
+    second = CollectionSync(discs, owned("disc-1")).index
+    assert first.root == second.root
+    assert first.changed_ids(second) == []
+
+
+def test_changed_ids_finds_edits_additions_and_ownership():
+    discs = make_discs()
+    base = CollectionSync(discs, owned()).index
+    edited = list(discs)
+    edited[3] = Disc("disc-3", "Renamed", "C418")
+    edited.append(Disc("new", "New", "Me"))
+    current = CollectionSync(edited[1:], owned("disc-7")).index
+    assert current.changed_ids(base) == ["disc-0", "disc-3", "disc-7", "new"]
+
+
+def test_updated_matches_a_full_build():
+    discs = make_discs()
+    base = CollectionSync(discs, owned()).index
+    items = {disc.id: (record_hash(disc_record(disc)), disc.id == "disc-5") for disc in discs[2:]}
+    assert base.updated(items, "").root == SyncIndex.build(items).root
+
+
+def test_sync_point_round_trips():
+    index = CollectionSync(make_discs(), owned("disc-2"), "catalog").index
+    loaded = SyncIndex.from_dict(index.to_dict())
+    assert loaded.root == index.root
+    assert loaded.catalog_digest == "catalog"
+    assert loaded.get("disc-2") == index.get("disc-2")
+    assert loaded.changed_ids(index) == []
+
+
+def test_index_since_reuses_hashes_of_an_unchanged_catalog():
+    discs = make_discs()
+    full = CollectionSync(discs, owned("disc-9"), "catalog").index
+    base = SyncIndex.build({disc.id: (full.get(disc.id)[0], False) for disc in discs}, "catalog")
+    current = CollectionSync(discs, owned("disc-9"), "catalog").index_since(base, [])
+    assert current.root == full.root
+    assert current.changed_ids(base) == ["disc-9"]
+
+
+def test_index_since_rehashes_custom_discs_only():
+    discs = make_discs(3)
+    stale = {disc.id: ("stale", False) for disc in discs}
+    base = SyncIndex.build(stale, "catalog")
+    # The catalog is unchanged, so only the custom disc's record is hashed again
+    current = CollectionSync(discs, owned(), "catalog").index_since(base, ["disc-1"])
+    assert current.changed_ids(base) == ["disc-1"]
+    # A changed catalog hashes everything
+    changed = CollectionSync(discs, owned(), "other").index_since(base, ["disc-1"])
+    assert changed.changed_ids(base) == ["disc-0", "disc-1", "disc-2"]
+
+
+def test_merge_delta_takes_remote_changes_and_flags_conflicts():
+    discs = make_discs(3)
+    base = CollectionSync(discs, owned()).index
+    remote = CollectionSync(
+        [Disc("disc-0", "Remote", "C418"), Disc("disc-1", "Remote", "C418"), discs[2]],
+        owned("disc-2")
+    )
+    delta = remote.export_delta(base)
+    local = CollectionSync([discs[0], Disc("disc-1", "Local", "C418"), discs[2]], owned())
+    
+    result = local.merge_delta(delta)
+    assert [disc.name for disc in result.upserts] == ["Remote"]
+    assert result.conflicts == ["disc-1"]
+    assert result.owned == {"disc-2": True}
+    
+    preferred = local.merge_delta(delta, prefer=PREFER_REMOTE)
+    assert sorted(disc.id for disc in preferred.upserts) == ["disc-0", "disc-1"]
@@ -0,0 +1,91 @@
+import os
+
+import pytest
+
+from src.repositories.compiled_catalog import CompiledCatalog, compile_catalog
+from src.repositories.file_lock import atomic_write_json
+
+
+def write_discs(path, count, **extra):
+    atomic_write_json(path, {"discs": [
+        {"id": f"disc-{i}", "name": f"Disc {i}", "artist": "C418", "protected": True, **extra}
+        for i in range(count)
+    ]})
+
+
+def open_compiled(tmp_path, count, **extra):
+    source = tmp_path / "discs.json"
+    write_discs(source, count, **extra)
+    compile_catalog(source, tmp_path / "discs.bin")
+    return source, CompiledCatalog(tmp_path / "discs.bin")
+
+
+def test_every_id_is_found_through_the_hash_index(tmp_path):
+    _, catalog = open_compiled(tmp_path, 500)
+    assert len(catalog) == 500
+    for i in range(500):
+        index = catalog.index_of(f"disc-{i}")
+        assert catalog.disc_at(index).id == f"disc-{i}"
+    assert catalog.index_of("missing") is None
+    catalog.close()
+
+
+def test_empty_catalog_has_no_ids(tmp_path):
+    _, catalog = open_compiled(tmp_path, 0)
+    assert catalog.index_of("disc-0") is None
+    catalog.close()
+
+
+def test_records_round_trip(tmp_path):
+    source = tmp_path / "discs.json"
+    atomic_write_json(source, {"discs": [
+        {"id": "cat", "name": "Cat", "artist": "C418", "protected": True, "image_url": "http://x/cat.png"},
+        {"id": "mine", "name": "Mine", "artist": "Me", "description": "Über", "protected": False},
+    ]})
+    compile_catalog(source, tmp_path / "discs.bin")
+    catalog = CompiledCatalog(tmp_path / "discs.bin")
+    cat, mine = catalog.disc_at(0), catalog.disc_at(1)
+    assert (cat.image_url, cat.protected) == ("http://x/cat.png", True)
+    assert (mine.description, mine.image_url, mine.protected) == ("Über", None, False)
+    assert catalog.has_unprotected()
+    catalog.close()
+
+
+def test_record_digests_change_only_for_edited_discs(tmp_path):
+    source, catalog = open_compiled(tmp_path, 3)
+    before = catalog.record_digests()
+    catalog.close()
+    
+    atomic_write_json(source, {"discs": [
+        {"id": "disc-0", "name": "Disc 0", "artist": "C418", "protected": True},
+        {"id": "disc-1", "name": "Disc 1", "artist": "Someone else", "protected": True},
+        {"id": "disc-2", "name": "Disc 2", "artist": "C418", "protected": True},
+    ]})
+    compile_catalog(source, tmp_path / "discs.bin")
+    catalog = CompiledCatalog(tmp_path / "discs.bin")
+    after = catalog.record_digests()
+    assert [disc_id for disc_id in before if before[disc_id] != after[disc_id]] == ["disc-1"]
+    catalog.close()
+
+
+def test_copied_source_is_current_by_content(tmp_path):
+    source, catalog = open_compiled(tmp_path, 3)
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000_000))
+    assert catalog.is_current(source)
+    # The new fingerprint was written back to the header
+    catalog.close()
+    assert CompiledCatalog(tmp_path / "discs.bin").source_mtime_ns == source.stat().st_mtime_ns
+    
+    write_discs(source, 4)
+    assert not CompiledCatalog(tmp_path / "discs.bin").is_current(source)
+
+
+def test_garbage_is_rejected(tmp_path):
+    path = tmp_path / "discs.bin"
+    path.write_bytes(b"MDTC")
+    with pytest.raises(ValueError):
+        CompiledCatalog(path)
+    path.write_bytes(b"x" * 200)
+    with pytest.raises(ValueError):
+        CompiledCatalog(path)
@@ -0,0 +1,71 @@
+from src.models.completion import BY_ARTIST, BY_SOURCE, UNKNOWN_GROUP, CompletionStats, obtain_sources
+from src.models.disc import Disc
+
+
+def counts(stats, dimension):
+    return {group.name: (group.owned, group.total) for group in stats.breakdown(dimension)}
+
+
+def make_stats():
+    discs = [
+        Disc("cat", "cat", "C418", how_to_obtain="Dungeon chest, Creeper"),
+        Disc("13", "13", "C418", how_to_obtain="Dungeon chest"),
+        Disc("pigstep", "Pigstep", "Lena Raine", how_to_obtain="Bastion chest"),
+        Disc("custom", "Custom", "", how_to_obtain=""),
+    ]
+    return CompletionStats.build(discs, {"cat", "pigstep"}.__contains__)
+
+
+def test_obtain_sources_split_and_default():
+    assert obtain_sources(" Dungeon chest , Creeper,, ") == ["Dungeon chest", "Creeper"]
+    assert obtain_sources("") == [UNKNOWN_GROUP]
+
+
+def test_build_groups_by_artist_and_source():
+    stats = make_stats()
+    assert counts(stats, BY_ARTIST) == {"C418": (1, 2), "Lena Raine": (1, 1), UNKNOWN_GROUP: (0, 1)}
+    assert counts(stats, BY_SOURCE) == {
+        "Dungeon chest": (1, 2),
+        "Creeper": (1, 1),
+        "Bastion chest": (1, 1),
+        UNKNOWN_GROUP: (0, 1),
+    }
+
+
+def test_breakdown_is_sorted_largest_first_and_copied():
+    stats = make_stats()
+    groups = stats.breakdown(BY_ARTIST)
+    assert groups[0].name == "C418"
+    groups[0].owned = 99
+    assert counts(stats, BY_ARTIST)["C418"] == (1, 2)
+
+
+def test_set_owned_moves_only_that_discs_groups():
+    stats = make_stats()
+    stats.set_owned("13", True)
+    stats.set_owned("13", True)
+    stats.set_owned("unknown-id", True)
+    assert counts(stats, BY_ARTIST)["C418"] == (2, 2)
+    assert counts(stats, BY_SOURCE)["Dungeon chest"] == (2, 2)
+    assert counts(stats, BY_SOURCE)["Creeper"] == (1, 1)
+
+
+def test_remove_drops_empty_groups():
+    stats = make_stats()
+    stats.remove("pigstep")
+    stats.remove("pigstep")
+    assert "Lena Raine" not in counts(stats, BY_ARTIST)
+    assert "Bastion chest" not in counts(stats, BY_SOURCE)
+
+
+def test_add_replaces_an_edited_disc():
+    stats = make_stats()
+    stats.add(Disc("13", "13", "Someone else", how_to_obtain="Trade"), owned=True)
+    assert counts(stats, BY_ARTIST)["C418"] == (1, 1)
+    assert counts(stats, BY_ARTIST)["Someone else"] == (1, 1)
+    assert counts(stats, BY_SOURCE)["Dungeon chest"] == (1, 1)
+
+
+def test_duplicate_source_counts_a_disc_once():
+    stats = CompletionStats.build([Disc("a", "A", "X", how_to_obtain="Chest, Chest")], lambda _: False)
+    assert counts(stats, BY_SOURCE) == {"Chest": (0, 1)}
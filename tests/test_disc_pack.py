@@ -0,0 +1,78 @@
+import json
+import zipfile
+
+import pytest
+
+from src.repositories.disc_pack import DiscPack, DiscPackLibrary
+
+
+def write_pack(path, disc_id):
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("pack.json", json.dumps({"discs": [{"id": disc_id, "name": disc_id}]}))
+        archive.writestr(f"icons/{disc_id}.png", b"not really a png")
+
+
+def test_disabling_a_pack_keeps_it_open_until_close_retired(tmp_path):
+    packs_dir = tmp_path / "packs"
+    packs_dir.mkdir()
+    write_pack(packs_dir / "a.zip", "a1")
+    write_pack(packs_dir / "b.zip", "b1")
+    library = DiscPackLibrary(packs_dir, tmp_path / "packs.json")
+    icon = library.mounted()[1].icon("b1")
+    
+    library.set_enabled("b.zip", False)
+    
+    assert [pack.name for pack in library.mounted()] == ["a.zip"]
+    assert icon.open().read() == b"not really a png"
+    
+    library.close_retired()
+    with pytest.raises(ValueError):
+        icon.open()
+
+
+def test_unchanged_packs_are_reused_across_remounts(tmp_path):
+    packs_dir = tmp_path / "packs"
+    packs_dir.mkdir()
+    write_pack(packs_dir / "a.zip", "a1")
+    library = DiscPackLibrary(packs_dir, tmp_path / "packs.json")
+    pack = library.mounted()[0]
+    
+    write_pack(packs_dir / "b.zip", "b1")
+    assert library.reload_if_changed()
+    library.close_retired()
+    
+    assert library.mounted()[0] is pack
+    assert pack.icon("a1").open().read() == b"not really a png"
+
+
+def test_pack_discs_are_protected_and_icons_found_by_default_name(tmp_path):
+    path = tmp_path / "extra.zip"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("pack.json", json.dumps({"name": "Extra", "discs": [
+            {"id": "a1", "name": "A1"},
+            {"id": "b1", "name": "B1", "icon": "art/b.png"},
+            {"id": "c1", "name": "C1"},
+        ]}))
+        archive.writestr("icons/a1.png", b"a")
+        archive.writestr("art/b.png", b"b")
+    pack = DiscPack(path)
+    
+    assert pack.title == "Extra"
+    assert all(disc.protected for disc in pack.discs)
+    assert pack.icon("a1").open().read() == b"a"
+    assert pack.icon("b1").open().read() == b"b"
+    assert pack.icon("c1") is None
+    pack.close()
+
+
+def test_broken_packs_are_skipped(tmp_path):
+    packs_dir = tmp_path / "packs"
+    packs_dir.mkdir()
+    write_pack(packs_dir / "good.zip", "g1")
+    (packs_dir / "corrupt.zip").write_bytes(b"not a zip")
+    with zipfile.ZipFile(packs_dir / "no_manifest.zip", "w") as archive:
+        archive.writestr("readme.txt", "hello")
+    
+    library = DiscPackLibrary(packs_dir, tmp_path / "packs.json")
+    assert [pack.name for pack in library.mounted()] == ["good.zip"]
+    assert library.available() == ["corrupt.zip", "good.zip", "no_manifest.zip"]
@@ -0,0 +1,55 @@
+import json
+import threading
+import time
+
+import pytest
+
+from src.repositories import file_lock
+from src.repositories.file_lock import FileLock, atomic_write_json, file_stamp
+
+
+def test_atomic_write_returns_the_stamp_of_the_new_file(tmp_path):
+    path = tmp_path / "nested" / "data.json"
+    stamp = atomic_write_json(path, {"name": "Ünïcode"})
+    assert json.loads(path.read_text(encoding="utf-8")) == {"name": "Ünïcode"}
+    assert file_stamp(path) == stamp
+
+
+def test_replacing_a_file_changes_its_stamp(tmp_path):
+    path = tmp_path / "data.json"
+    first = atomic_write_json(path, {"a": 1})
+    assert atomic_write_json(path, {"a": 1}) != first
+    assert file_stamp(tmp_path / "missing.json") is None
+
+
+def test_failed_write_keeps_the_old_file_and_removes_the_temporary(tmp_path, monkeypatch):
+    path = tmp_path / "data.json"
+    atomic_write_json(path, {"a": 1})
+    
+    def interrupted(*args, **kwargs):
+        raise KeyboardInterrupt
+    monkeypatch.setattr(file_lock.os, "replace", interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        atomic_write_json(path, {"a": 2})
+    
+    assert json.loads(path.read_text(encoding="utf-8")) == {"a": 1}
+    assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
+
+
+def test_file_lock_excludes_other_holders(tmp_path):
+    path = tmp_path / "data.json"
+    events = []
+    
+    def hold(name):
+        with FileLock(path):
+            events.append(f"{name} in")
+            time.sleep(0.05)
+            events.append(f"{name} out")
+    
+    threads = [threading.Thread(target=hold, args=(name,)) for name in "ab"]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # Each holder leaves before the other enters
+    assert events[0][0] == events[1][0] and events[2][0] == events[3][0]
@@ -0,0 +1,136 @@
+import json
+
+from src.models.history import HistoryEvent, ProgressHistory
+from src.repositories import JsonCollectionRepository, JsonDiscRepository
+from src.repositories.binary_history_repository import RECORD, BinaryHistoryRepository
+from src.repositories.file_lock import atomic_write_json
+from src.services.collection_service import CollectionService
+
+
+WEEK = 100
+
+
+def event(timestamp, owned=True, ordinal=0):
+    return HistoryEvent(timestamp=timestamp, ordinal=ordinal, owned=owned)
+
+
+def make_repository(tmp_path):
+    return BinaryHistoryRepository(tmp_path / "history.bin", tmp_path / "history_ids.txt", bucket_seconds=WEEK)
+
+
+def test_windows_sum_whole_buckets():
+    history = ProgressHistory(bucket_seconds=WEEK)
+    history.apply_all([event(100), event(150), event(250, owned=False), event(420)])
+    assert history.gained_between(100, 200) == 2
+    assert history.lost_between(200, 300) == 1
+    assert history.gained_between(100, 500) == 3
+    assert history.gained_between(300, 400) == 0
+    assert history.gained_between(600, 700) == 0
+
+
+def test_out_of_order_events_land_in_their_own_bucket():
+    history = ProgressHistory(bucket_seconds=WEEK)
+    history.apply_all([event(300), event(500)])
+    history.apply(event(410))
+    history.apply(event(120, owned=False))
+    
+    assert history.gained_between(400, 500) == 1
+    assert history.gained_between(500, 600) == 1
+    assert history.lost_between(100, 200) == 1
+    assert history.gained_between(0, 1000) == 3
+    assert history.last_timestamp == 500
+
+
+def test_record_never_goes_back_in_time():
+    history = ProgressHistory(bucket_seconds=WEEK)
+    history.record("cat", True, 500)
+    assert history.record("13", True, 300).timestamp == 500
+
+
+def test_weekly_progress_covers_the_last_weeks():
+    history = ProgressHistory(bucket_seconds=WEEK)
+    history.apply_all([event(110), event(130, owned=False), event(310)])
+    weeks = history.weekly_progress(3, now=399)
+    assert [(week.week_start, week.gained, week.lost) for week in weeks] == [(100, 1, 1), (200, 0, 0), (300, 1, 0)]
+
+
+def test_adopt_ids_moves_unsaved_ids_after_stored_ones():
+    history = ProgressHistory(["cat"])
+    history.ordinal_for("13")
+    history.ordinal_for("pigstep")
+    moved = history.adopt_ids(1, ["blocks", "pigstep"])
+    assert history.disc_ids == ["cat", "blocks", "pigstep", "13"]
+    assert moved == {1: 3}
+
+
+def test_log_round_trips_and_drops_a_torn_record(tmp_path):
+    repository = make_repository(tmp_path)
+    history = repository.load()
+    repository.append(history, [history.record("cat", True, 150), history.record("13", True, 160)])
+    with open(tmp_path / "history.bin", "ab") as f:
+        f.write(b"\x01\x02\x03")
+    
+    loaded = make_repository(tmp_path).load()
+    assert loaded.disc_ids == ["cat", "13"]
+    assert loaded.gained_between(100, 200) == 2
+    
+    repository.append(history, [history.record("cat", False, 170)])
+    assert (tmp_path / "history.bin").stat().st_size == 3 * RECORD.size
+    assert make_repository(tmp_path).load().lost_between(100, 200) == 1
+
+
+def test_processes_sharing_a_log_agree_on_ordinals(tmp_path):
+    first, second = make_repository(tmp_path), make_repository(tmp_path)
+    first_history, second_history = first.load(), second.load()
+    
+    first.append(first_history, [first_history.record("cat", True, 150)])
+    # Assigned ordinal 0 too, before seeing the other process's ID
+    second.append(second_history, [second_history.record("13", True, 160)])
+    
+    assert second_history.disc_ids == ["cat", "13"]
+    assert second_history.gained_between(100, 200) == 2
+    logged = first.reload_if_changed(first_history)
+    assert [(first_history.disc_ids[e.ordinal], e.owned) for e in logged] == [("13", True)]
+    assert first_history.gained_between(100, 200) == 2
+    
+    fresh = make_repository(tmp_path).load()
+    assert fresh.disc_ids == ["cat", "13"]
+    assert fresh.gained_between(100, 200) == 2
+
+
+def test_reload_after_another_process_compacted_the_log(tmp_path):
+    first = make_repository(tmp_path)
+    history = first.load()
+    events = [history.record("cat", i % 2 == 0, 150) for i in range(4096)]
+    first.append(history, events)
+    
+    make_repository(tmp_path).load()  # Compacts: the toggles cancel out
+    assert (tmp_path / "history.bin").stat().st_size == 0
+    assert first.reload_if_changed(history) == []
+    assert history.gained_between(100, 200) == 0
+
+
+def test_sync_records_external_changes_once(tmp_path):
+    discs_path = tmp_path / "discs.json"
+    collection_path = tmp_path / "collection.json"
+    atomic_write_json(discs_path, {"discs": [{"id": d, "name": d} for d in ("cat", "13", "blocks")]})
+    
+    def open_service():
+        return CollectionService(
+            JsonDiscRepository(discs_path),
+            JsonCollectionRepository(collection_path),
+            make_repository(tmp_path)
+        )
+    
+    app, tool = open_service(), open_service()
+    tool.set_owned_many(["cat"], True)
+    tool.flush()
+    # Edited by hand, so nothing logged it
+    data = json.loads(collection_path.read_text(encoding="utf-8"))
+    data["entries"]["13"] = {"disc_id": "13", "owned": True}
+    atomic_write_json(collection_path, data)
+    
+    changes = app.sync_external_changes()
+    assert changes.owned == {"cat": True, "13": True}
+    weeks = app.get_weekly_progress(1)
+    assert weeks[-1].gained == 2
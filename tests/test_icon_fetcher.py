@@ -0,0 +1,125 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.services import icon_fetcher
+from src.services.icon_fetcher import INDEX_NAME, IconFetcher
+
+
+class IconHandler(BaseHTTPRequestHandler):
+    """Serves one icon with an ETag, plus a redirect to it."""
+    
+    protocol_version = "HTTP/1.1"
+    body = b"icon-v1"
+    etag = '"v1"'
+    requests = []
+    
+    def do_GET(self):
+        type(self).requests.append((self.path, self.headers.get("If-None-Match")))
+        if self.path == "/old.png":
+            self._reply(301, b"", {"Location": "/icon.png"})
+        elif self.path != "/icon.png":
+            self._reply(404, b"")
+        elif self.headers.get("If-None-Match") == self.etag:
+            self._reply(304, b"", {"ETag": self.etag})
+        else:
+            self._reply(200, self.body, {"ETag": self.etag, "Content-Type": "image/png"})
+    
+    def _reply(self, status, body, headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if status != 304:
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    IconHandler.body, IconHandler.etag, IconHandler.requests = b"icon-v1", '"v1"', []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), IconHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_download_is_cached_and_indexed_on_shutdown(server, tmp_path):
+    fetcher = IconFetcher(tmp_path)
+    result = fetcher.fetch(f"{server}/icon.png").result(timeout=5)
+    assert result.changed
+    assert result.path.read_bytes() == b"icon-v1"
+    assert fetcher.cached_path(f"{server}/icon.png") == result.path
+    # Written after a quiet period, not per download
+    assert not (tmp_path / INDEX_NAME).exists()
+    fetcher.shutdown()
+    assert (tmp_path / INDEX_NAME).exists()
+    
+    # A new session finds the download without network access
+    assert IconFetcher(tmp_path).cached_path(f"{server}/icon.png") == result.path
+
+
+def test_unchanged_icon_revalidates_with_304(server, tmp_path):
+    fetcher = IconFetcher(tmp_path)
+    first = fetcher.fetch(f"{server}/icon.png").result(timeout=5)
+    fetcher.shutdown()
+    
+    fetcher = IconFetcher(tmp_path)
+    second = fetcher.fetch(f"{server}/icon.png").result(timeout=5)
+    fetcher.shutdown()
+    assert not second.changed
+    assert second.path == first.path
+    assert IconHandler.requests[-1] == ("/icon.png", '"v1"')
+
+
+def test_changed_icon_gets_a_new_path(server, tmp_path):
+    fetcher = IconFetcher(tmp_path)
+    first = fetcher.fetch(f"{server}/icon.png").result(timeout=5)
+    fetcher.shutdown()
+    IconHandler.body, IconHandler.etag = b"icon-v2", '"v2"'
+    
+    fetcher = IconFetcher(tmp_path)
+    second = fetcher.fetch(f"{server}/icon.png").result(timeout=5)
+    fetcher.shutdown()
+    assert second.changed
+    assert second.path != first.path
+    assert second.path.read_bytes() == b"icon-v2"
+    assert not first.path.exists()
+
+
+def test_redirect_is_followed(server, tmp_path):
+    fetcher = IconFetcher(tmp_path)
+    result = fetcher.fetch(f"{server}/old.png").result(timeout=5)
+    fetcher.shutdown()
+    assert result.path.read_bytes() == b"icon-v1"
+    assert [path for path, _ in IconHandler.requests] == ["/old.png", "/icon.png"]
+
+
+def test_error_status_fails_the_future(server, tmp_path):
+    fetcher = IconFetcher(tmp_path)
+    with pytest.raises(OSError, match="HTTP 404"):
+        fetcher.fetch(f"{server}/missing.png").result(timeout=5)
+    fetcher.shutdown()
+
+
+def test_index_is_written_once_for_a_burst(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(icon_fetcher, "INDEX_SAVE_DELAY_S", 0.2)
+    writes = []
+    real_write = icon_fetcher.atomic_write_json
+    monkeypatch.setattr(icon_fetcher, "atomic_write_json", lambda path, data: writes.append(len(data)) or real_write(path, data))
+    
+    fetcher = IconFetcher(tmp_path)
+    for url in (f"{server}/icon.png", f"{server}/old.png"):
+        fetcher.fetch(url).result(timeout=5)
+    deadline = time.monotonic() + 5
+    while not writes and time.monotonic() < deadline:
+        time.sleep(0.05)
+    fetcher.shutdown()
+    assert writes == [2]
@@ -0,0 +1,41 @@
+from PIL import Image
+
+from src.services.icon_store import IconStore, ingest_icons
+
+
+def make_sources(tmp_path):
+    source = tmp_path / "icons"
+    source.mkdir()
+    Image.new("RGBA", (32, 32), (255, 0, 0, 255)).save(source / "cat.png")
+    # Same art, different encoding: stored once
+    Image.new("RGB", (64, 64), (255, 0, 0)).save(source / "13.png")
+    Image.new("RGBA", (32, 32), (0, 0, 255, 255)).save(source / "far.png")
+    (source / "broken.png").write_bytes(b"not an image")
+    return source
+
+
+def test_identical_art_is_stored_once(tmp_path):
+    source, store_dir = make_sources(tmp_path), tmp_path / "store"
+    report = ingest_icons(source, store_dir, workers=1)
+    assert report.processed == 3
+    assert report.unique_images == 2
+    assert [name for name, _ in report.failed] == ["broken.png"]
+    
+    store = IconStore(store_dir)
+    assert store.icon_path("cat") == store.icon_path("13") != store.icon_path("far")
+    assert store.icon_path("broken") is None
+    assert store.level_path(store.icon_path("cat"), 24).exists()
+
+
+def test_second_run_skips_unchanged_files_and_drops_unused_images(tmp_path):
+    source, store_dir = make_sources(tmp_path), tmp_path / "store"
+    ingest_icons(source, store_dir, workers=1)
+    store = IconStore(store_dir)
+    far = store.icon_path("far")
+    
+    (source / "far.png").unlink()
+    report = ingest_icons(source, store_dir, workers=1)
+    assert (report.processed, report.unchanged, report.removed) == (0, 2, 1)
+    assert not far.exists()
+    assert store.reload_if_changed()
+    assert store.icon_path("far") is None
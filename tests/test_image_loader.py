@@ -0,0 +1,68 @@
+import os
+
+from PIL import Image
+
+from src.services.image_loader import ImageLoader
+
+
+def make_loader(tmp_path):
+    icons = tmp_path / "icons"
+    icons.mkdir()
+    Image.new("RGBA", (16, 16), (255, 0, 0, 255)).save(icons / "good.png")
+    (icons / "broken.png").write_bytes(b"not an image")
+    return ImageLoader(icons, thumbnail_dir=tmp_path / "thumbnails")
+
+
+def test_build_false_never_builds_a_pyramid(tmp_path):
+    loader = make_loader(tmp_path)
+    source = loader.get_image_path("good")
+    assert loader.thumbnail(source, 48, build=False) is None
+    assert not (tmp_path / "thumbnails").exists()
+
+
+def test_requested_level_is_built_in_the_background(tmp_path):
+    loader = make_loader(tmp_path)
+    source = loader.get_image_path("good")
+    loader.request_thumbnail(source, 48).result(timeout=5)
+    assert loader.thumbnail(source, 48, build=False).size == (48, 48)
+    
+    # Every level was written, so a new session reads any size from disk
+    fresh = ImageLoader(tmp_path / "icons", thumbnail_dir=tmp_path / "thumbnails")
+    assert fresh.thumbnail(source, 24, build=False).size == (24, 24)
+    loader.close()
+
+
+def test_failed_icon_is_not_requested_again(tmp_path):
+    loader = make_loader(tmp_path)
+    source = loader.get_image_path("broken")
+    loader.request_thumbnail(source, 48).result(timeout=5)
+    assert loader.request_thumbnail(source, 48) is None
+    
+    loader.invalidate()
+    assert loader.request_thumbnail(source, 48) is not None
+    loader.close()
+
+
+def bump_mtime(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_rescan_picks_up_icons_added_and_removed(tmp_path):
+    loader = make_loader(tmp_path)
+    icons = tmp_path / "icons"
+    assert loader.get_image_path("new") is None
+    assert loader.rescan_if_changed() == set()
+    
+    Image.new("RGBA", (16, 16)).save(icons / "new.png")
+    # The scan is the only source, so the new file is unseen until a rescan
+    assert loader.get_image_path("new") is None
+    bump_mtime(icons)
+    assert loader.rescan_if_changed() == {"new"}
+    assert loader.get_image_path("new") == icons / "new.png"
+    
+    (icons / "good.png").unlink()
+    bump_mtime(icons)
+    assert loader.rescan_if_changed() == {"good"}
+    assert loader.get_image_path("good") is None
+    loader.close()
@@ -0,0 +1,101 @@
+import json
+import threading
+
+from src.repositories import file_lock
+from src.repositories.json_collection_repository import JsonCollectionRepository
+
+
+def stored(path):
+    entries = json.loads(path.read_text(encoding="utf-8"))["entries"]
+    return {disc_id: entry["owned"] for disc_id, entry in entries.items()}
+
+
+def test_processes_editing_different_discs_keep_both_edits(tmp_path):
+    path = tmp_path / "collection.json"
+    first, second = JsonCollectionRepository(path), JsonCollectionRepository(path)
+    mine, theirs = first.load(), second.load()
+    
+    mine.toggle_disc("cat")
+    first.save(mine)
+    first.flush()
+    theirs.toggle_disc("13")
+    second.save(theirs)
+    second.flush()
+    
+    assert stored(path) == {"cat": True, "13": True}
+    merged = first.reload_if_changed()
+    assert merged.is_owned("13") and merged.is_owned("cat")
+
+
+def test_reload_keeps_changes_not_written_yet(tmp_path):
+    path = tmp_path / "collection.json"
+    repository, other = JsonCollectionRepository(path), JsonCollectionRepository(path)
+    collection = repository.load()
+    collection.toggle_disc("cat")
+    repository.save(collection)
+    
+    external = other.load()
+    external.toggle_disc("13")
+    other.save(external)
+    other.flush()
+    
+    reloaded = repository.reload_if_changed()
+    assert reloaded.is_owned("cat") and reloaded.is_owned("13")
+
+
+def test_saves_from_many_threads_all_land(tmp_path):
+    path = tmp_path / "collection.json"
+    repository = JsonCollectionRepository(path)
+    collection = repository.load()
+    lock = threading.Lock()
+    
+    def save(disc_id):
+        with lock:
+            collection.toggle_disc(disc_id)
+            repository.save(collection)
+    
+    threads = [threading.Thread(target=save, args=(f"disc-{i}",)) for i in range(50)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    repository.flush()
+    assert stored(path) == {f"disc-{i}": True for i in range(50)}
+
+
+def test_failed_write_leaves_the_file_intact_and_is_retried(tmp_path, monkeypatch):
+    path = tmp_path / "collection.json"
+    repository = JsonCollectionRepository(path)
+    collection = repository.load()
+    collection.toggle_disc("cat")
+    repository.save(collection)
+    repository.flush()
+    before = path.read_bytes()
+    
+    def crash(*args, **kwargs):
+        raise OSError("disk full")
+    monkeypatch.setattr(file_lock.os, "fsync", crash)
+    collection.toggle_disc("13")
+    repository.save(collection)
+    repository.flush()
+    assert path.read_bytes() == before
+    assert [p.name for p in tmp_path.iterdir() if p.suffix == ".tmp"] == []
+    
+    monkeypatch.undo()
+    repository.flush()
+    assert stored(path) == {"cat": True, "13": True}
+
+
+def test_corrupt_file_is_replaced_from_the_last_good_copy(tmp_path):
+    path = tmp_path / "collection.json"
+    repository = JsonCollectionRepository(path)
+    collection = repository.load()
+    collection.toggle_disc("cat")
+    repository.save(collection)
+    repository.flush()
+    
+    path.write_text('{"entries": {"cat": ', encoding="utf-8")
+    collection.toggle_disc("13")
+    repository.save(collection)
+    repository.flush()
+    assert stored(path) == {"cat": True, "13": True}
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from src.repositories import DiscPackLibrary, JsonDiscRepository, LayeredDiscRepository
+from src.repositories.file_lock import atomic_write_json
+from src.repositories.layered_disc_repository import move_custom_discs
+from src.repositories.packed_disc_repository import open_disc_repository
+
+
+def write_unsplit(path):
+    atomic_write_json(path, {"discs": [
+        {"id": "cat", "name": "Cat", "artist": "C418", "protected": True},
+        {"id": "mine", "name": "Mine", "artist": "Me", "protected": False},
+    ]})
+
+
+def ids(path):
+    return [entry["id"] for entry in json.loads(path.read_text(encoding="utf-8"))["discs"]]
+
+
+def test_custom_discs_move_to_the_overlay_once(tmp_path):
+    base, overlay = tmp_path / "discs.json", tmp_path / "custom_discs.json"
+    write_unsplit(base)
+    assert move_custom_discs(base, overlay) == 1
+    assert ids(base) == ["cat"]
+    assert ids(overlay) == ["mine"]
+    assert move_custom_discs(base, overlay) == 0
+
+
+def test_custom_discs_are_written_only_to_the_overlay(tmp_path):
+    base_path, overlay_path = tmp_path / "discs.json", tmp_path / "custom_discs.json"
+    atomic_write_json(base_path, {"discs": [{"id": "cat", "name": "Cat", "artist": "C418", "protected": True}]})
+    repository = LayeredDiscRepository(JsonDiscRepository(base_path), JsonDiscRepository(overlay_path))
+    before = base_path.read_bytes()
+    
+    repository.add_disc({"id": "mine", "name": "Mine", "artist": "Me"})
+    with pytest.raises(ValueError):
+        repository.add_disc({"id": "cat", "name": "Copy", "artist": "Me"})
+    assert not repository.delete_disc("cat")
+    assert [disc.id for disc in repository.get_all()] == ["cat", "mine"]
+    assert repository.custom_ids() == ["mine"]
+    assert base_path.read_bytes() == before
+    
+    assert repository.delete_disc("mine")
+    assert ids(overlay_path) == []
+
+
+def test_opening_without_migrating_leaves_the_catalog_alone(tmp_path):
+    write_unsplit(tmp_path / "discs.json")
+    packs = DiscPackLibrary(tmp_path / "packs", tmp_path / "packs.json")
+    
+    repository = open_disc_repository(tmp_path, packs, migrate=False)
+    assert repository.get_by_id("mine") is not None
+    assert not (tmp_path / "custom_discs.json").exists()
+    
+    repository = open_disc_repository(tmp_path, packs)
+    assert repository.custom_ids() == ["mine"]
+    assert ids(tmp_path / "discs.json") == ["cat"]
@@ -0,0 +1,40 @@
+from src.gui.layout import CARD_GAP, MAX_COLUMNS, MIN_CARD_WIDTH, compute_layout
+
+
+def test_columns_fit_the_viewport_without_crushing_cards():
+    layout = compute_layout(800)
+    assert layout.columns == 5
+    assert layout.card_width >= MIN_CARD_WIDTH
+    assert layout.gap + layout.columns * layout.pitch_x == 800
+
+
+def test_column_count_is_clamped():
+    assert compute_layout(50).columns == 1
+    assert compute_layout(100_000).columns == MAX_COLUMNS
+
+
+def test_scaling_applies_to_cards_and_gaps():
+    layout = compute_layout(800, scaling=2.0)
+    assert layout.columns == 2
+    assert layout.gap == CARD_GAP * 2
+    assert layout.card_height == 200
+
+
+def test_slot_geometry_round_trips():
+    layout = compute_layout(800)
+    for slot in range(20):
+        x, y = layout.slot_origin(slot)
+        assert layout.slot_at(x, y) == slot
+        assert layout.slot_at(x + layout.card_width - 1, y + layout.card_height - 1) == slot
+    # Gaps between and around cards belong to no slot
+    assert layout.slot_at(layout.gap - 1, layout.gap) is None
+    x, y = layout.slot_origin(0)
+    assert layout.slot_at(x + layout.card_width + 1, y) is None
+
+
+def test_visible_slots_cover_the_scrolled_rows():
+    layout = compute_layout(800)
+    assert layout.content_height(12) == layout.gap + 3 * layout.pitch_y
+    visible = layout.visible_slots(layout.pitch_y * 1.5, layout.pitch_y * 2.5, 12)
+    assert visible.start <= 5 and visible.stop == 12
+    assert list(layout.visible_slots(0, 10, 3)) == [0, 1, 2]
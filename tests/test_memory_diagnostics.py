@@ -0,0 +1,48 @@
+import sys
+import tracemalloc
+
+import pytest
+
+from src.models.disc import Disc
+from src.services.memory_diagnostics import MemoryDiagnostics, deep_sizeof, format_bytes
+
+
+@pytest.fixture
+def diagnostics():
+    was_tracing = tracemalloc.is_tracing()
+    yield MemoryDiagnostics()
+    if not was_tracing:
+        tracemalloc.stop()
+
+
+def test_deep_sizeof_counts_contents_once():
+    text = "x" * 1000
+    assert deep_sizeof([text, text]) == sys.getsizeof([text, text]) + sys.getsizeof(text)
+    assert deep_sizeof({"disc": Disc("cat", text, "C418")}) > sys.getsizeof(text)
+
+
+def test_deep_sizeof_handles_cycles():
+    items = []
+    items.append(items)
+    assert deep_sizeof(items) == sys.getsizeof(items)
+
+
+def test_format_bytes():
+    assert format_bytes(512) == "512 B"
+    assert format_bytes(1536) == "1.5 KB"
+    assert format_bytes(3 * 1024 ** 3) == "3.0 GB"
+
+
+def test_failing_probe_is_reported_not_raised(diagnostics):
+    diagnostics.register("ok", lambda: (2, 64, "fine"))
+    diagnostics.register("broken", lambda: 1 / 0)
+    usage = {item.name: item for item in diagnostics.collect()}
+    assert (usage["ok"].count, usage["ok"].bytes) == (2, 64)
+    assert usage["broken"].detail.startswith("probe failed")
+
+
+def test_first_report_is_a_baseline_and_later_ones_diff(diagnostics):
+    assert "Baseline snapshot taken" in diagnostics.report()
+    kept = [bytearray(1024) for _ in range(200)]
+    assert "Top allocation changes" in diagnostics.report()
+    del kept
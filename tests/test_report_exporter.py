@@ -0,0 +1,62 @@
+import csv
+import io
+
+from PIL import Image
+
+from src.repositories import JsonCollectionRepository, JsonDiscRepository
+from src.repositories.file_lock import atomic_write_json
+from src.services.collection_service import CollectionService
+from src.services.image_loader import ImageLoader
+from src.services.report_exporter import CSV, HTML, MARKDOWN, MISSING, OWNED, ReportExporter, ReportFilter
+
+
+def make_service(tmp_path):
+    atomic_write_json(tmp_path / "discs.json", {"discs": [
+        {"id": "cat", "name": "Cat", "artist": "C418", "how_to_obtain": "Dungeon chest, Creeper"},
+        {"id": "13", "name": "13", "artist": "C418", "how_to_obtain": "Dungeon chest"},
+        {"id": "pigstep", "name": "Pig*step", "artist": "Lena Raine", "how_to_obtain": "Bastion chest"},
+    ]})
+    service = CollectionService(JsonDiscRepository(tmp_path / "discs.json"), JsonCollectionRepository(tmp_path / "c.json"))
+    service.set_owned_many(["cat"], True)
+    return service
+
+
+def export(service, fmt, report_filter=ReportFilter(), **kwargs):
+    out = io.StringIO()
+    count = ReportExporter(service, kwargs.pop("image_loader", None)).export(out, fmt, report_filter, **kwargs)
+    return count, out.getvalue()
+
+
+def test_csv_lists_every_disc_with_its_status(tmp_path):
+    count, text = export(make_service(tmp_path), CSV)
+    rows = list(csv.reader(io.StringIO(text)))
+    assert count == 3
+    assert rows[0] == ["id", "name", "artist", "how_to_obtain", "owned"]
+    assert rows[1] == ["cat", "Cat", "C418", "Dungeon chest, Creeper", "yes"]
+
+
+def test_filters_by_status_artist_and_source(tmp_path):
+    service = make_service(tmp_path)
+    assert export(service, CSV, ReportFilter(status=OWNED))[0] == 1
+    assert export(service, CSV, ReportFilter(status=MISSING, artist="c418"))[0] == 1
+    assert export(service, CSV, ReportFilter(source="creeper"))[0] == 1
+
+
+def test_markdown_is_a_task_list_with_escaped_names(tmp_path):
+    _, text = export(make_service(tmp_path), MARKDOWN, title="My_discs")
+    assert text.startswith("# My\\_discs\n")
+    assert "- [x] **Cat** — C418 · Dungeon chest, Creeper\n" in text
+    assert "- [ ] **Pig\\*step**" in text
+    assert text.endswith("1 of 3 discs owned.\n")
+
+
+def test_html_inlines_thumbnails(tmp_path):
+    icons = tmp_path / "icons"
+    icons.mkdir()
+    Image.new("RGBA", (16, 16), (255, 0, 0, 255)).save(icons / "cat.png")
+    loader = ImageLoader(icons, thumbnail_dir=tmp_path / "thumbnails")
+    
+    _, text = export(make_service(tmp_path), HTML, thumbnail_size=24, image_loader=loader)
+    assert text.count("data:image/png;base64,") == 1
+    assert "<td>Pig*step</td>" in text
+    loader.close()
@@ -0,0 +1,39 @@
+from src.gui.search_cache import SearchCache
+
+
+def make_cache(max_queries=32):
+    cache = SearchCache(max_queries)
+    cache.reset([("cat", "Cat C418"), ("13", "13 C418"), ("pigstep", "Pigstep Lena Raine")])
+    return cache
+
+
+def test_empty_query_is_every_item_in_order():
+    assert make_cache().get("") == ["cat", "13", "pigstep"]
+
+
+def test_refined_query_filters_the_smallest_cached_superset():
+    cache = make_cache()
+    cache.store("c4", cache.matches("c4", cache.candidates("c4")))
+    assert cache.get("c4") == ["cat", "13"]
+    # "c41" contains "c4", so only its two results are checked
+    assert cache.candidates("c41") == ["cat", "13"]
+    assert cache.matches("c41", cache.candidates("c41")) == ["cat", "13"]
+    assert cache.candidates("lena") == ["cat", "13", "pigstep"]
+
+
+def test_least_recently_used_query_is_evicted():
+    cache = make_cache(max_queries=2)
+    cache.store("a", ["cat"])
+    cache.store("b", ["13"])
+    cache.get("a")
+    cache.store("c", ["pigstep"])
+    assert cache.get("a") == ["cat"]
+    assert cache.get("b") is None
+
+
+def test_reset_drops_cached_results():
+    cache = make_cache()
+    cache.store("cat", ["cat"])
+    cache.reset([("otherside", "Otherside Lena Raine")])
+    assert cache.get("cat") is None
+    assert cache.get("") == ["otherside"]
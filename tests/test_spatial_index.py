@@ -0,0 +1,29 @@
+from src.gui.spatial_index import SpatialIndex
+
+
+def test_hit_finds_the_rectangle_under_a_point():
+    index = SpatialIndex(bucket_size=50)
+    index.insert("a", 0, 0, 40, 40)
+    index.insert("b", 48, 0, 40, 40)
+    assert index.hit(10, 10) == "a"
+    assert index.hit(60, 39) == "b"
+    assert index.hit(44, 10) is None  # In the gap between cards
+    assert index.hit(10, 40) is None  # Right and bottom edges are exclusive
+
+
+def test_rectangles_spanning_buckets_are_found_from_each():
+    index = SpatialIndex(bucket_size=10)
+    index.insert("wide", 5, 5, 30, 30)
+    assert index.hit(6, 6) == "wide"
+    assert index.hit(34, 34) == "wide"
+    assert index.rect("wide") == (5, 5, 35, 35)
+
+
+def test_clear_can_change_the_bucket_size():
+    index = SpatialIndex(bucket_size=10)
+    index.insert("a", 0, 0, 10, 10)
+    index.clear(100)
+    assert len(index) == 0
+    assert index.hit(5, 5) is None
+    index.insert("b", 0, 0, 150, 150)
+    assert index.hit(140, 140) == "b"
@@ -0,0 +1,20 @@
+import os
+import sys
+
+from src.gui import stall_watchdog
+from src.gui.stall_watchdog import _describe_callback
+
+
+def test_describes_the_innermost_frame_outside_the_event_loop():
+    description = _describe_callback(sys._getframe())
+    assert description.startswith("test_describes_the_innermost_frame_outside_the_event_loop (")
+    assert "test_stall_watchdog.py:" in description
+
+
+def test_falls_back_to_the_absolute_path_across_drives(monkeypatch):
+    def relpath(path, start=None):
+        raise ValueError("path is on mount 'D:', start on mount 'C:'")
+    monkeypatch.setattr(stall_watchdog.os.path, "relpath", relpath)
+    
+    description = _describe_callback(sys._getframe())
+    assert os.path.abspath(__file__) in description
@@ -0,0 +1,66 @@
+import json
+import zipfile
+
+from src.repositories.file_lock import atomic_write_json
+from src.tools import sync_collection
+
+
+def write_pack(path, *discs):
+    with zipfile.ZipFile(path, "w") as pack:
+        pack.writestr("pack.json", json.dumps({"discs": list(discs)}))
+
+
+def make_data_dir(tmp_path):
+    data_dir = tmp_path / "data"
+    (data_dir / "packs").mkdir(parents=True)
+    atomic_write_json(data_dir / "discs.json", {"discs": [
+        {"id": "cat", "name": "Cat", "artist": "C418", "protected": True},
+        {"id": "mine", "name": "Mine", "artist": "Me", "protected": False},
+    ]})
+    write_pack(data_dir / "packs" / "extra.zip", {"id": "otherside", "name": "Otherside"})
+    return data_dir
+
+
+def run(data_dir, *args):
+    return sync_collection.main(["--data-dir", str(data_dir), *args])
+
+
+def test_status_leaves_an_unsplit_catalog_alone(tmp_path, capsys):
+    data_dir = make_data_dir(tmp_path)
+    assert run(data_dir, "snapshot", str(tmp_path / "point.json")) == 0
+    # Taking the snapshot migrated; put the old layout back
+    (data_dir / "custom_discs.json").unlink()
+    atomic_write_json(data_dir / "discs.json", {"discs": [
+        {"id": "cat", "name": "Cat", "artist": "C418", "protected": True},
+        {"id": "mine", "name": "Mine", "artist": "Me", "protected": False},
+    ]})
+    capsys.readouterr()
+    
+    assert run(data_dir, "status", str(tmp_path / "point.json")) == 0
+    assert not (data_dir / "custom_discs.json").exists()
+
+
+def test_status_rehashes_pack_discs(tmp_path, capsys):
+    data_dir = make_data_dir(tmp_path)
+    run(data_dir, "snapshot", str(tmp_path / "point.json"))
+    write_pack(data_dir / "packs" / "extra.zip", {"id": "otherside", "name": "Otherside (remaster)"})
+    capsys.readouterr()
+    
+    assert run(data_dir, "status", str(tmp_path / "point.json")) == 0
+    assert capsys.readouterr().out.split() == ["otherside"]
+
+
+def test_import_skips_pack_discs(tmp_path, capsys):
+    data_dir = make_data_dir(tmp_path)
+    point = tmp_path / "point.json"
+    run(data_dir, "snapshot", str(point))
+    # The other machine disabled the pack, which reads as deleting its discs
+    remote_dir = make_data_dir(tmp_path / "remote")
+    (remote_dir / "packs" / "extra.zip").unlink()
+    delta = tmp_path / "delta.json"
+    run(remote_dir, "export", str(point), str(delta))
+    capsys.readouterr()
+    
+    assert run(data_dir, "import", str(delta)) == 0
+    assert "Skipped: otherside" in capsys.readouterr().out
+    assert (data_dir / "packs" / "extra.zip").exists()
@@ -0,0 +1,38 @@
+from PIL import Image
+
+from src.services.thumbnails import THUMBNAIL_SIZES, build_levels, thumbnail_level
+
+
+def test_thumbnail_level_picks_the_smallest_covering_size():
+    assert thumbnail_level(1) == 16
+    assert thumbnail_level(16) == 16
+    assert thumbnail_level(17) == 24
+    assert thumbnail_level(100) == 128
+    assert thumbnail_level(10_000) == THUMBNAIL_SIZES[-1]
+
+
+def test_every_level_is_built_square():
+    levels = build_levels(Image.new("RGBA", (300, 300), (10, 20, 30, 255)))
+    assert sorted(levels) == sorted(THUMBNAIL_SIZES)
+    for size, image in levels.items():
+        assert image.size == (size, size)
+
+
+def test_pixel_art_is_enlarged_without_blurring():
+    art = Image.new("RGBA", (16, 16), (0, 0, 0, 255))
+    art.putpixel((0, 0), (255, 0, 0, 255))
+    levels = build_levels(art)
+    
+    # Only the original two colours, with the red pixel scaled to a 16x16 block
+    top = levels[256]
+    assert {top.getpixel((x, y)) for x in range(256) for y in range(256)} == {(255, 0, 0, 255), (0, 0, 0, 255)}
+    assert top.getpixel((15, 15)) == (255, 0, 0, 255)
+    assert top.getpixel((16, 16)) == (0, 0, 0, 255)
+    assert levels[16].tobytes() == art.tobytes()
+
+
+def test_non_square_art_is_padded_not_stretched():
+    levels = build_levels(Image.new("RGBA", (256, 128), (255, 255, 255, 255)))
+    top = levels[256]
+    assert top.getpixel((128, 10))[3] == 0
+    assert top.getpixel((128, 128)) == (255, 255, 255, 255)